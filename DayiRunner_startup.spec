@@ -0,0 +1,51 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Açılış süresi için ayarlı paket profili (kiosk / sık yeniden başlatma).
+#  - onedir: one-file paket her açılışta kendini geçici bir klasöre açıyor; burada dosyalar yerinde durur
+#  - UPX kapalı: sıkıştırılmış DLL / .pyd dosyaları her açılışta yeniden açılmak zorunda kalıyordu
+#  - Oyunun kullanmadığı paketler dışarıda; pkg_resources (pygame.pkgdata çekiyor) tek başına ~130 ms
+#
+# Derleme:  python -m PyInstaller DayiRunner_startup.spec
+# Ölçüm:    python -m bench.startup --exe dist/DayiRunner/DayiRunner.exe
+import os
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[('assets', 'assets')] if os.path.isdir('assets') else [],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=['pkg_resources', 'setuptools', 'distutils', 'tkinter', 'lib2to3', 'pydoc', 'doctest', 'xmlrpc'],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='DayiRunner',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='DayiRunner',
+)
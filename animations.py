@@ -1,8 +1,10 @@
 # animations.py
 import math
 import random
-import copy
 import pygame
+from collections.abc import Mapping, Sequence
+from glow import GLOW_ATLAS
+from rng_streams import FX_RNG
 
 # ---------- AYARLAR ----------
 AFTERIMAGE_POOL_SIZE = 6
@@ -24,21 +26,21 @@ class ElectricParticle:
         self.x = x
         self.y = y
         self.color = color
-        self.size = random.uniform(2.0, 6.0)
-        self.life = random.uniform(0.45, 1.0)
+        self.size = FX_RNG.uniform(2.0, 6.0)
+        self.life = FX_RNG.uniform(0.45, 1.0)
         self.max_life = self.life
-        self.speed = random.uniform(20.0, 90.0)
-        self.angle = random.uniform(0, math.pi * 2)
+        self.speed = FX_RNG.uniform(20.0, 90.0)
+        self.angle = FX_RNG.uniform(0, math.pi * 2)
         self.arc_points = []
         self._generate_arc()
 
     def _generate_arc(self):
         self.arc_points = []
-        pts = random.randint(3, 6)
+        pts = FX_RNG.randint(3, 6)
         for _ in range(pts):
             self.arc_points.append({
-                'x': random.uniform(-18, 18),
-                'y': random.uniform(-8, 8)
+                'x': FX_RNG.uniform(-18, 18),
+                'y': FX_RNG.uniform(-8, 8)
             })
 
     def update(self, dt):
@@ -78,16 +80,16 @@ class ShockwaveLite:
         self.life -= dt * 0.9
         self.radius += self.speed * dt * 12.0
         self.thickness = max(1.0, self.thickness * (1.0 - 0.9 * dt))
-        if self.radius < self.max_radius * 0.85 and random.random() < 0.35:
-            angle = random.uniform(0, math.pi * 2)
+        if self.radius < self.max_radius * 0.85 and FX_RNG.random() < 0.35:
+            angle = FX_RNG.uniform(0, math.pi * 2)
             dist = self.radius
             self.particles.append({
                 'x': self.x + math.cos(angle) * dist,
                 'y': self.y + math.sin(angle) * dist,
-                'size': random.uniform(3, 7),
-                'life': random.uniform(0.4, 0.9),
-                'speed_x': math.cos(angle) * random.uniform(20, 60),
-                'speed_y': math.sin(angle) * random.uniform(20, 60),
+                'size': FX_RNG.uniform(3, 7),
+                'life': FX_RNG.uniform(0.4, 0.9),
+                'speed_x': math.cos(angle) * FX_RNG.uniform(20, 60),
+                'speed_y': math.sin(angle) * FX_RNG.uniform(20, 60),
             })
         for p in self.particles[:]:
             p['life'] -= dt
@@ -134,11 +136,100 @@ class ScreenShakeLite:
         if self.duration > 0 and self.intensity > 0:
             progress = clamp(self.time / self.duration, 0.0, 1.0)
             current_intensity = self.intensity * (1.0 - progress)
+            # Çizim tarafında çağrılır: global random (simülasyon akışını tüketmesin)
             angle = random.uniform(0, math.pi * 2)
             distance = random.uniform(0, current_intensity)
             return (math.cos(angle) * distance, math.sin(angle) * distance)
         return (0, 0)
 
+# ---------- ÇİZİM SNAPSHOT'I (KOPYASIZ) ----------
+# get_draw_params() eskiden her kare extra_effects'i deepcopy ediyordu.
+# Artık animator başına tek bir DrawParams nesnesi var; her çağrıda alanları yerinde güncellenir.
+# Efekt listeleri kopyalanmaz, salt-okunur görünümler (view) üzerinden canlı veriye bakılır.
+# Snapshot bir sonraki update()'e kadar geçerlidir; 'version' ile hangi kareye ait olduğu anlaşılır.
+
+class EffectListView(Sequence):
+    """Bir efekt listesine kopyasız, salt-okunur bakış"""
+    __slots__ = ('_effects', '_key')
+
+    def __init__(self, effects, key):
+        self._effects = effects
+        self._key = key
+
+    def __getitem__(self, index):
+        # Liste state değişiminde yenisiyle değiştiriliyor: her erişimde güncel olanı oku
+        return self._effects[self._key][index]
+
+    def __len__(self):
+        return len(self._effects[self._key])
+
+    def __iter__(self):
+        return iter(self._effects[self._key])
+
+    def __repr__(self):
+        return f"EffectListView({self._key!r}, {len(self)} items)"
+
+
+class EffectsView(Mapping):
+    """extra_effects sözlüğüne salt-okunur bakış; listeler EffectListView olarak döner"""
+    __slots__ = ('_effects', '_lists')
+
+    def __init__(self, effects):
+        self._effects = effects
+        self._lists = {key: EffectListView(effects, key) for key, value in effects.items() if isinstance(value, list)}
+
+    def __getitem__(self, key):
+        view = self._lists.get(key)
+        return view if view is not None else self._effects[key]
+
+    def __len__(self):
+        return len(self._effects)
+
+    def __iter__(self):
+        return iter(self._effects)
+
+
+class DrawParams:
+    """Renderer'ların okuduğu salt-okunur, versiyonlu animasyon snapshot'ı"""
+    __slots__ = ('squash', 'stretch', 'rotation', 'scale', 'color_pulse', 'frame_index',
+                 'animation_intensity', 'glow_intensity', 'shadow_size', 'energy_pulse',
+                 'extra_effects', 'screen_shake_offset', 'state', 'version')
+
+    def __init__(self, effects):
+        for name in self.__slots__:
+            object.__setattr__(self, name, None)
+        object.__setattr__(self, 'extra_effects', EffectsView(effects))
+        object.__setattr__(self, 'version', -1)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DrawParams salt-okunurdur")
+
+    def _refresh(self, animator):
+        # Sadece sahibi olan CharacterAnimator çağırır
+        set_ = object.__setattr__
+        set_(self, 'squash', animator.squash)
+        set_(self, 'stretch', animator.stretch)
+        set_(self, 'rotation', animator.rotation)
+        set_(self, 'scale', animator.scale * animator.pulse)
+        set_(self, 'color_pulse', animator.color_pulse)
+        set_(self, 'frame_index', animator.current_frame_index)
+        set_(self, 'animation_intensity', animator.animation_intensity)
+        set_(self, 'glow_intensity', animator.glow_intensity)
+        set_(self, 'shadow_size', animator.shadow_size)
+        set_(self, 'energy_pulse', animator.energy_pulse)
+        set_(self, 'state', animator.state)
+        set_(self, 'version', animator.version)
+
+    # Eski dict tabanlı API ile uyumluluk: params['squash'], params.get('rotation', 0)
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 # ---------- CHARACTER ANIMATOR ----------
 class CharacterAnimator:
     def __init__(self):
@@ -197,7 +288,12 @@ class CharacterAnimator:
         # afterimage pool
         self._afterimage_pool = [None] * AFTERIMAGE_POOL_SIZE
 
+        # draw snapshot (update() başına bir versiyon)
+        self.version = 0
+        self._draw_params = DrawParams(self.extra_effects)
+
     def update(self, dt, state, is_grounded, velocity_y, is_dashing=False, is_slamming=False):
+        self.version += 1
         self.time += dt
         self.last_state = self.state
 
@@ -317,15 +413,15 @@ class CharacterAnimator:
         self.pulse = damp(self.pulse, 1.0 + 0.03 * intensity, 6.0, dt)
         self.glow_intensity = damp(self.glow_intensity, 0.4 * intensity, 6.0, dt)
 
-        if random.random() < 0.30:
+        if FX_RNG.random() < 0.30:
             for i in range(len(self._afterimage_pool)):
                 if self._afterimage_pool[i] is None:
                     self._afterimage_pool[i] = {
                         'x': 0, 'y': 0,
-                        'scale': self.scale * (0.98 + random.uniform(-0.01, 0.01)),
-                        'rotation': self.rotation + random.uniform(-0.01, 0.01),
+                        'scale': self.scale * (0.98 + FX_RNG.uniform(-0.01, 0.01)),
+                        'rotation': self.rotation + FX_RNG.uniform(-0.01, 0.01),
                         'color': (140, 200, 255, 100),
-                        'life': 0.10 + random.uniform(-0.02, 0.02)
+                        'life': 0.10 + FX_RNG.uniform(-0.02, 0.02)
                     }
                     break
 
@@ -337,40 +433,40 @@ class CharacterAnimator:
 
         electric_cap = 6
         spawn_chance = 0.22
-        if random.random() < spawn_chance and len(self.extra_effects['electric_particles']) < electric_cap:
-            for _ in range(random.randint(1, 2)):
-                ex = ElectricParticle(random.uniform(-7, 7), random.uniform(-7, 7), (160, 230, 255))
-                ex.speed *= random.uniform(0.85, 1.2)
-                ex.life *= random.uniform(0.85, 1.0)
+        if FX_RNG.random() < spawn_chance and len(self.extra_effects['electric_particles']) < electric_cap:
+            for _ in range(FX_RNG.randint(1, 2)):
+                ex = ElectricParticle(FX_RNG.uniform(-7, 7), FX_RNG.uniform(-7, 7), (160, 230, 255))
+                ex.speed *= FX_RNG.uniform(0.85, 1.2)
+                ex.life *= FX_RNG.uniform(0.85, 1.0)
                 self.extra_effects['electric_particles'].append(ex)
 
-        if random.random() < 0.10 and len(self.extra_effects['impact_particles']) < (MAX_IMPACT_PARTICLES // 3):
-            burst_count = random.randint(1, 2)
+        if FX_RNG.random() < 0.10 and len(self.extra_effects['impact_particles']) < (MAX_IMPACT_PARTICLES // 3):
+            burst_count = FX_RNG.randint(1, 2)
             for _ in range(burst_count):
-                angle = random.uniform(-0.5, 0.5) + math.pi
-                speed = random.uniform(10, 20)
+                angle = FX_RNG.uniform(-0.5, 0.5) + math.pi
+                speed = FX_RNG.uniform(10, 20)
                 self.extra_effects['impact_particles'].append({
-                    'x': random.uniform(-4, 4),
-                    'y': random.uniform(-4, 4),
+                    'x': FX_RNG.uniform(-4, 4),
+                    'y': FX_RNG.uniform(-4, 4),
                     'vx': math.cos(angle) * speed,
                     'vy': math.sin(angle) * speed * -0.5,
-                    'size': random.uniform(2, 4),
-                    'life': random.uniform(0.16, 0.36),
+                    'size': FX_RNG.uniform(2, 4),
+                    'life': FX_RNG.uniform(0.16, 0.36),
                     'color': (160, 220, 255)
                 })
 
-        if random.random() < 0.05:
+        if FX_RNG.random() < 0.05:
             self.extra_effects['screen_shake'].shake(2.5 * intensity, 0.05)
 
-        if random.random() < 0.18 and len(self.extra_effects['dash_lines']) < 4:
-            angle = random.choice([random.uniform(-0.08, 0.08), random.uniform(math.pi-0.08, math.pi+0.08)])
+        if FX_RNG.random() < 0.18 and len(self.extra_effects['dash_lines']) < 4:
+            angle = FX_RNG.choice([FX_RNG.uniform(-0.08, 0.08), FX_RNG.uniform(math.pi-0.08, math.pi+0.08)])
             self.extra_effects['dash_lines'].append({
-                'x': random.uniform(-24, 24),
-                'y': random.uniform(-12, 12),
-                'length': random.uniform(80, 140),
-                'width': random.uniform(1, 2),
+                'x': FX_RNG.uniform(-24, 24),
+                'y': FX_RNG.uniform(-12, 12),
+                'length': FX_RNG.uniform(80, 140),
+                'width': FX_RNG.uniform(1, 2),
                 'angle': angle,
-                'life': 0.12 + random.uniform(-0.02, 0.02),
+                'life': 0.12 + FX_RNG.uniform(-0.02, 0.02),
                 'color': (200, 245, 255, 180)
             })
 
@@ -407,16 +503,16 @@ class CharacterAnimator:
             burst_count = 10 + int(5 * intensity)
             for _ in range(burst_count):
                 if len(self.extra_effects['impact_particles']) < (MAX_IMPACT_PARTICLES // 2):
-                    angle = random.uniform(0, math.pi * 2)
-                    speed = random.uniform(8, 26) * (0.8 + random.random() * 0.5)
+                    angle = FX_RNG.uniform(0, math.pi * 2)
+                    speed = FX_RNG.uniform(8, 26) * (0.8 + FX_RNG.random() * 0.5)
                     self.extra_effects['impact_particles'].append({
-                        'x': random.uniform(-12, 12),
-                        'y': 6 + random.uniform(-3, 3),
+                        'x': FX_RNG.uniform(-12, 12),
+                        'y': 6 + FX_RNG.uniform(-3, 3),
                         'vx': math.cos(angle) * speed,
                         'vy': -abs(math.sin(angle) * speed),
-                        'size': random.uniform(3, 6),
-                        'life': random.uniform(0.4, 0.9),
-                        'color': (255, random.randint(140, 200), 90)
+                        'size': FX_RNG.uniform(3, 6),
+                        'life': FX_RNG.uniform(0.4, 0.9),
+                        'color': (255, FX_RNG.randint(140, 200), 90)
                     })
 
         if 0.0 <= state_time < 0.12:
@@ -488,21 +584,13 @@ class CharacterAnimator:
             self.extra_effects['hit_pause'] = max(0.0, self.extra_effects['hit_pause'] - dt)
 
     def get_draw_params(self):
-        return {
-            'squash': self.squash,
-            'stretch': self.stretch,
-            'rotation': self.rotation,
-            'scale': self.scale * self.pulse,
-            'color_pulse': self.color_pulse,
-            'frame_index': self.current_frame_index,
-            'animation_intensity': self.animation_intensity,
-            'glow_intensity': self.glow_intensity,
-            'shadow_size': self.shadow_size,
-            'energy_pulse': self.energy_pulse,
-            'extra_effects': copy.deepcopy(self.extra_effects),
-            'screen_shake_offset': self.extra_effects['screen_shake'].get_offset(),
-            'state': self.state
-        }
+        """Kopyasız DrawParams snapshot'ı döner (aynı nesne, bir sonraki update()'e kadar geçerli)"""
+        params = self._draw_params
+        if params.version != self.version:
+            params._refresh(self)
+        # Sarsıntı ofseti rastgele: her çizimde yeniden örneklenir (eski davranış)
+        object.__setattr__(params, 'screen_shake_offset', self.extra_effects['screen_shake'].get_offset())
+        return params
 
     def get_modified_color(self, base_color):
         r, g, b = base_color
@@ -550,18 +638,18 @@ class TrailEffect:
         self.max_life = life
         self.alpha = 255
         self.glow_size = size * 2.5
-        self.rotation = random.uniform(0, math.pi * 2)
-        self.rotation_speed = random.uniform(-0.5, 0.5)
+        self.rotation = FX_RNG.uniform(0, math.pi * 2)
+        self.rotation_speed = FX_RNG.uniform(-0.5, 0.5)
         self.sparkles = []
-        for _ in range(random.randint(2, 5)):
-            angle = random.uniform(0, math.pi * 2)
-            dist = random.uniform(0.2, 1.0) * size
+        for _ in range(FX_RNG.randint(2, 5)):
+            angle = FX_RNG.uniform(0, math.pi * 2)
+            dist = FX_RNG.uniform(0.2, 1.0) * size
             self.sparkles.append({
                 'angle': angle,
                 'distance': dist,
-                'size': random.uniform(0.3, 0.6) * size,
-                'speed': random.uniform(0.8, 2.0),
-                'alpha': random.randint(120, 200)
+                'size': FX_RNG.uniform(0.3, 0.6) * size,
+                'speed': FX_RNG.uniform(0.8, 2.0),
+                'alpha': FX_RNG.randint(120, 200)
             })
 
     def update(self, camera_speed, dt=None):
@@ -586,16 +674,9 @@ class TrailEffect:
         
         center = (int(self.x), int(self.y))
         
-        # Glow
-        for i in range(3, 0, -1):
-            glow_size = int(self.glow_size * (i / 3.0))
-            glow_alpha = int(80 * life_ratio * (i / 3.0))
-            if glow_size > 0:
-                pygame.draw.circle(surface, (*self.color, glow_alpha), center, glow_size)
-        
-        # Main body
-        main_alpha = int(200 * life_ratio)
-        pygame.draw.circle(surface, (*self.color, main_alpha), center, int(max(1, self.size)))
+        # Glow + Main body (atlas'tan tek blit)
+        sprite, off = GLOW_ATLAS.trail(tuple(self.color), self.size, life_ratio)
+        dirty = surface.blit(sprite, (center[0] - off, center[1] - off))
         
         # Sparkles
         for sp in self.sparkles:
@@ -604,4 +685,5 @@ class TrailEffect:
             sx = center[0] + math.cos(angle) * dist
             sy = center[1] + math.sin(angle) * dist
             sparkle_alpha = int(sp['alpha'] * life_ratio)
-            pygame.draw.circle(surface, (255, 255, 255, sparkle_alpha), (int(sx), int(sy)), int(max(1, sp['size'])))
\ No newline at end of file
+            dirty = dirty.union(pygame.draw.circle(surface, (255, 255, 255, sparkle_alpha), (int(sx), int(sy)), int(max(1, sp['size']))))
+        return dirty
\ No newline at end of file
@@ -0,0 +1,49 @@
+import numpy as np
+
+# --- ALAN ETKİSİ (AoE) ÇÖZÜCÜSÜ ---
+# Slam dalgaları (halka) ve meteor dash (daire) eskiden her kaynak için her düşmana ayrı math.sqrt yapıyordu.
+# Burada aday düşmanların merkezleri NumPy dizilerine toplanır ve tüm kaynaklar
+# tek bir (kaynak x düşman) kare-mesafe matrisiyle test edilir. Her düşman en fazla bir kez,
+# onu yakalayan ilk kaynağa atanır (eski sıralı döngüdeki "ilk dalga öldürür" davranışı).
+
+
+class AoEResolver:
+    def resolve(self, enemies, rings=(), circles=()):
+        """Öldürülenleri [(kaynak_index, düşman), ...] olarak, kaynak ve sonra düşman sırasıyla döner.
+
+        rings:   (x, y, r) -> merkezi r - 40 < d < r + 20 halkasında olanlar (slam dalgası)
+        circles: (x, y, r) -> merkezi d < r içinde olanlar (meteor dash)
+        Kaynak indexleri önce halkalar, sonra daireler.
+        """
+        n = len(enemies)
+        if n == 0 or not (rings or circles):
+            return []
+
+        # Aday düşman merkezleri (x, y)
+        cx = np.fromiter([e.rect.centerx for e in enemies], np.float64, n)
+        cy = np.fromiter([e.rect.centery for e in enemies], np.float64, n)
+
+        # Kaynaklar: merkez ve [iç, dış) kare yarıçap sınırları. Daireler için iç sınır "yok" (-1).
+        src = np.array([(x, y, r - 40, r + 20) for x, y, r in rings] +
+                       [(x, y, -1.0, r) for x, y, r in circles], dtype=np.float64)
+        sx, sy, inner, outer = src[:, 0:1], src[:, 1:2], src[:, 2:3], src[:, 3:4]
+
+        dx = cx - sx
+        dy = cy - sy
+        d2 = dx * dx + dy * dy                                   # (kaynak, düşman)
+        inner_sq = np.where(inner >= 0, inner * inner, -1.0)     # r - 40 < 0 ise her mesafe iç sınırı geçer
+        hit = (d2 < outer * outer) & (d2 > inner_sq)
+
+        hit_any = hit.any(axis=0)
+        if not hit_any.any():
+            return []
+        idx = np.nonzero(hit_any)[0]
+        first = hit[:, idx].argmax(axis=0)
+        order = np.lexsort((idx, first))
+        return [(int(first[k]), enemies[int(idx[k])]) for k in order]
+
+    @staticmethod
+    def reach(rings=(), circles=()):
+        """Tüm kaynakları kapsayan x aralığı (aday düşman sorgusu için)"""
+        spans = [(x - r - 20, x + r + 20) for x, y, r in rings] + [(x - r, x + r) for x, y, r in circles]
+        return min(s[0] for s in spans), max(s[1] for s in spans)
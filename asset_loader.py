@@ -0,0 +1,108 @@
+import time
+
+# --- ASSET YÜKLEYİCİ ---
+# Sesler eskiden import/açılış sırasında senkron yükleniyordu, LOADING ekranı ise rastgele
+# zamanlayıcılarla sahte log basıyordu. Burada işler iki türdür:
+#   - submit():      iş parçacığı havuzunda koşar (ses dosyası çözme, NumPy ile sentez).
+#                    Havuz ilk pump()'ta başlar: ilk menü karesi iş parçacıklarıyla yarışmaz.
+#   - submit_main(): pygame yüzey/font işleri; SDL_ttf ve cache sözlükleri iş parçacığı güvenli değil,
+#                    bu yüzden ana döngüde pump() ile kare başına süre bütçesi içinde dilim dilim koşar.
+# Bitmiş havuz işlerinin on_done geri çağrısı da pump() içinde, ana iş parçacığında çalışır.
+# progress / logs gerçek tamamlanma durumunu yansıtır (LOADING ekranı bunları gösterir).
+
+ASSET_WORKERS = 4
+
+
+class AssetLoader:
+    def __init__(self, workers=ASSET_WORKERS):
+        self.workers = workers
+        self.pool = None
+        self.queued = []         # (etiket, func, on_done), havuz başlayınca gönderilir
+        self.pending = []        # (etiket, future, on_done)
+        self.main_jobs = []      # (etiket, func), sırayla
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.logs = []
+        self.started_at = None
+        self.finished_at = None
+
+    def submit(self, label, func, on_done=None):
+        """func arka plan iş parçacığında koşar; sonucu on_done(result) ile ana döngüye döner"""
+        self.queued.append((label, func, on_done))
+        self.total += 1
+
+    def submit_main(self, label, func):
+        """func ana iş parçacığında, pump() sırasında koşar"""
+        self.main_jobs.append((label, func))
+        self.total += 1
+
+    def pump(self, budget_ms=4.0):
+        """Biten havuz işlerini toplar, sonra bütçe dolana kadar ana iş parçacığı işlerini koşar"""
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+        if self.queued:
+            if self.pool is None:
+                # concurrent.futures import'u ilk karenin önünde durmasın (~7 ms)
+                from concurrent.futures import ThreadPoolExecutor
+                self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix='assets')
+            for label, func, on_done in self.queued:
+                self.pending.append((label, self.pool.submit(func), on_done))
+            self.queued.clear()
+
+        still = []
+        for label, future, on_done in self.pending:
+            if not future.done():
+                still.append((label, future, on_done))
+                continue
+            try:
+                result = future.result()
+                if on_done:
+                    on_done(result)
+                self._finish(label, True)
+            except Exception as exc:
+                self._finish(f"{label} ({exc.__class__.__name__})", False)
+        self.pending = still
+
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while self.main_jobs and time.perf_counter() < deadline:
+            label, func = self.main_jobs.pop(0)
+            try:
+                func()
+                self._finish(label, True)
+            except Exception as exc:
+                self._finish(f"{label} ({exc.__class__.__name__})", False)
+
+        if self.done and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+            if self.pool is not None:
+                self.pool.shutdown(wait=False)
+                self.pool = None
+
+    def finish(self):
+        """Her şey bitene kadar bekler (bench ve testler için senkron yol)"""
+        while not self.done:
+            self.pump(budget_ms=1000.0)
+            if self.pending and not self.main_jobs:
+                time.sleep(0.001)
+
+    def _finish(self, label, ok):
+        self.completed += 1
+        if not ok:
+            self.failed += 1
+        self.logs.append(f"{label}... {'OK' if ok else 'FAILED'}")
+
+    @property
+    def done(self):
+        return self.completed >= self.total
+
+    @property
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def elapsed_ms(self):
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000.0
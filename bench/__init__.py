@@ -0,0 +1,23 @@
+# --- PERFORMANS ÖLÇÜMLERİ ---
+# Her modül tek başına çalıştırılabilir:  python -m bench.<modul>
+# Ekran gerektirmeyen ölçümler için SDL dummy sürücüsü kullanılır.
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def time_per_call(func, repeat=100):
+    """func'u repeat kez çağırır, çağrı başına ortalama süreyi (ms) döner"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    for r in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(r, widths)))
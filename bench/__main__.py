@@ -0,0 +1,70 @@
+"""Senaryo tabanlı tam kare benchmark'ı.
+
+    python -m bench [--frames N] [--warmup N] [--scenario AD ...] [--out sonuc.json]
+
+Sonuçlar JSON olarak yazılır; farklı commit'lerdeki koşular karşılaştırılabilir.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+
+import pygame
+
+from bench import print_table
+from bench.scenarios import SCENARIOS, PHASES, run_scenario
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Infinite Runner frame pipeline benchmark")
+    parser.add_argument('--frames', type=int, default=600, help="ölçülen kare sayısı (senaryo başına)")
+    parser.add_argument('--warmup', type=int, default=60, help="ölçülmeyen ısınma karesi")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--scenario', nargs='*', help="sadece bu senaryoları koştur")
+    parser.add_argument('--out', default='bench_results.json')
+    args = parser.parse_args()
+
+    import main as game
+    game.init_display()
+
+    selected = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    results = {}
+    rows = []
+    for scenario in selected:
+        result = run_scenario(game, scenario, args.frames, args.warmup, args.seed)
+        results[scenario.name] = result
+        rows.append((scenario.name,
+                     *(f"{result[phase]['mean']:.2f}" for phase in PHASES),
+                     f"{result['total']['p50']:.2f}", f"{result['total']['p95']:.2f}",
+                     f"{result['total']['p99']:.2f}", f"{result['present_bytes_per_frame']:.0f}"))
+
+    print_table(('scenario', *PHASES, 'p50', 'p95', 'p99', 'alloc B/frame'), rows)
+
+    report = {
+        'commit': git_revision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'frames': args.frames,
+        'warmup': args.warmup,
+        'seed': args.seed,
+        'unit': 'ms',
+        'scenarios': results,
+    }
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"-> {args.out}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
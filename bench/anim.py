@@ -0,0 +1,73 @@
+"""CharacterAnimator.get_draw_params'ın kare başı maliyeti: eski deepcopy'li dict vs kopyasız DrawParams.
+
+    python -m bench.anim
+"""
+import copy
+import random
+import time
+
+from bench import print_table
+from animations import CharacterAnimator
+
+DT = 1.0 / 60.0
+FRAMES = 600
+
+
+def legacy_draw_params(anim):
+    # Eski get_draw_params: her kare extra_effects'in derin kopyası
+    return {
+        'squash': anim.squash,
+        'stretch': anim.stretch,
+        'rotation': anim.rotation,
+        'scale': anim.scale * anim.pulse,
+        'color_pulse': anim.color_pulse,
+        'frame_index': anim.current_frame_index,
+        'animation_intensity': anim.animation_intensity,
+        'glow_intensity': anim.glow_intensity,
+        'shadow_size': anim.shadow_size,
+        'energy_pulse': anim.energy_pulse,
+        'extra_effects': copy.deepcopy(anim.extra_effects),
+        'screen_shake_offset': anim.extra_effects['screen_shake'].get_offset(),
+        'state': anim.state
+    }
+
+
+def state_flags(state, frame):
+    """(is_grounded, velocity_y, is_dashing, is_slamming) - slam her 30 karede yeniden tetiklenir"""
+    if state == 'dashing':
+        return True, 0.0, True, False
+    if state == 'slamming':
+        return False, 20.0, False, frame % 30 != 0
+    return True, 0.0, False, False
+
+
+def measure(state, getter):
+    """Her update'ten sonra sadece getter çağrısını zamanlar; kare başı ortalama (µs) ve ortalama efekt sayısı"""
+    random.seed(1)
+    anim = CharacterAnimator()
+    total = 0.0
+    effects = 0
+    clock = time.perf_counter
+    for frame in range(FRAMES):
+        grounded, vy, dashing, slamming = state_flags(state, frame)
+        anim.update(DT, 'running', grounded, vy, is_dashing=dashing, is_slamming=slamming)
+        start = clock()
+        getter(anim)
+        total += clock() - start
+        fx = anim.extra_effects
+        effects += (len(fx['electric_particles']) + len(fx['impact_particles']) + len(fx['shockwaves'])
+                    + len(fx['dash_lines']) + len(fx['afterimages']))
+    return total * 1e6 / FRAMES, effects / FRAMES
+
+
+def main():
+    rows = []
+    for state in ('running', 'dashing', 'slamming'):
+        legacy_us, load = measure(state, legacy_draw_params)
+        snapshot_us, _ = measure(state, CharacterAnimator.get_draw_params)
+        rows.append((state, f"{load:.1f}", f"{legacy_us:.1f}", f"{snapshot_us:.2f}", f"{legacy_us / snapshot_us:.0f}x"))
+    print_table(("state", "avg effects", "deepcopy µs/frame", "snapshot µs/frame", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
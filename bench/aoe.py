@@ -0,0 +1,79 @@
+"""Slam dalgası + meteor dash alan etkisi testinin maliyeti: kaynak başına sqrt döngüsü vs toplu AoEResolver.
+
+    python -m bench.aoe
+"""
+import math
+import random
+
+import pygame
+
+from bench import time_per_call, print_table
+from aoe import AoEResolver
+
+ENEMY_COUNTS = (20, 100, 500, 2000)
+WAVES = 3          # Aynı anda aktif slam dalgası
+REPEAT = 200
+
+
+class FakeEnemy:
+    __slots__ = ('rect',)
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 40, 40)
+
+
+def make_field(n, rng):
+    # Ekranın etrafındaki 2400 px'lik şeritte yoğun düşman alanı
+    return [FakeEnemy(rng.randint(-200, 2200), rng.choice((640, 790, 940, 990))) for _ in range(n)]
+
+
+def make_sources(rng):
+    rings = [(rng.uniform(200, 1700), 1030.0, rng.uniform(10, 250)) for _ in range(WAVES)]
+    circles = [(rng.randint(200, 1700), rng.randint(600, 1000), 120)]
+    return rings, circles
+
+
+def legacy_resolve(enemies, rings, circles):
+    # Eski game loop: her dalga için tüm düşmanlar, sonra meteor için tekrar tüm düşmanlar
+    killed = set()
+    kills = []
+    for s, (x, y, r) in enumerate(rings):
+        for e in enemies:
+            if e in killed:
+                continue
+            dist = math.sqrt((e.rect.centerx - x)**2 + (e.rect.centery - y)**2)
+            if dist < r + 20 and dist > r - 40:
+                killed.add(e)
+                kills.append((s, e))
+    for s, (x, y, r) in enumerate(circles, len(rings)):
+        for e in enemies:
+            if e not in killed and math.sqrt((e.rect.centerx - x)**2 + (e.rect.centery - y)**2) < r:
+                killed.add(e)
+                kills.append((s, e))
+    return kills
+
+
+def main():
+    rng = random.Random(1)
+    resolver = AoEResolver()
+    rows = []
+    for n in ENEMY_COUNTS:
+        enemies = make_field(n, rng)
+        cases = [make_sources(rng) for _ in range(REPEAT)]
+        kills = 0
+        for rings, circles in cases:
+            a = legacy_resolve(enemies, rings, circles)
+            b = resolver.resolve(enemies, rings, circles)
+            assert a == b
+            kills += len(b)
+        it = iter(cases * 3)
+        legacy_ms = time_per_call(lambda: legacy_resolve(enemies, *next(it)), REPEAT)
+        it = iter(cases * 3)
+        batched_ms = time_per_call(lambda: resolver.resolve(enemies, *next(it)), REPEAT)
+        rows.append((n, WAVES + 1, f"{kills / REPEAT:.1f}", f"{legacy_ms * 1000:.1f}", f"{batched_ms * 1000:.1f}",
+                     f"{legacy_ms / batched_ms:.1f}x"))
+    print_table(("enemies", "sources", "kills/frame", "loop µs", "batched µs", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
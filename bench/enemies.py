@@ -0,0 +1,90 @@
+"""CursedEnemy çizim yoğunluğu: her kare random + pygame.draw ile glitch (eski) vs GLITCH_FRAMES'ten tek blit.
+
+    python -m bench.enemies
+"""
+import math
+import random
+
+import pygame
+
+from bench import time_per_call, print_table
+from settings import *
+from glitch_frames import GLITCH_FRAMES, GLITCH_CYCLE, GLITCH_STRIDE, CORRUPTION_CHANCE, PAD, eye_level
+
+COUNTS = (50, 200, 500, 1000)
+FRAMES = 120
+
+
+class RngCounter(random.Random):
+    """Eski çizimin kare başına kaç rastgele sayı çektiğini sayar"""
+    calls = 0
+
+    def random(self):
+        RngCounter.calls += 1
+        return super().random()
+
+
+# --- ESKİ ÇİZİM KODU (glitch kareleri öncesi, referans) ---
+def legacy_draw(surface, rect, timer, rng):
+    jitter_x = rng.randint(-3, 3)
+    jitter_y = rng.randint(-3, 3)
+    draw_rect = pygame.Rect(rect.x + jitter_x, rect.y + jitter_y, rect.width, rect.height)
+    pygame.draw.rect(surface, CURSED_PURPLE, draw_rect)
+    for _ in range(3):
+        lx = rng.randint(draw_rect.left, draw_rect.right)
+        pygame.draw.line(surface, GLITCH_BLACK, (lx, draw_rect.top), (lx, draw_rect.bottom), 2)
+    eye_offset = math.sin(timer * 0.2) * 2
+    pygame.draw.rect(surface, CURSED_RED, (draw_rect.x + 8, draw_rect.y + 10 + eye_offset, 8, 8))
+    pygame.draw.rect(surface, CURSED_RED, (draw_rect.x + 24, draw_rect.y + 10 - eye_offset, 8, 8))
+    if rng.random() < 0.3:
+        px = draw_rect.x + rng.randint(-10, rect.width + 10)
+        py = draw_rect.y + rng.randint(-10, rect.height + 10)
+        pygame.draw.rect(surface, CURSED_PURPLE, (px, py, 4, 4))
+
+
+def cached_draw(surface, rect, timer, phase):
+    index = (timer * GLITCH_STRIDE + phase) % GLITCH_CYCLE
+    surface.blit(GLITCH_FRAMES.get(rect.width, rect.height, index, eye_level(timer)), (rect.x - PAD, rect.y - PAD))
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)).convert()
+
+    GLITCH_FRAMES.clear()
+    bake_ms = time_per_call(lambda: GLITCH_FRAMES.prewarm(((ENEMY_SIZE, ENEMY_SIZE),)), 1)
+    print(f"Bake: {GLITCH_CYCLE} glitch frames x 5 eye levels in {bake_ms:.1f} ms, "
+          f"{GLITCH_FRAMES.bytes_used / 1024:.0f} KB")
+
+    layout = random.Random(1)
+    rows = []
+    for count in COUNTS:
+        enemies = [(pygame.Rect(layout.randrange(0, LOGICAL_WIDTH - ENEMY_SIZE),
+                                layout.randrange(0, LOGICAL_HEIGHT - ENEMY_SIZE), ENEMY_SIZE, ENEMY_SIZE), i % GLITCH_CYCLE)
+                   for i in range(count)]
+        timer = [0]
+        rng = RngCounter(2)
+
+        def legacy():
+            timer[0] += 1
+            for rect, _ in enemies:
+                legacy_draw(canvas, rect, timer[0], rng)
+
+        def cached():
+            timer[0] += 1
+            for rect, phase in enemies:
+                cached_draw(canvas, rect, timer[0], phase)
+
+        RngCounter.calls = 0
+        legacy_ms = time_per_call(legacy, FRAMES)
+        rng_per_frame = RngCounter.calls / FRAMES
+        cached_ms = time_per_call(cached, FRAMES)
+        rows.append((count, f"{legacy_ms:.2f}", f"{(6 + CORRUPTION_CHANCE) * count:.0f}", f"{rng_per_frame:.0f}",
+                     f"{cached_ms:.2f}", count, f"{legacy_ms / cached_ms:.1f}x"))
+    print_table(("enemies", "legacy ms/frame", "draw calls", "rng calls", "glitch frames ms/frame", "blits",
+                 "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Ekran flash'ları: her ScreenFlash'ın kendi tam ekran SRCALPHA yüzeyi (eski) vs tek renk / alpha'ya
+indirgenip canvas'a bir kez uygulanan ortak flash geçişi. Öldürme zincirinde aynı anda canlı 1-8 flash.
+
+    python -m bench.flash
+
+blend_flashes eski yolun SRCALPHA katmandaki üst üste binme formülünü tamsayıyla tekrarlar; görünüm aynı
+kalmalı. Fark (yuvarlama) FLASH_TOLERANCE'ı aşarsa bench hata verir.
+"""
+import random
+
+import numpy as np
+import pygame
+
+from bench import time_per_call, print_table
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, CURSED_PURPLE, PLAYER_SLAM
+from vfx import ScreenFlash, blend_flashes
+from vfx_layer import VfxLayer, FLASH_ROWS
+
+SIZE = (LOGICAL_WIDTH, LOGICAL_HEIGHT)
+COUNTS = (1, 2, 4, 8)
+FRAMES = 60
+COLORS = (CURSED_PURPLE, PLAYER_SLAM, (255, 255, 200))
+FLASH_TOLERANCE = 2   # Eski yola göre izin verilen en büyük kanal farkı, her canlı flash sayısında
+
+
+# --- ESKİ FLASH (ortak geçiş öncesi, referans) ---
+class LegacyFlash:
+    def __init__(self, color, alpha):
+        self.color = color
+        self.alpha = alpha
+
+    def draw(self, surface):
+        if not hasattr(self, 'flash_surf'):
+            self.flash_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        self.flash_surf.fill((*self.color, self.alpha))
+        surface.blit(self.flash_surf, (0, 0))
+
+
+def legacy_frame(canvas, layer, flashes):
+    # Flash katmanın tamamını kirletir: temizle, flash'ları bas, katmanı tam ekran birleştir
+    layer.fill((0, 0, 0, 0))
+    for flash in flashes:
+        flash.draw(layer)
+    canvas.blit(layer, (0, 0))
+
+
+def shared_frame(canvas, vfx_layer, flashes):
+    # Efekt yokken katman birleştirmesi bedava; flash'lar tek değer, tek geçiş
+    vfx_layer.begin()
+    vfx_layer.composite(canvas, (0, 0), blend_flashes(flashes))
+
+
+def make_flashes(count, rng):
+    flashes = []
+    for i in range(count):
+        flash = ScreenFlash(COLORS[i % len(COLORS)], rng.randint(30, 120), 4)
+        flash.update(0)
+        flashes.append(flash)
+    return flashes
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    canvas = pygame.Surface(SIZE).convert()
+    background = canvas.copy()
+    pixels = np.random.default_rng(1).integers(0, 256, (SIZE[0], SIZE[1], 3), dtype=np.uint8)
+    pygame.surfarray.blit_array(background, pixels)
+    layer = pygame.Surface(SIZE, pygame.SRCALPHA)
+    vfx_layer = VfxLayer(SIZE)
+    rng = random.Random(1)
+
+    rows = []
+    for count in COUNTS:
+        flashes = make_flashes(count, rng)
+        legacy = [LegacyFlash(f.color, f.alpha) for f in flashes]
+
+        def run_legacy():
+            canvas.blit(background, (0, 0))
+            legacy_frame(canvas, layer, legacy)
+
+        def run_shared():
+            canvas.blit(background, (0, 0))
+            shared_frame(canvas, vfx_layer, flashes)
+
+        legacy_ms = time_per_call(run_legacy, FRAMES)
+        expected = pygame.surfarray.array3d(canvas).astype(np.int16)
+        shared_ms = time_per_call(run_shared, FRAMES)
+        diff = np.abs(pygame.surfarray.array3d(canvas).astype(np.int16) - expected)
+        assert diff.max() <= FLASH_TOLERANCE, f"{count} flashes differ from the old path by {diff.max()} > {FLASH_TOLERANCE}"
+        flash_mb = sum(f.flash_surf.get_width() * f.flash_surf.get_height() * 4 for f in legacy) / 1024 / 1024
+        shared_kb = SIZE[0] * FLASH_ROWS * canvas.get_bytesize() / 1024
+        rows.append((count, f"{legacy_ms:.2f}", f"{flash_mb:.0f}", f"{shared_ms:.2f}", f"{shared_kb:.0f}",
+                     f"{legacy_ms / shared_ms:.1f}x", f"{diff.mean():.2f}", int(diff.max())))
+    print_table(("live flashes", "per-flash surfaces ms", "flash MB", "shared pass ms", "shared KB",
+                 "speed-up", "mean |diff|", "max |diff|"), rows)
+
+
+if __name__ == "__main__":
+    main()
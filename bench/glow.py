@@ -0,0 +1,179 @@
+"""Glow efektlerinin pygame.draw ile ve GLOW_ATLAS sprite'larıyla çizim maliyeti + görsel eşdeğerlik kontrolü.
+
+    python -m bench.glow
+
+Eşdeğerlik iki türlü ölçülür: tek efekt boş katmana (sprite'ın kendisi) ve OVERLAP efekt üst üste, katman
+oyundaki gibi koyu zemine basılmış halde. Eski çizim üst üste binen pikselin üzerine yazar; atlas sprite'ları da
+aynısını yapmalı (toplayan / karıştıran bir blit burada görünür fark üretir). Fark OVERLAP_TOLERANCE'ı aşarsa
+bench hata verir.
+"""
+import math
+import random
+
+import numpy as np
+import pygame
+
+from bench import time_per_call, print_table
+from glow import GLOW_ATLAS
+
+COUNT = 500
+FRAMES = 60
+COLORS = ((255, 150, 0), (0, 255, 255), (255, 0, 128), (180, 255, 50))
+TOLERANCE = 8  # Alpha nicelemesinin izin verilen en büyük kanal farkı
+OVERLAP = 6    # Üst üste binme kontrolünde bir kümedeki efekt sayısı
+CLUSTERS = 40
+SPREAD = 12    # Küme içi efektlerin merkezden en büyük uzaklığı (px)
+BACKGROUND = (10, 10, 30)
+OVERLAP_TOLERANCE = 6   # Üst üste binen efektlerde izin verilen en büyük görünür kanal farkı (alpha nicelemesi)
+
+
+# --- ESKİ ÇİZİM KODU (atlas öncesi, referans) ---
+def legacy_spark(surface, x, y, color, size, alpha):
+    r, g, b = color
+    center = (x, y)
+    glow_alpha = int(alpha * 0.15)
+    if glow_alpha > 5:
+        pygame.draw.circle(surface, (r, g, b, glow_alpha), center, int(size * 2.5))
+    mid_size = int(size * 1.5)
+    if mid_size > 0:
+        pygame.draw.circle(surface, (min(255, r + 100), min(255, g + 100), min(255, b + 50), int(alpha * 0.5)),
+                           center, mid_size)
+    if size > 0:
+        pygame.draw.circle(surface, (255, 255, 220, alpha), center, size)
+
+
+def legacy_trail(surface, x, y, color, size, life_ratio):
+    for i in range(3, 0, -1):
+        glow_size = int(size * 2.5 * (i / 3.0))
+        if glow_size > 0:
+            pygame.draw.circle(surface, (*color, int(80 * life_ratio * (i / 3.0))), (x, y), glow_size)
+    pygame.draw.circle(surface, (*color, int(200 * life_ratio)), (x, y), int(max(1, size)))
+
+
+def legacy_hologram(surface, x, y, color, radius, alpha):
+    # GhostTrail: her üçüncü satıra bir kiriş + çerçeve (bozuk piksel hariç)
+    for dy in range(-radius, radius, 3):
+        if abs(dy) >= radius:
+            continue
+        dx = int(math.sqrt(radius ** 2 - dy ** 2))
+        pygame.draw.line(surface, (*color, alpha), (x - dx, y + dy), (x + dx, y + dy), 1)
+    pygame.draw.circle(surface, (*color, alpha), (x, y), radius, 1)
+
+
+def atlas_blit(surface, x, y, getter, *args):
+    sprite, off = getter(*args)
+    surface.blit(sprite, (x - off, y - off))
+
+
+# --- İŞ YÜKLERİ ---
+def make_items(kind, rng):
+    items = []
+    for _ in range(COUNT):
+        x, y = rng.randint(0, 1919), rng.randint(0, 1079)
+        color = rng.choice(COLORS)
+        if kind == 'spark':
+            items.append((x, y, color, rng.randint(2, 8), rng.randint(0, 255)))
+        elif kind == 'hologram':
+            items.append((x, y, color, rng.randint(5, 15), rng.randint(0, 180)))
+        else:
+            items.append((x, y, color, rng.uniform(3.0, 9.0), rng.uniform(0.05, 1.0)))
+    return items
+
+
+WORKLOADS = (
+    ('spark', legacy_spark, GLOW_ATLAS.spark),
+    ('trail', legacy_trail, GLOW_ATLAS.trail),
+    ('hologram', legacy_hologram, GLOW_ATLAS.hologram),
+)
+
+
+def draw_legacy(surface, func, items):
+    for x, y, *args in items:
+        func(surface, x, y, *args)
+
+
+def draw_atlas(surface, getter, items):
+    for x, y, *args in items:
+        atlas_blit(surface, x, y, getter, *args)
+
+
+def pixel_diff(func, getter, items):
+    """Her efekti boş katmana iki yolla da çizip piksel farkını ölçer"""
+    a = pygame.Surface((1920, 1080), pygame.SRCALPHA)
+    b = pygame.Surface((1920, 1080), pygame.SRCALPHA)
+    max_diff = 0
+    total = 0.0
+    over = 0
+    touched = 0
+    for item in items:
+        a.fill((0, 0, 0, 0)); b.fill((0, 0, 0, 0))
+        draw_legacy(a, func, [item])
+        draw_atlas(b, getter, [item])
+        pa = np.dstack((pygame.surfarray.pixels3d(a), pygame.surfarray.pixels_alpha(a))).astype(np.int16)
+        pb = np.dstack((pygame.surfarray.pixels3d(b), pygame.surfarray.pixels_alpha(b))).astype(np.int16)
+        mask = (pa[..., 3] > 0) | (pb[..., 3] > 0)
+        d = np.abs(pa - pb)[mask]
+        if d.size:
+            max_diff = max(max_diff, int(d.max()))
+            total += float(d.sum())
+            over += int(np.count_nonzero(d.max(axis=1) > TOLERANCE))
+            touched += int(mask.sum())
+    mean = total / max(1, touched * 4)
+    return mean, max_diff, 100.0 * over / max(1, touched)
+
+
+def overlap_diff(func, getter, items, rng):
+    """OVERLAP'lık kümeleri iki yolla tek katmana çizer, katmanı zemine basıp görünen RGB farkını ölçer"""
+    frames = []
+    clusters = []
+    for _ in range(CLUSTERS):
+        cx, cy = rng.randint(100, 1819), rng.randint(100, 979)
+        for x, y, *args in rng.sample(items, OVERLAP):
+            clusters.append((cx + rng.randint(-SPREAD, SPREAD), cy + rng.randint(-SPREAD, SPREAD), *args))
+    for draw, arg in ((draw_legacy, func), (draw_atlas, getter)):
+        layer = pygame.Surface((1920, 1080), pygame.SRCALPHA)
+        draw(layer, arg, clusters)
+        canvas = pygame.Surface((1920, 1080))
+        canvas.fill(BACKGROUND)
+        canvas.blit(layer, (0, 0))
+        frames.append(pygame.surfarray.array3d(canvas).astype(np.int16))
+    d = np.abs(frames[0] - frames[1]).max(axis=2)
+    touched = np.any(frames[0] != BACKGROUND, axis=2) | np.any(frames[1] != BACKGROUND, axis=2)
+    d = d[touched]
+    return float(d.mean()), int(d.max()), 100.0 * np.count_nonzero(d > TOLERANCE) / max(1, d.size)
+
+
+def main():
+    pygame.init()
+    surface = pygame.Surface((1920, 1080), pygame.SRCALPHA)
+    rng = random.Random(1)
+    rows = []
+    check_rows = []
+    overlap_rows = []
+    for name, func, getter in WORKLOADS:
+        items = make_items(name, rng)
+        legacy_ms = time_per_call(lambda: draw_legacy(surface, func, items), FRAMES)
+        draw_atlas(surface, getter, items)  # Isınma: sprite'lar üretilsin
+        atlas_ms = time_per_call(lambda: draw_atlas(surface, getter, items), FRAMES)
+        rows.append((name, COUNT, f"{legacy_ms:.3f}", f"{atlas_ms:.3f}", f"{legacy_ms / atlas_ms:.1f}x"))
+
+        mean, max_diff, over = pixel_diff(func, getter, items[:100])
+        check_rows.append((name, f"{mean:.2f}", max_diff, f"{over:.2f}%"))
+        mean, max_diff, over = overlap_diff(func, getter, items, random.Random(2))
+        overlap_rows.append((name, OVERLAP, f"{mean:.2f}", max_diff, f"{over:.2f}%"))
+
+    print_table(("effect", "count", "draw ms/frame", "atlas ms/frame", "speed-up"), rows)
+    print()
+    print_table(("effect", "mean |diff|", "max |diff|", f"px > {TOLERANCE}"), check_rows)
+    print()
+    print("overlapping effects, layer composited onto the background (visible RGB):")
+    print_table(("effect", "per cluster", "mean |diff|", "max |diff|", f"px > {TOLERANCE}"), overlap_rows)
+    worst = max(row[3] for row in overlap_rows)
+    assert worst <= OVERLAP_TOLERANCE, f"overlapping glow differs from pygame.draw by {worst} > {OVERLAP_TOLERANCE}"
+    st = GLOW_ATLAS.stats()
+    print(f"\natlas: {st['entries']} sprites, {st['bytes'] / 1024:.0f} KB, hit rate {st['hit_rate'] * 100:.1f}%")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Kalite kademelerinin gerçek kare maliyeti ve QualityGovernor'ın zayıf bir makinede bütçeyi tutması.
+
+    python -m bench.governor [--frames N] [--slowdown X]
+
+1. Her kademe (HIGH / MEDIUM / LOW) için main.py hattı dash_spam ve 4K senaryolarında ölçülür.
+2. Ölçülen kare süreleri --slowdown katıyla "zayıf makine"ye çevrilir ve sakin koşu / yoğun dövüş /
+   sakin koşu fazlarından oluşan bir oturumda sabit HIGH, sabit LOW ve AUTO (governor) karşılaştırılır.
+"""
+import argparse
+import random
+
+from bench import print_table
+from bench.scenarios import Scenario, DenseEnemySession, run_scenario, idle_run, dash_spam, slam_chain
+from game_session import QUALITY_PRESETS
+from glow import GLOW_ATLAS
+from quality_governor import QualityGovernor, QUALITY_TIERS
+
+BUDGET_MS = 1000.0 / 60
+# (faz adı, senaryo, saniye): yoğun dövüş ortada
+PHASE_PLAN = (('calm', 'idle', 20), ('combat', 'combat', 40), ('calm', 'idle', 40))
+
+
+def measure_tier(game, tier, frames, warmup):
+    """tier sabitken senaryo başına run_scenario sonucu (ham kare süreleriyle)"""
+    game.game_settings['quality'] = tier
+    GLOW_ATLAS.set_layers(QUALITY_PRESETS[tier]['glow_layers'])
+    prepare = lambda session: session.set_quality(tier)
+    scenarios = {
+        'idle': Scenario('idle', idle_run, prepare=prepare),
+        'combat': Scenario('combat', slam_chain, session_cls=DenseEnemySession, prepare=prepare),
+        'dash_spam': Scenario('dash_spam', dash_spam, prepare=prepare),
+        'dash_spam_4k': Scenario('dash_spam_4k', dash_spam, res_index=0, prepare=prepare),
+    }
+    return {name: run_scenario(game, scenario, frames, warmup, seed=1, keep_samples=True)
+            for name, scenario in scenarios.items()}
+
+
+def simulate(costs, mode, slowdown, seed=1):
+    """Ölçülmüş kare sürelerinden yeniden örnekleyerek faz planını oynatır"""
+    rng = random.Random(seed)
+    governor = QualityGovernor()
+    tier = 'LOW' if mode == 'LOW' else 'HIGH'
+    frames = over = switches = 0
+    residency = {t: 0 for t in QUALITY_TIERS}
+    for _, scenario, seconds in PHASE_PLAN:
+        for _ in range(int(seconds * 60)):
+            ms = rng.choice(costs[tier][scenario]) * slowdown
+            frames += 1
+            over += ms > BUDGET_MS
+            residency[tier] += 1
+            if mode == 'AUTO':
+                new = governor.observe(ms, BUDGET_MS)
+                if new:
+                    tier = new
+                    switches += 1
+    return frames, over, switches, residency, list(governor.decisions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="quality tier cost + governor simulation")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--slowdown', type=float, default=None,
+                        help="zayıf makine çarpanı (varsayılan: HIGH sakin koşu p90'ı bütçenin %%80'i olacak şekilde)")
+    args = parser.parse_args()
+
+    import main as game
+    game.init_display()
+
+    rows = []
+    costs = {}
+    for tier in QUALITY_TIERS:
+        measured = measure_tier(game, tier, args.frames, args.warmup)
+        costs[tier] = {name: r['samples'] for name, r in measured.items()}
+        for name, r in measured.items():
+            rows.append((tier, name, f"{r['vfx_draw']['mean']:.2f}", f"{r['scaling']['mean']:.2f}",
+                         f"{r['total']['p50']:.2f}", f"{r['total']['p95']:.2f}"))
+    print("Per-tier frame cost (ms)")
+    print_table(("tier", "scenario", "vfx draw", "scaling", "p50", "p95"), rows)
+
+    slowdown = args.slowdown
+    if slowdown is None:
+        # Sakin koşuda HIGH rahat, yoğun dövüşte bütçe aşılıyor: governor'ın tam hedef aldığı makine
+        ordered = sorted(costs['HIGH']['idle'])
+        slowdown = BUDGET_MS * 0.8 / ordered[int(len(ordered) * 0.9)]
+    print()
+    print(f"Simulated weak machine: measured costs x{slowdown:.2f}, 60 FPS budget {BUDGET_MS:.1f} ms, "
+          f"phases {' / '.join(f'{n} {s}s' for n, _, s in PHASE_PLAN)}")
+    rows = []
+    log = []
+    for mode in ('HIGH', 'LOW', 'AUTO'):
+        frames, over, switches, residency, decisions = simulate(costs, mode, slowdown)
+        rows.append((mode, f"{100.0 * over / frames:.1f}%", switches,
+                     *(f"{100.0 * residency[t] / frames:.0f}%" for t in QUALITY_TIERS)))
+        if mode == 'AUTO':
+            log = decisions
+    print_table(("quality", "frames over budget", "tier switches", *(f"time {t}" for t in QUALITY_TIERS)), rows)
+    for line in log:
+        print("  " + line)
+
+
+if __name__ == "__main__":
+    main()
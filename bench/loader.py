@@ -0,0 +1,160 @@
+"""Açılış ve ilk oyun karelerinin maliyeti: senkron ses yükleme + soğuk cache'ler vs. AssetLoader.
+
+    first menu frame -> açılıştan ilk menü karesi ekrana basılana kadar geçen süre
+    main-thread load -> yükleme işlerinin ana iş parçacığında harcadığı toplam süre (kare bütçesinden yenen)
+    all assets ready -> açılıştan tüm asset'lerin hazır olmasına kadar geçen süre
+    first frames     -> dash spam'in ilk 60 karesi (çizim + HUD), cache'ler soğukken ve yükleyici bittikten sonra
+
+Her ölçüm iki asset setiyle yapılır: repodaki gibi hiç dosya yokken (hepsi yedek sentez) ve geçici bir
+klasöre yazılan gerçek dosyalarla. Müzik 120 sn, 22.05 kHz mono WAV'dır (.ogg adıyla; SDL_mixer biçimi
+başlıktan tanır): mixer formatına dönüştürülmesi gerekir, sıkıştırılmış bir parçanın çözülmesi gibi.
+
+    python -m bench.loader
+"""
+import contextlib
+import os
+import tempfile
+import time
+import wave
+
+import pygame
+
+from bench import print_table
+from synth import SAMPLE_RATE, tone
+from bench.scenarios import dash_spam
+from asset_loader import AssetLoader
+from glow import GLOW_ATLAS
+from text_cache import TEXT_CACHE
+from starfield import TILE_CACHE
+from glitch_frames import GLITCH_FRAMES
+from game_session import GameSession
+from ui_system import render_ui, invalidate_static_layers
+
+FIRST_FRAMES = 60
+ROUNDS = 5
+LEGACY_SOUNDS = (('jump', "assets/sfx/jump.wav"), ('dash', "assets/sfx/dash.wav"),
+                 ('slam', "assets/sfx/slam.wav"), ('explosion', "assets/sfx/explosion.wav"))
+
+
+MUSIC_MS = 120000
+
+
+def write_wav(path, samples, rate, channels):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, 'wb') as out:
+        out.setnchannels(channels)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        frames = samples.repeat(channels) if channels > 1 else samples
+        out.writeframes(frames.tobytes())
+
+
+@contextlib.contextmanager
+def asset_files():
+    """Geçici klasörde asset dosyaları oluşturur ve çalışma dizinini oraya taşır"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        for name, path in LEGACY_SOUNDS:
+            write_wav(os.path.join(root, path), tone(440, 200, wave='square'), SAMPLE_RATE, 2)
+        music = tone(55, MUSIC_MS, 0.3, wave='saw', envelope='flat')[::2]
+        write_wav(os.path.join(root, "assets/music/game_action_music.ogg"), music, SAMPLE_RATE // 2, 1)
+        os.chdir(root)
+        try:
+            yield
+        finally:
+            os.chdir(cwd)
+
+
+def cold_caches(game):
+    GLOW_ATLAS.clear()
+    TEXT_CACHE.clear()
+    TEXT_CACHE.fonts.clear()
+    TILE_CACHE.clear()
+    GLITCH_FRAMES.clear()
+    game.session.starfield.tiles = None
+    invalidate_static_layers()
+    game.SESSION_SOUNDS.clear()
+
+
+def menu_frame(game):
+    game.active_ui_elements = render_ui(game.game_canvas, 'MENU', game.make_ui_data(0), (0, 0))
+    game.present_canvas(game.game_canvas)
+    pygame.display.flip()
+
+
+def legacy_startup(game):
+    """Eski açılış: tüm sesler menüden önce ana iş parçacığında, cache'ler ilk kullanımda"""
+    cold_caches(game)
+    start = time.perf_counter()
+    for name, path in LEGACY_SOUNDS:
+        game.SESSION_SOUNDS[name] = game.load_sound_asset(path, lambda name=name: game.make_sound(name), 1.0)
+    game.load_sound_asset("assets/music/game_action_music.ogg", game.generate_ambient_fallback, 1.0)
+    load_ms = (time.perf_counter() - start) * 1000
+    menu_frame(game)
+    first_ms = (time.perf_counter() - start) * 1000
+    return first_ms, load_ms, load_ms
+
+
+def loader_startup(game):
+    """Yeni açılış: işler kuyruğa alınır, menü kareleri çizilirken karelerin sonunda pump() edilir"""
+    cold_caches(game)
+    start = time.perf_counter()
+    loader = AssetLoader()
+    game.queue_assets(loader)
+    menu_frame(game)
+    first_ms = (time.perf_counter() - start) * 1000
+    pump_ms = 0.0
+    while not loader.done:
+        t = time.perf_counter()
+        loader.pump(game.ASSET_PUMP_MENU_MS)
+        pump_ms += (time.perf_counter() - t) * 1000
+        menu_frame(game)
+    return first_ms, pump_ms, (time.perf_counter() - start) * 1000
+
+
+def first_frames(game):
+    """İlk FIRST_FRAMES oyun karesinin (ortalama, en kötü) çizim süresi, ms"""
+    session = GameSession()
+    times = []
+    for frame in range(FIRST_FRAMES):
+        session.step(dash_spam(frame, session), 1.0 / 60.0)
+        session.pop_events()
+        start = time.perf_counter()
+        game.render_frame(game.game_canvas, game.vfx_layer, session)
+        render_ui(game.game_canvas, 'PLAYING', game.make_ui_data(frame * 16), (0, 0))
+        times.append((time.perf_counter() - start) * 1000)
+    return sum(times) / len(times), max(times)
+
+
+def best(results):
+    return [min(col) for col in zip(*results)]
+
+
+def main():
+    import main as game
+    game.init_display()
+    game.init_audio()
+    game.session = GameSession()
+
+    rows = []
+    for assets, files in (('fallback synth', contextlib.nullcontext()), ('asset files', asset_files())):
+        with files:
+            old = best([legacy_startup(game) for _ in range(ROUNDS)])
+            new = best([loader_startup(game) for _ in range(ROUNDS)])
+        rows += [(assets, name, f"{a:.1f}", f"{b:.1f}")
+                 for name, a, b in zip(('first menu frame', 'main-thread load', 'all assets ready'), old, new)]
+
+    cold, warm = [], []
+    for _ in range(ROUNDS):
+        legacy_startup(game)
+        cold.append(first_frames(game))
+        loader_startup(game)
+        warm.append(first_frames(game))
+    for name, a, b in zip((f'first {FIRST_FRAMES} frames mean', f'first {FIRST_FRAMES} frames worst'),
+                          best(cold), best(warm)):
+        rows.append(('fallback synth', name, f"{a:.2f}", f"{b:.2f}"))
+    print_table(("assets", "", "old ms", "loader ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
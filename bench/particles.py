@@ -0,0 +1,49 @@
+"""Sprite tabanlı FlameSpark ile ParticleSystem update maliyetini karşılaştırır.
+
+    python -m bench.particles
+"""
+import math
+import random
+
+import pygame
+
+from bench import time_per_call, print_table
+from vfx import FlameSpark
+from particles import ParticleSystem
+
+COUNTS = (200, 2000, 20000)
+LONG_LIFE = 10 ** 6  # Ölçüm boyunca kimse ölmesin, nüfus sabit kalsın
+
+
+def build_sprites(n):
+    group = pygame.sprite.Group()
+    for _ in range(n):
+        group.add(FlameSpark(random.uniform(0, 1920), random.uniform(0, 1080),
+                             random.uniform(0, math.pi * 2), random.uniform(5, 15),
+                             (255, 150, 0), life=LONG_LIFE, size=6))
+    return group
+
+
+def build_particles(n):
+    system = ParticleSystem(n)
+    for _ in range(n):
+        system.spawn_flame_spark(random.uniform(0, 1920), random.uniform(0, 1080),
+                                 random.uniform(0, math.pi * 2), random.uniform(5, 15),
+                                 (255, 150, 0), life=LONG_LIFE, size=6)
+    return system
+
+
+def main():
+    rows = []
+    for n in COUNTS:
+        repeat = max(5, 20000 // n)
+        group = build_sprites(n)
+        system = build_particles(n)
+        sprite_ms = time_per_call(lambda: group.update(5.0), repeat)
+        array_ms = time_per_call(lambda: system.update(5.0), repeat)
+        rows.append((n, f"{sprite_ms:.3f}", f"{array_ms:.3f}", f"{sprite_ms / array_ms:.1f}x"))
+    print_table(("particles", "sprite ms/frame", "numpy ms/frame", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Platform çizimi: her kare pygame.draw (eski) vs PLATFORM_CACHE yüzeylerinden tek blit.
+
+    python -m bench.platforms
+
+1. Her tema için tüm genişliklerin cache'ten basılan hali eski çizimle piksel piksel karşılaştırılır.
+2. Ekranda / geniş lookahead penceresinde 12, 60 ve 240 platform için kare başı çizim maliyeti.
+3. Tema başına ön ısıtma süresi ve bellek, gerçek bir koşu boyunca cache isabet oranı.
+"""
+import random
+
+import numpy as np
+import pygame
+
+from bench import time_per_call, print_table
+from bench.session import scripted_input
+from settings import *
+from game_session import GameSession
+from platform_cache import PLATFORM_CACHE, PAD, draw_platform, platform_colors
+
+COUNTS = (12, 60, 240)
+FRAMES = 200
+RUN_STEPS = 3000
+
+
+def legacy_draw(surface, platforms, theme):
+    fill_c, border_c = platform_colors(theme)
+    for rect in platforms:
+        draw_platform(surface, rect, fill_c, border_c)
+
+
+def cached_draw(surface, platforms, theme):
+    for rect in platforms:
+        surface.blit(PLATFORM_CACHE.get(rect.width, rect.height, theme), (rect.x - PAD, rect.y - PAD))
+
+
+def equivalence(canvas, theme):
+    """Tüm genişlikler iki yolla çizilir; farklı piksel sayısı döner"""
+    rng = random.Random(1)
+    platforms = [pygame.Rect(rng.randrange(-50, LOGICAL_WIDTH - 250), rng.randrange(0, LOGICAL_HEIGHT - 50),
+                             w, PLATFORM_THICKNESS) for w in range(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH + 1)]
+    frames = []
+    for draw in (legacy_draw, cached_draw):
+        canvas.fill(theme["bg_color"])
+        draw(canvas, platforms, theme)
+        frames.append(pygame.surfarray.array3d(canvas))
+    return int(np.any(frames[0] != frames[1], axis=2).sum())
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)).convert()
+
+    rows = []
+    for theme in THEMES:
+        PLATFORM_CACHE.clear()
+        prewarm_ms = time_per_call(lambda: PLATFORM_CACHE.prewarm(theme, (PLATFORM_THICKNESS,)), 1)
+        rows.append((theme["name"], f"{prewarm_ms:.1f}", len(PLATFORM_CACHE.surfaces),
+                     f"{PLATFORM_CACHE.bytes_used / 1024 / 1024:.1f}", equivalence(canvas, theme)))
+    print_table(("theme", "prewarm ms", "variants", "MB", "differing pixels"), rows)
+    print()
+
+    theme = THEMES[0]
+    rng = random.Random(2)
+    rows = []
+    for count in COUNTS:
+        platforms = [pygame.Rect(rng.randrange(-100, LOGICAL_WIDTH), rng.choice(PLATFORM_HEIGHTS),
+                                 rng.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH), PLATFORM_THICKNESS)
+                     for _ in range(count)]
+        legacy_ms = time_per_call(lambda: legacy_draw(canvas, platforms, theme), FRAMES)
+        cached_ms = time_per_call(lambda: cached_draw(canvas, platforms, theme), FRAMES)
+        rows.append((count, 3 * count, f"{legacy_ms:.3f}", count, f"{cached_ms:.3f}", f"{legacy_ms / cached_ms:.1f}x"))
+    print_table(("platforms", "draw calls", "pygame.draw ms/frame", "blits", "cached ms/frame", "speed-up"), rows)
+    print()
+
+    # Gerçek koşu: init_game gibi tema seçilince ön ısıtma, sonra her adım Platform.draw
+    PLATFORM_CACHE.clear()
+    PLATFORM_CACHE.reset_stats()
+    session = GameSession()
+    PLATFORM_CACHE.prewarm(session.theme, (PLATFORM_THICKNESS,))
+    rng = random.Random(3)
+    runs = 1
+    for step in range(RUN_STEPS):
+        session.step(scripted_input(step, rng), 1.0 / 60.0)
+        session.pop_events()
+        for p in session.all_platforms:
+            p.draw(canvas, session.theme)
+        if session.game_over:
+            session.reset()
+            PLATFORM_CACHE.prewarm(session.theme, (PLATFORM_THICKNESS,))
+            runs += 1
+    st = PLATFORM_CACHE.stats()
+    print(f"{RUN_STEPS} steps, {runs} runs: hit rate {st['hit_rate'] * 100:.2f}% ({st['misses']} misses), "
+          f"{st['entries']} variants, {st['bytes'] / 1024 / 1024:.1f} / {st['max_bytes'] / 1024 / 1024:.0f} MB, "
+          f"{st['evictions']} evictions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Çözünürlük ölçekleyicisinin maliyeti: eski scale_canvas (her kare yeni Surface) vs Presenter (önceden ayrılmış hedefler).
+
+    python -m bench.present
+"""
+import pygame
+
+from bench import time_per_call, print_table
+from settings import *
+from presenter import Presenter
+
+FRAMES = 60
+
+
+def legacy_present(canvas, screen, target_res, allocated):
+    # Eski main.scale_canvas + screen.blit (fullscreen dalı)
+    if target_res != (LOGICAL_WIDTH, LOGICAL_HEIGHT):
+        scaled_small = pygame.transform.scale(canvas, target_res)
+        image = pygame.transform.scale(scaled_small, screen.get_size())
+        allocated[0] += scaled_small.get_width() * scaled_small.get_height() * scaled_small.get_bytesize()
+    else:
+        image = pygame.transform.scale(canvas, screen.get_size())
+    allocated[0] += image.get_width() * image.get_height() * image.get_bytesize()
+    screen.blit(image, (0, 0))
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    canvas.fill(DARK_BLUE)
+    presenter = Presenter()
+
+    rows = []
+    for res in AVAILABLE_RESOLUTIONS:
+        allocated = [0]
+        legacy_ms = time_per_call(lambda: legacy_present(canvas, screen, res, allocated), FRAMES)
+
+        presenter.present(canvas, screen, res)  # Isınma: ara yüzey bir kez ayrılır
+        warm_bytes = presenter.bytes_allocated_total
+        new_ms = time_per_call(lambda: presenter.present(canvas, screen, res), FRAMES)
+        steady_bytes = (presenter.bytes_allocated_total - warm_bytes) / FRAMES
+        rows.append((f"{res[0]}x{res[1]}", f"{legacy_ms:.3f}", f"{allocated[0] / FRAMES / 1e6:.1f} MB",
+                     f"{new_ms:.3f}", f"{steady_bytes:.0f} B", presenter.passes_last_frame,
+                     f"{legacy_ms / new_ms:.1f}x"))
+    print_table(("target", "legacy ms", "legacy alloc/frame", "presenter ms", "presenter alloc/frame",
+                 "scale passes", "speed-up"), rows)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Replay kaydı ve ekransız (headless) oynatma: dosya boyutu, kayıt maliyeti, oynatma hızı ve bit bit doğrulama.
+
+    python -m bench.replay                 # scripted bot koşularını kaydeder, geri yükler ve oynatır
+    python -m bench.replay kayit.drr       # main.py --record ile alınmış bir replay'i oynatır
+"""
+import random
+import sys
+import time
+
+from bench import print_table
+from bench.session import scripted_input
+from bench.scenarios import DenseEnemySession
+from game_session import GameSession
+from replay import Replay, ReplayRecorder, ReplayPlayer
+from sim_clock import SIM_HZ
+
+DT = 1.0 / SIM_HZ
+RUNS = 40          # Bot koşuları kısa (ortalama birkaç saniye): toplamda anlamlı bir süre için çok koşu
+MAX_STEPS = 20000
+SEED = 1234
+
+
+def record(session_cls, seed):
+    """scripted bot ile game over'a kadar bir koşu kaydeder"""
+    rng = random.Random(seed)
+    session = session_cls()
+    session.reset(seed)
+    recorder = ReplayRecorder(session.seed, session.quality)
+    start = time.perf_counter()
+    for step in range(MAX_STEPS):
+        inputs = scripted_input(step, rng)
+        session.step(inputs, DT)
+        recorder.record(inputs, session)
+        session.pop_events()
+        if session.game_over:
+            break
+    return recorder.finish(session), time.perf_counter() - start
+
+
+def play(replay, session_cls=GameSession):
+    player = ReplayPlayer(replay, session_cls())
+    start = time.perf_counter()
+    while player.step(DT):
+        player.session.pop_events()
+    return player, time.perf_counter() - start
+
+
+def report(name, session_cls, replays, record_s=None):
+    steps = file_bytes = 0
+    play_s = 0.0
+    failed = []
+    for replay in replays:
+        data = replay.to_bytes()
+        player, elapsed = play(Replay.from_bytes(data), session_cls)
+        steps += len(replay)
+        file_bytes += len(data)
+        play_s += elapsed
+        if player.mismatch is not None:
+            failed.append(f"seed {replay.seed}: {player.summary()}")
+    verify = "OK" if not failed else f"{len(failed)} DESYNC"
+    row = (name, len(replays), steps, f"{steps / SIM_HZ:.0f}", file_bytes, f"{8.0 * file_bytes / steps:.2f}",
+           f"{record_s * 1e6 / steps:.0f}" if record_s is not None else "-",
+           f"{steps / play_s:.0f}", f"{steps / play_s / SIM_HZ:.0f}x", verify)
+    return row, failed
+
+
+def main():
+    cases = []
+    if len(sys.argv) > 1:
+        cases.append((sys.argv[1], GameSession, [Replay.load(sys.argv[1])], None))
+    else:
+        for name, cls in (("bot", GameSession), ("bot_dense_enemies", DenseEnemySession)):
+            recorded = [record(cls, SEED + i) for i in range(RUNS)]
+            cases.append((name, cls, [r for r, _ in recorded], sum(t for _, t in recorded)))
+
+    rows = []
+    for name, cls, replays, record_s in cases:
+        row, failed = report(name, cls, replays, record_s)
+        rows.append(row)
+        for line in failed:
+            print("  " + line)
+    print_table(("replay", "runs", "steps", "seconds", "file bytes", "bits/step", "recorded step µs",
+                 "playback steps/s", "vs real time", "verify"), rows)
+
+
+if __name__ == "__main__":
+    main()
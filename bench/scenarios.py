@@ -0,0 +1,152 @@
+"""main.py'nin gerçek update + draw hattını hazır senaryolarla koşturur.
+
+Her kare şu fazlara bölünerek ölçülür:
+    simulation  -> GameSession.step
+    world_draw  -> arka plan, yıldızlar, platformlar, düşmanlar, oyuncu
+    vfx_draw    -> VFX katmanı temizleme + efektler + birleştirme
+    ui          -> render_ui (HUD)
+    scaling     -> çözünürlük ölçekleyici
+    present     -> ekrana blit + display.flip
+"""
+import random
+import time
+
+import pygame
+
+from settings import *
+from game_session import GameSession, FrameInput
+
+PHASES = ('simulation', 'world_draw', 'vfx_draw', 'ui', 'scaling', 'present')
+NATIVE_RES_INDEX = AVAILABLE_RESOLUTIONS.index((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+DT = 1.0 / 60.0
+
+
+class DenseEnemySession(GameSession):
+    """Her platforma birden çok düşman koyan, slam zinciri senaryosu için oturum"""
+    ENEMIES_PER_PLATFORM = 3
+
+    def add_new_platform(self, start_x=None):
+        super().add_new_platform(start_x)
+        newest = self.world.last_platform
+        for _ in range(self.ENEMIES_PER_PLATFORM):
+            self.spawn_enemy(newest)
+
+
+class Scenario:
+    def __init__(self, name, inputs, session_cls=GameSession, res_index=NATIVE_RES_INDEX, prepare=None):
+        self.name = name
+        self.inputs = inputs
+        self.session_cls = session_cls
+        self.res_index = res_index
+        self.prepare = prepare
+
+    def new_session(self):
+        session = self.session_cls()
+        if self.prepare:
+            self.prepare(session)
+        return session
+
+
+# --- GİRDİ SENARYOLARI ---
+def idle_run(frame, session):
+    # Sadece koşu: yerde kalmak için sağa bas, arada zıpla
+    return FrameInput(right=True, jump=frame % 45 == 0)
+
+def dash_spam(frame, session):
+    # Cooldown biter bitmez dash
+    return FrameInput(right=True, jump=frame % 30 == 0, dash=True)
+
+def slam_chain(frame, session):
+    # Zıpla -> havada slam -> inişte tekrar
+    phase = frame % 36
+    return FrameInput(right=True, jump=phase == 0, slam=phase == 10)
+
+def mixed_combat(frame, session):
+    phase = frame % 60
+    return FrameInput(right=True, jump=phase in (0, 30), slam=phase == 12, dash=phase == 40)
+
+def max_speed(session):
+    session.camera_speed = MAX_CAMERA_SPEED
+
+
+SCENARIOS = [
+    Scenario('idle_run', idle_run),
+    Scenario('dash_spam', dash_spam),
+    Scenario('slam_chain_dense_enemies', slam_chain, session_cls=DenseEnemySession),
+    Scenario('max_camera_speed', mixed_combat, prepare=max_speed),
+] + [
+    Scenario(f'res_{w}x{h}', mixed_combat, res_index=i)
+    for i, (w, h) in enumerate(AVAILABLE_RESOLUTIONS)
+]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+    }
+
+
+def run_scenario(game, scenario, frames, warmup, seed, keep_samples=False):
+    """Senaryoyu game (main modülü) üzerinden koşturur, faz başına ms özetini döner.
+    keep_samples: ham toplam kare süreleri de 'samples' altında döner"""
+    random.seed(seed)
+    game.game_settings['res_index'] = scenario.res_index
+    session = scenario.new_session()
+    game.session = session
+
+    canvas, vfx_layer = game.game_canvas, game.vfx_layer
+    samples = {phase: [] for phase in PHASES}
+    samples['total'] = []
+    game_overs = 0
+    present_bytes = 0
+    clock = time.perf_counter
+
+    for frame in range(warmup + frames):
+        if session.game_over:
+            # Yeniden başlatma ölçüme dahil değil
+            session.reset()
+            if scenario.prepare:
+                scenario.prepare(session)
+            game_overs += 1
+
+        inputs = scenario.inputs(frame, session)
+        t0 = clock()
+        session.step(inputs, DT)
+        session.pop_events()
+        t1 = clock()
+        anim_params, render_offset = game.get_render_params(session)
+        game.draw_world(canvas, session, anim_params, render_offset)
+        t2 = clock()
+        game.draw_vfx(canvas, vfx_layer, session, render_offset)
+        t3 = clock()
+        game.render_ui(canvas, 'PLAYING', game.make_ui_data(frame * 16), (0, 0))
+        t4 = clock()
+        game.present_canvas(canvas)
+        t5 = clock()
+        pygame.display.flip()
+        t6 = clock()
+
+        if frame >= warmup:
+            for phase, a, b in zip(PHASES, (t0, t1, t2, t3, t4, t5), (t1, t2, t3, t4, t5, t6)):
+                samples[phase].append((b - a) * 1000.0)
+            samples['total'].append((t6 - t0) * 1000.0)
+            present_bytes += game.presenter.bytes_allocated_last_frame
+
+    result = {phase: summarize(values) for phase, values in samples.items()}
+    result['game_overs'] = game_overs
+    result['present_bytes_per_frame'] = present_bytes / frames
+    result['resolution'] = list(AVAILABLE_RESOLUTIONS[scenario.res_index])
+    if keep_samples:
+        result['samples'] = samples['total']
+    return result
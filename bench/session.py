@@ -0,0 +1,46 @@
+"""GameSession'ı ekran ve clock olmadan, gerçek zamandan bağımsız simüle eder.
+
+    python -m bench.session [kare_sayisi]
+"""
+import random
+import sys
+import time
+
+from game_session import GameSession, FrameInput
+
+DT = 1.0 / 60.0
+
+
+def scripted_input(frame, rng):
+    """Sağa koşan, arada zıplayan / dash atan / slam yapan basit bir bot"""
+    return FrameInput(right=True,
+                      jump=frame % 40 == 0,
+                      slam=frame % 40 == 20 and rng.random() < 0.5,
+                      dash=frame % 90 == 45)
+
+
+def run(frames, seed=1):
+    random.seed(seed)
+    rng = random.Random(seed)
+    session = GameSession()
+    runs = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        session.step(scripted_input(frame, rng), DT)
+        session.pop_events()
+        if session.game_over:
+            session.reset()
+            runs += 1
+    elapsed = time.perf_counter() - start
+    return elapsed, runs, session
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    elapsed, runs, session = run(frames)
+    print(f"{frames} frames in {elapsed:.2f} s -> {frames / elapsed:.0f} frames/s headless "
+          f"({frames / elapsed / 60:.1f}x real time), {runs} game overs, high score {session.high_score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Arka plan yıldızları: eski Star nesneleri (adım başına float hesabı + kare başına iki draw.circle)
+vs önceden çizilmiş bant döşemeli Starfield (bant başına bir ofset + iki sarmalı blit).
+
+    python -m bench.starfield
+"""
+import random
+
+import pygame
+
+from bench import time_per_call, print_table
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, WHITE, STAR_COLOR
+from starfield import Starfield
+
+COUNTS = (120, 1200, 12000)
+SCROLL = 8.0      # Koşu hızında adım başına kamera kaydırması
+REPEAT = 200
+
+
+# --- ESKİ YILDIZ (Starfield öncesi, referans) ---
+class LegacyStar:
+    def __init__(self, rng):
+        self.rng = rng
+        self.x = rng.randrange(0, LOGICAL_WIDTH)
+        self.y = rng.randrange(0, LOGICAL_HEIGHT)
+        self.size = rng.randint(1, 3)
+        self.speed = rng.uniform(0.5, 1.5)
+
+    def update(self, camera_speed):
+        self.x -= self.speed * camera_speed / 3
+        if self.x < 0:
+            self.x = LOGICAL_WIDTH
+            self.y = self.rng.randrange(0, LOGICAL_HEIGHT)
+
+    def draw(self, surface, ox=0):
+        x = int(self.x + ox * self.speed / 3)
+        pygame.draw.circle(surface, WHITE, (x, int(self.y)), 1)
+        pygame.draw.circle(surface, STAR_COLOR, (x, int(self.y)), self.size, 1)
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)).convert()
+    rng = random.Random(1)
+
+    rows = []
+    for count in COUNTS:
+        stars = [LegacyStar(rng) for _ in range(count)]
+
+        def legacy_update():
+            for s in stars:
+                s.update(SCROLL)
+
+        def legacy_draw():
+            for s in stars:
+                s.draw(canvas, 3.0)
+
+        field = Starfield(count)
+        field.reset(rng)
+        build_ms = time_per_call(lambda: field.build(canvas), 1)
+        rows.append((count, "Star objects", f"{time_per_call(legacy_update, REPEAT) * 1000:.1f}",
+                     f"{time_per_call(legacy_draw, REPEAT):.3f}", 2 * count, "-", "-"))
+        rows.append((count, "Starfield", f"{time_per_call(lambda: field.update(SCROLL), REPEAT) * 1000:.1f}",
+                     f"{time_per_call(lambda: field.draw(canvas, 3.0), REPEAT):.3f}", 2 * len(field.bands),
+                     f"{build_ms:.1f}", f"{field.bytes_used / 1024 / 1024:.1f}"))
+    print_table(("stars", "background", "update µs/step", "draw ms/frame", "draw calls",
+                 "tile build ms", "tile MB"), rows)
+
+
+if __name__ == "__main__":
+    main()
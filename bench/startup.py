@@ -0,0 +1,83 @@
+"""Açılış ölçümü: süreç başlatmadan ilk menü karesine kadar geçen süre (kaynaktan ve paketlenmiş exe'den).
+
+Oyun --startup-report ile başlatılır; ilk kare ekrana basılınca zamanı kaydeder, asset'ler hazır olunca
+raporu yazıp kendiliğinden çıkar. Harness süreci kendisi başlattığı için yorumlayıcı açılışı ve
+(one-file paketlerde) arşiv açma maliyeti de "launch -> first frame" içine girer.
+
+    python -m bench.startup [--runs N] [--exe dist/DayiRunner/DayiRunner.exe] [--windowed]
+
+Varsayılan olarak SDL dummy sürücüleriyle (pencere açmadan) koşar; --windowed gerçek ekran/ses sürücüsünü kullanır.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench import print_table
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = ('launch -> first frame', '  process start (+ unpack)', '  imports', '  display init', '  first menu frame',
+          'deferred init', 'assets ready')
+
+
+def launch(cmd, cwd, env, timeout):
+    """Oyunu bir kez başlatır; (başlatma->ilk kare ms, rapor) döner"""
+    fd, report_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        start = time.time()
+        subprocess.run(cmd + ['--startup-report', report_path], cwd=cwd, env=env, timeout=timeout,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        with open(report_path) as f:
+            report = json.load(f)
+    finally:
+        os.remove(report_path)
+    return (report['first_frame_epoch'] - start) * 1000.0, report
+
+
+def phases(launch_ms, r):
+    """Rapor işaretlerini (STARTUP_T0'dan ms) faz sürelerine çevirir"""
+    return dict(zip(PHASES, (launch_ms,
+                             launch_ms - r['first_frame'],   # STARTUP_T0'dan önceki her şey
+                             r['main'],
+                             r['display'] - r['main'],
+                             r['first_frame'] - r['display'],
+                             r['deferred'] - r['first_frame'],
+                             r['assets_ready'] - r['first_frame'])))
+
+
+def measure(cmd, cwd, env, runs, timeout):
+    samples = [phases(*launch(cmd, cwd, env, timeout)) for _ in range(runs)]
+    return {phase: statistics.median(s[phase] for s in samples) for phase in PHASES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="launch-to-first-frame harness")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--exe', help="paketlenmiş oyun (PyInstaller çıktısı)")
+    parser.add_argument('--windowed', action='store_true', help="dummy SDL sürücüsü yerine gerçek pencere/ses")
+    parser.add_argument('--timeout', type=float, default=60.0)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if not args.windowed:
+        env['SDL_VIDEODRIVER'] = 'dummy'
+        env['SDL_AUDIODRIVER'] = 'dummy'
+
+    targets = [('source', [sys.executable, os.path.join(ROOT, 'main.py')], ROOT)]
+    if args.exe:
+        exe = os.path.abspath(args.exe)
+        targets.append(('bundle', [exe], os.path.dirname(exe)))
+
+    results = [(name, measure(cmd, cwd, env, args.runs, args.timeout)) for name, cmd, cwd in targets]
+    rows = [(phase, *(f"{columns[phase]:.1f}" for _, columns in results)) for phase in PHASES]
+    print(f"median of {args.runs} launches, ms (deferred / assets ready: after the first frame)")
+    print_table(("phase", *(name for name, _ in results)), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Açılışta üretilen yedek ses bankasının maliyeti: örnek başına struct.pack döngüsü vs. NumPy synth.
+
+Eksik asset'lerin (jump, dash, slam, explosion, ambient) tamamı açılışta sentezlenir.
+Eski döngüyle üretilen PCM baytlarının yeni yolla bire bir aynı olduğunu da doğrular.
+
+    python -m bench.synth
+"""
+import math
+import struct
+import time
+
+import pygame
+
+from bench import time_per_call, print_table
+from synth import SAMPLE_RATE, FALLBACK_PRESETS, WAVEFORMS, ENVELOPES, tone, to_sound, make_sound
+
+REPEAT = 5
+
+
+def legacy_buffer(freq, duration_ms, decay=1.0):
+    # Eski utils.generate_sound_effect (Sound'a çevirmeden önceki bayt tamponu)
+    num_samples = int(SAMPLE_RATE * duration_ms / 1000)
+    max_amp = 32767
+    buffer = bytearray()
+    for i in range(num_samples):
+        t = i / num_samples
+        sample = int(max_amp * (1 - t) * decay * math.sin(2 * math.pi * freq * i / SAMPLE_RATE))
+        buffer += struct.pack('<hh', sample, sample)
+    return buffer
+
+
+def legacy_sound(preset):
+    return pygame.mixer.Sound(buffer=legacy_buffer(**preset))
+
+
+def main():
+    pygame.mixer.init(SAMPLE_RATE, -16, 2, 512)
+
+    rows = []
+    legacy_total = new_total = 0.0
+    for name, preset in FALLBACK_PRESETS.items():
+        assert legacy_sound(preset).get_raw() == make_sound(name).get_raw(), name
+        legacy_ms = time_per_call(lambda: legacy_sound(preset), REPEAT)
+        new_ms = time_per_call(lambda: make_sound(name), REPEAT)
+        legacy_total += legacy_ms
+        new_total += new_ms
+        rows.append((name, preset['duration_ms'], f"{legacy_ms:.2f}", f"{new_ms:.3f}", f"{legacy_ms / new_ms:.0f}x"))
+    rows.append(('bank total', sum(p['duration_ms'] for p in FALLBACK_PRESETS.values()),
+                 f"{legacy_total:.2f}", f"{new_total:.3f}", f"{legacy_total / new_total:.0f}x"))
+    print_table(("effect", "ms audio", "loop ms", "numpy ms", "speed-up"), rows)
+    print()
+
+    # Yeni dalga / zarf seçenekleri: 300 ms'lik bir efektin üretim süresi
+    rows = []
+    for wave in WAVEFORMS:
+        for envelope in ENVELOPES:
+            ms = time_per_call(lambda: to_sound(tone(220, 300, wave=wave, envelope=envelope, freq_end=110)), REPEAT)
+            rows.append((wave, envelope, f"{ms:.3f}"))
+    print_table(("wave", "envelope", "ms / 300 ms sweep"), rows)
+
+    # Soğuk açılış: tüm bankayı bir kez üretmek (ilk çağrı, ısınma yok)
+    start = time.perf_counter()
+    for name in FALLBACK_PRESETS:
+        make_sound(name)
+    print(f"\ncold fallback bank: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""draw_text'in font/yüzey cache'i ile ve cache'siz (eski davranış) maliyeti.
+
+    python -m bench.text
+"""
+import pygame
+
+from bench import time_per_call, print_table
+from settings import *
+from text_cache import TEXT_CACHE
+from ui_system import render_ui
+
+FRAMES = 300
+
+
+def legacy_render(text, size, color):
+    # Eski draw_text: her çağrıda yeni Font + render
+    return pygame.font.Font(None, int(size * 1.5)).render(text, True, color)
+
+
+def make_workloads(surface):
+    settings_data = {'fullscreen': True, 'quality': 'HIGH', 'res_index': 1, 'fps_limit': 60}
+    frame = [0]
+
+    def ui(state):
+        def run():
+            frame[0] += 1
+            score = frame[0] * 7.3 if state == 'PLAYING' else 4242  # Skor sadece oyun içinde akar
+            data = {'theme': THEMES[0], 'score': score, 'high_score': 12000,
+                    'dash_cd': frame[0] % DASH_COOLDOWN, 'slam_cd': frame[0] % 120,
+                    'time_ms': frame[0] * 16, 'settings': settings_data,
+                    'progress': (frame[0] % 100) / 100.0, 'logs': ["Initializing Core Systems..."]}
+            render_ui(surface, state, data, (960, 380))
+        return run
+
+    return [('main menu', ui('MENU')), ('settings', ui('SETTINGS')), ('loading', ui('LOADING')),
+            ('HUD', ui('PLAYING')), ('game over', ui('GAME_OVER'))]
+
+
+def main():
+    pygame.init()
+    surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    cached_render = TEXT_CACHE.render
+    rows = []
+    for name, run in make_workloads(surface):
+        TEXT_CACHE.render = legacy_render
+        legacy_ms = time_per_call(run, FRAMES)
+        TEXT_CACHE.render = cached_render
+        TEXT_CACHE.clear(); TEXT_CACHE.reset_stats()
+        cached_ms = time_per_call(run, FRAMES)
+        st = TEXT_CACHE.stats()
+        rows.append((name, f"{legacy_ms:.3f}", f"{cached_ms:.3f}", f"{legacy_ms / cached_ms:.1f}x",
+                     f"{st['hit_rate'] * 100:.1f}%", f"{st['bytes'] / 1024:.0f} KB"))
+    print_table(("screen", "uncached ms/frame", "cached ms/frame", "speed-up", "hit rate", "cache size"), rows)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Sabit adımlı simülasyon vs. eski değişken dt: render FPS'i simülasyonu değiştiriyor mu?
+
+Aynı 20 saniyelik duvar saati süresini 30 / 60 / 144 / 240 FPS render hızlarıyla oynatır.
+Bot girdisi simülasyon adımı indeksine göre üretilir; eski yolda bir adım = bir render karesi.
+Sabit adımlı yolda saniye başına adım sayısı ve CHECK_STEP. adımdaki durum her FPS'te aynı olmalı.
+
+    python -m bench.timestep
+"""
+import hashlib
+import random
+import time
+
+from bench import print_table
+from bench.session import scripted_input
+from game_session import GameSession
+from settings import FPS_LIMITS
+from sim_clock import FixedStepClock
+
+SECONDS = 20
+STALL_AT = 10.0      # Bu saniyede tek bir 500 ms'lik takılma (yakalama sınırını test eder)
+STALL_MS = 500
+CHECK_STEP = 1000    # Durum özeti bu simülasyon adımından sonra alınır
+
+
+def frame_times(fps):
+    """get_ticks() gibi ms çözünürlüklü render karesi süreleri (sn)"""
+    frame_ms = round(1000 / fps)
+    out, t = [], 0
+    while t < SECONDS * 1000:
+        ms = frame_ms + (STALL_MS if t < STALL_AT * 1000 <= t + frame_ms else 0)
+        out.append(ms / 1000.0)
+        t += ms
+    return out
+
+
+def digest(session):
+    state = (round(session.score, 3), round(session.player_x, 3), round(session.player_y, 3),
+             len(session.all_platforms), len(session.all_enemies), session.frame_count)
+    return hashlib.md5(repr(state).encode()).hexdigest()[:10]
+
+
+def run(fps, fixed):
+    random.seed(1)
+    rng = random.Random(1)
+    session = GameSession()
+    clock = FixedStepClock()
+    steps = 0
+    sim_time = 0.0
+    state = None
+    for dt in frame_times(fps):
+        n = clock.advance(dt) if fixed else 1
+        step_dt = clock.step_dt if fixed else dt
+        for _ in range(n):
+            start = time.perf_counter()
+            session.step(scripted_input(steps, rng), step_dt)
+            sim_time += time.perf_counter() - start
+            session.pop_events()
+            if session.game_over:
+                session.reset()
+            steps += 1
+            if steps == CHECK_STEP:
+                state = digest(session)
+    return steps, sim_time * 1000 / SECONDS, state, clock.dropped_time
+
+
+def main():
+    rows = []
+    for fixed in (False, True):
+        results = {fps: run(fps, fixed) for fps in FPS_LIMITS}
+        reference = results[60][2]
+        for fps, (steps, sim_ms, state, dropped) in results.items():
+            rows.append(('fixed 60 Hz' if fixed else 'variable dt', fps, steps, f"{sim_ms:.1f}",
+                         f"{dropped * 1000:.0f}", state or '-', 'yes' if state == reference else 'no'))
+    print_table(("loop", "render fps", "sim steps", "sim ms/s", "dropped ms", f"state @{CHECK_STEP}", "same as 60"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Menü / ayarlar / yükleme / pause / game over ekranlarının maliyeti: statik katman cache'i ile ve her kare yeniden üretimle.
+
+    python -m bench.ui
+"""
+import random
+
+import pygame
+
+from bench import time_per_call, print_table
+from settings import *
+import ui_system
+from ui_system import render_ui, invalidate_static_layers
+from vfx_layer import VfxLayer
+
+FRAMES = 300
+
+
+def make_screens(surface, state_data):
+    frame = [0]
+
+    def screen(state, mouse_pos):
+        def run():
+            frame[0] += 1
+            state_data['time_ms'] = frame[0] * 16
+            state_data['progress'] = (frame[0] % 100) / 100.0
+            render_ui(surface, state, state_data, mouse_pos)
+        return run
+
+    hover = (LOGICAL_WIDTH // 2, 380)  # İlk butonun üstü
+    return [('main menu', screen('MENU', hover)), ('settings', screen('SETTINGS', hover)),
+            ('loading', screen('LOADING', (0, 0))), ('paused', screen('PAUSED', (0, 0))),
+            ('game over', screen('GAME_OVER', (0, 0)))]
+
+
+def gameplay_frame_ms(surface):
+    """Karşılaştırma için: PLAYING durumunda dünya + VFX + HUD çizimi"""
+    import main as game
+    from game_session import GameSession, FrameInput
+
+    session = GameSession()
+    vfx_layer = VfxLayer(surface.get_size())
+    inputs = FrameInput(right=True)
+    for _ in range(120):
+        session.step(inputs, 1.0 / 60.0)
+    data = {'theme': session.theme, 'score': session.score, 'high_score': 0, 'dash_cd': 0, 'slam_cd': 0}
+
+    def run():
+        session.step(inputs, 1.0 / 60.0)
+        game.render_frame(surface, vfx_layer, session)
+        render_ui(surface, 'PLAYING', data)
+    return time_per_call(run, FRAMES)
+
+
+def main():
+    pygame.init()
+    random.seed(1)
+    surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    state_data = {'theme': THEMES[0], 'score': 4242, 'high_score': 12000,
+                  'settings': {'fullscreen': True, 'quality': 'HIGH', 'res_index': 1, 'fps_limit': 60},
+                  'logs': ["Initializing Core Systems...", "Loading Assets... OK"]}
+    play_ms = gameplay_frame_ms(surface)
+
+    rows = []
+    for name, run in make_screens(surface, state_data):
+        def rebuild():
+            invalidate_static_layers()
+            run()
+        rebuild_ms = time_per_call(rebuild, FRAMES)
+        cached_ms = time_per_call(run, FRAMES)
+        rows.append((name, f"{rebuild_ms:.3f}", f"{cached_ms:.3f}", f"{rebuild_ms / cached_ms:.1f}x",
+                     f"{100.0 * cached_ms / play_ms:.0f}%"))
+    print_table(("screen", "rebuilt ms/frame", "cached ms/frame", "speed-up", "of gameplay frame"), rows)
+    for name, run in make_screens(surface, state_data):
+        run()  # Tüm ekranların katmanı aynı anda cache'te dursun: bellek ölçümü için
+    layer_mb = len(ui_system._static_layers) * LOGICAL_WIDTH * LOGICAL_HEIGHT * 4 / (1024 * 1024)
+    print(f"\ngameplay frame: {play_ms:.3f} ms   static layers: {len(ui_system._static_layers)} ({layer_mb:.0f} MB)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Ağır çatışmada VFX kare süresi: Sprite Group + 30 karede toplu kesme (eski) vs. adet sınırlı VfxPools
+vs. öncelik / maliyet bütçeli VfxPools. Kare süresi = spawn + update + efektlerin çizimi.
+
+    python -m bench.vfx_budget [kare_sayisi]
+
+"30-frame swing": karelerin (kare % 30) fazına göre ortalamalarının en büyüğü ile en küçüğü arasındaki fark;
+toplu kesmenin testere dişi burada görünür. "est. µs" bütçenin canlı efektler için tahmini kare maliyetidir;
+ölçülen süreyle karşılaştırıp EFFECT_BUDGET'in birim maliyetlerini doğrulamak içindir.
+"""
+import random
+import statistics
+import sys
+import time
+
+import pygame
+
+from bench import print_table
+from bench.vfx_pool import LegacyVfx
+from game_session import QUALITY_PRESETS, METEOR_FIRE
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, CURSED_PURPLE, PLAYER_SLAM
+from vfx import ParticleExplosion, Shockwave, LightningBolt, ScreenFlash
+from vfx_pool import VfxPools
+
+FRAMES = 900
+SEED = 11
+CYCLE = 30
+
+
+def combat_frame(vfx, frame, rng):
+    """Öldürme zinciri + slam + dash: kare başına kalabalık ve dalgalı efekt üretimi"""
+    kills = 2 + (frame // 45) % 4
+    for _ in range(kills):
+        x, y = rng.uniform(100, LOGICAL_WIDTH - 100), rng.uniform(100, LOGICAL_HEIGHT - 100)
+        vfx.spawn(ParticleExplosion, x, y, CURSED_PURPLE, 20)
+        vfx.spawn(Shockwave, x, y, (255, 100, 0), max_radius=90, width=4)
+    if frame % 12 == 0:
+        x, y = rng.uniform(100, LOGICAL_WIDTH - 100), rng.uniform(300, LOGICAL_HEIGHT - 100)
+        vfx.spawn(ScreenFlash, PLAYER_SLAM, 80, 8)
+        vfx.spawn(Shockwave, x, y, PLAYER_SLAM, max_radius=200, rings=3, speed=25)
+        vfx.spawn(ParticleExplosion, x, y, PLAYER_SLAM, 25)
+    if frame % 4 == 0:
+        x, y = rng.uniform(100, LOGICAL_WIDTH - 400), rng.uniform(100, LOGICAL_HEIGHT - 200)
+        vfx.spawn(LightningBolt, x, y, x + 300, y + rng.uniform(-100, 100), METEOR_FIRE, 12)
+
+
+def run(mode, max_vfx, budget, frames):
+    rng = random.Random(SEED)
+    random.seed(SEED)
+    surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)
+    if mode == "group":
+        vfx = LegacyVfx(max_vfx)
+        effects = vfx.group
+    else:
+        vfx = VfxPools(max_vfx, budget if mode == "budget" else None)
+        effects = vfx
+    times, estimates = [], []
+    for frame in range(frames):
+        surface.fill((0, 0, 0, 0))
+        start = time.perf_counter()
+        combat_frame(vfx, frame, rng)
+        vfx.update(5.0)
+        for effect in effects:
+            effect.draw(surface)
+        times.append((time.perf_counter() - start) * 1000.0)
+        if mode != "group":
+            estimates.append(vfx.cost)
+    # Isınma: ilk iki döngü canlı efekt sayısı henüz dengeye oturmadan
+    times = times[2 * CYCLE:]
+    phases = [statistics.fmean(times[i::CYCLE]) for i in range(CYCLE)]
+    ordered = sorted(times)
+    culled = degraded = 0
+    if mode != "group":
+        culled = sum(p.culled for p in vfx.pools.values())
+        degraded = sum(p.degraded for p in vfx.pools.values())
+    return dict(mean=statistics.fmean(times), p50=ordered[len(ordered) // 2],
+                p99=ordered[int(len(ordered) * 0.99)], worst=ordered[-1], stdev=statistics.pstdev(times),
+                swing=max(phases) - min(phases),
+                est=statistics.fmean(estimates[2 * CYCLE:]) if estimates else None,
+                culled=culled, degraded=degraded)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    print(f"{frames} frames of kill chains, slams and lightning (update + draw of heavy effects)")
+    rows = []
+    for quality in ('HIGH', 'MEDIUM', 'LOW'):
+        preset = QUALITY_PRESETS[quality]
+        for mode in ("group", "pools", "budget"):
+            r = run(mode, preset['max_vfx'], preset['vfx_budget'], frames)
+            est = f"{r['est']:.0f}" if r['est'] is not None else "-"
+            rows.append((quality, mode, f"{r['mean']:.2f}", f"{r['p50']:.2f}", f"{r['p99']:.2f}", f"{r['worst']:.2f}",
+                         f"{r['stdev']:.2f}", f"{r['swing']:.2f}", est, r['degraded'], r['culled']))
+    print_table(("quality", "vfx", "mean ms", "p50 ms", "p99 ms", "worst ms", "stdev ms", "30-frame swing ms",
+                 "est. µs", "shortened", "dropped"), rows)
+
+
+if __name__ == "__main__":
+    main()
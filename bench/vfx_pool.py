@@ -0,0 +1,206 @@
+"""Sürekli dash + slam dizisinde ağır efektlerin tahsis ve GC yükü: Sprite Group + 30 karede toplu kesme
+vs. tip başına önceden ayrılmış VfxPools.
+
+    python -m bench.vfx_pool [kare_sayisi]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from bench import print_table
+from bench.scenarios import DenseEnemySession
+from game_session import FrameInput, QUALITY_PRESETS
+from vfx import PooledEffect, ParticleExplosion, Shockwave, LightningBolt, ScreenFlash
+from vfx_pool import VfxPools
+
+DT = 1.0 / 60.0
+FRAMES = 3000
+SEED = 7
+BURST_FRAMES = 3000
+# Kare başına doğrudan spawn edilen efekt: toplamda max_vfx'i aşan yoğun bir kalabalık
+BURST = ((ParticleExplosion, 3), (Shockwave, 2), (LightningBolt, 1))
+
+
+def sustained_dash(frame):
+    # Cooldown biter bitmez dash, arada zıplama ve slam: efekt üretimi hiç durmuyor
+    phase = frame % 30
+    return FrameInput(right=True, jump=phase == 0, slam=phase == 12, dash=True)
+
+
+class LegacyVfx:
+    """Eski davranış: her spawn'da yeni nesne, Group, 30 karede bir sınırı aşınca ilk 20'yi öldür"""
+    def __init__(self, max_vfx):
+        self.max_vfx = max_vfx
+        self.group = pygame.sprite.Group()
+        self.frame = 0
+
+    def spawn(self, cls, *args, **kwargs):
+        effect = cls(*args, **kwargs)
+        self.group.add(effect)
+        return effect
+
+    def update(self, camera_speed):
+        self.frame += 1
+        if self.frame % 30 == 0 and len(self.group) > self.max_vfx:
+            for sprite in self.group.sprites()[:20]:
+                sprite.kill()
+        self.group.update(camera_speed)
+
+    def draw(self, surface):
+        for effect in self.group:
+            effect.draw(surface)
+
+    def clear(self):
+        self.group.empty()
+
+    def set_capacity(self, max_vfx):
+        self.max_vfx = max_vfx
+
+    def __len__(self):
+        return len(self.group)
+
+
+class Counter:
+    """PooledEffect örneklerinin kurulma sayısı (__init__ veya havuzun blank() çağrısı)"""
+    def __init__(self):
+        self.count = 0
+        self._init = PooledEffect.__init__
+        self._blank = PooledEffect.blank.__func__
+
+    def __enter__(self):
+        counter = self
+
+        def counting_init(effect, *args, **kwargs):
+            counter.count += 1
+            counter._init(effect, *args, **kwargs)
+
+        def counting_blank(cls):
+            counter.count += 1
+            return counter._blank(cls)
+
+        PooledEffect.__init__ = counting_init
+        PooledEffect.blank = classmethod(counting_blank)
+        return self
+
+    def __exit__(self, *exc):
+        PooledEffect.__init__ = self._init
+        PooledEffect.blank = classmethod(self._blank)
+
+
+class GcMonitor:
+    """gc.callbacks ile nesil başına toplama sayısı ve toplam duraklama süresi"""
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase, info):
+        if phase == 'start':
+            self._start = time.perf_counter()
+        else:
+            self.pause += time.perf_counter() - self._start
+            self.collections[info['generation']] += 1
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def run(frames, pooled, trace=False):
+    random.seed(SEED)
+    spawns = peak_live = 0
+    with Counter() as created, GcMonitor() as monitor:
+        if trace:
+            tracemalloc.start()
+        session = DenseEnemySession()
+        if not pooled:
+            session.all_vfx = LegacyVfx(session.max_vfx_count)
+        original_spawn = session.all_vfx.spawn
+
+        def counting_spawn(cls, *args, **kwargs):
+            nonlocal spawns
+            spawns += 1
+            return original_spawn(cls, *args, **kwargs)
+
+        session.all_vfx.spawn = counting_spawn
+        if not pooled:
+            created.count = 0   # Oturumun kendi havuzları sayılmasın
+        start = time.perf_counter()
+        for frame in range(frames):
+            session.step(sustained_dash(frame), DT)
+            session.pop_events()
+            peak_live = max(peak_live, len(session.all_vfx))
+            if session.game_over:
+                session.reset()
+        elapsed = time.perf_counter() - start
+        peak_bytes = 0
+        if trace:
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return dict(spawns=spawns, created=created.count, peak_live=peak_live, gc=monitor.collections,
+                gc_ms=monitor.pause * 1000.0, peak_kb=peak_bytes / 1024.0, ms=elapsed * 1000.0 / frames)
+
+
+def run_burst(frames, pooled, max_vfx):
+    """Oyun mantığı olmadan efekt yağmuru: sınırın ekleme anında mı toplu mu uygulandığını gösterir"""
+    rng = random.Random(SEED)
+    random.seed(SEED)
+    peak_live = 0
+    with Counter() as created, GcMonitor() as monitor:
+        vfx = VfxPools(max_vfx) if pooled else LegacyVfx(max_vfx)
+        start = time.perf_counter()
+        for frame in range(frames):
+            for cls, n in BURST:
+                for _ in range(n):
+                    x, y = rng.uniform(0, 1920), rng.uniform(0, 1080)
+                    if cls is LightningBolt:
+                        vfx.spawn(cls, x, y, x + 60, y + 60, (255, 255, 255), 12)
+                    else:
+                        vfx.spawn(cls, x, y, (255, 100, 0))
+            if frame % 20 == 0:
+                vfx.spawn(ScreenFlash, (255, 255, 255), 80, 6)
+            vfx.update(5.0)
+            peak_live = max(peak_live, len(vfx))
+        elapsed = time.perf_counter() - start
+    evicted = sum(p.evicted for p in vfx.pools.values()) if pooled else 0
+    return dict(created=created.count, peak_live=peak_live, evicted=evicted, gc=monitor.collections,
+                gc_ms=monitor.pause * 1000.0, ms=elapsed * 1000.0 / frames)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    rows = []
+    for name, pooled in (("group", False), ("pools", True)):
+        r = run(frames, pooled)
+        # tracemalloc adımları yavaşlatır: bellek tepe değeri ayrı bir koşudan
+        peak_kb = run(frames, pooled, trace=True)['peak_kb']
+        rows.append((name, r['spawns'], r['created'], r['peak_live'], "/".join(map(str, r['gc'])),
+                     f"{r['gc_ms']:.1f}", f"{peak_kb:.0f}", f"{r['ms'] * 1000:.0f}"))
+    print(f"{frames} frames of sustained dash + slam on enemy-dense platforms")
+    print_table(("vfx", "spawns", "objects created", "peak live", "gc gen0/1/2", "gc pause ms",
+                 "peak traced KiB", "step µs"), rows)
+
+    print()
+    spawned = BURST_FRAMES * (sum(n for _, n in BURST)) + BURST_FRAMES // 20
+    print(f"{BURST_FRAMES} frames of direct spawns ({spawned} effects, no game logic)")
+    rows = []
+    for quality in ('HIGH', 'LOW'):
+        max_vfx = QUALITY_PRESETS[quality]['max_vfx']
+        for name, pooled in (("group", False), ("pools", True)):
+            r = run_burst(BURST_FRAMES, pooled, max_vfx)
+            rows.append((quality, max_vfx, name, r['created'], r['peak_live'], r['evicted'],
+                         "/".join(map(str, r['gc'])), f"{r['gc_ms']:.1f}", f"{r['ms'] * 1000:.0f}"))
+    print_table(("quality", "max_vfx", "vfx", "objects created", "peak live", "evicted on insert",
+                 "gc gen0/1/2", "gc pause ms", "frame µs"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Dünya indeksi stres testi: çok geniş spawn penceresi ve yoğun düşmanla sorgu maliyetleri.
+
+Eski yol (her sorguda tüm Group'u taramak) ile WorldIndex aralık sorgularını aynı dünya üzerinde karşılaştırır,
+ardından stres oturumunu baştan sona step() ile koşturur.
+
+    python -m bench.world
+"""
+import math
+import random
+import time
+
+import pygame
+
+from bench import time_per_call, print_table
+from settings import *
+from game_session import GameSession, FrameInput, PLAYER_W, PLAYER_H
+
+LOOKAHEADS = (100, 5000, 20000, 60000)
+ENEMIES_PER_PLATFORM = 4
+QUERIES = 200
+STEP_FRAMES = 600
+
+
+class StressSession(GameSession):
+    """Geniş ileri bakış penceresi + platform başına birden çok düşman"""
+    SPAWN_LOOKAHEAD = 100
+    START_LOOKAHEAD = 200
+
+    def add_new_platform(self, start_x=None):
+        super().add_new_platform(start_x)
+        newest = self.world.last_platform
+        if newest.rect.width > 120:
+            for _ in range(ENEMIES_PER_PLATFORM):
+                self.spawn_enemy(newest)
+
+
+def stress_session(lookahead):
+    cls = type('StressSession%d' % lookahead, (StressSession,),
+               {'SPAWN_LOOKAHEAD': lookahead, 'START_LOOKAHEAD': lookahead + 100})
+    return cls()
+
+
+# --- ESKİ SORGULAR (tam tarama) ---
+def legacy_frontier(session):
+    return max(p.rect.right for p in session.all_platforms)
+
+
+def legacy_collide(session, rect):
+    dummy = type('', (object,), {'rect': rect})()
+    return (pygame.sprite.spritecollide(dummy, session.all_enemies, False),
+            pygame.sprite.spritecollide(dummy, session.all_platforms, False))
+
+
+def legacy_aoe(session, x, y, radius):
+    return [e for e in session.all_enemies
+            if math.sqrt((e.rect.centerx - x)**2 + (e.rect.centery - y)**2) < radius]
+
+
+# --- İNDEKS SORGULARI ---
+def index_frontier(session):
+    return session.world.rightmost_edge
+
+
+def index_collide(session, rect):
+    return session.world.enemies_colliding(rect), session.world.platforms_colliding(rect)
+
+
+def index_aoe(session, x, y, radius):
+    return [e for e in session.world.enemies_near(x, radius)
+            if math.sqrt((e.rect.centerx - x)**2 + (e.rect.centery - y)**2) < radius]
+
+
+def query_points(rng):
+    return [(rng.randint(0, LOGICAL_WIDTH), rng.choice(PLATFORM_HEIGHTS) - PLAYER_H) for _ in range(QUERIES)]
+
+
+def compare_queries(session, points):
+    """Her sorgu türü için (eski µs, indeks µs); sonuçların aynı olduğunu da doğrular"""
+    rows = []
+    for name, legacy, index in (('frontier', lambda p: legacy_frontier(session), lambda p: index_frontier(session)),
+                                ('collide', lambda p: legacy_collide(session, pygame.Rect(p[0], p[1], PLAYER_W, PLAYER_H + 20)),
+                                 lambda p: index_collide(session, pygame.Rect(p[0], p[1], PLAYER_W, PLAYER_H + 20))),
+                                ('aoe r=250', lambda p: legacy_aoe(session, p[0], p[1], 250),
+                                 lambda p: index_aoe(session, p[0], p[1], 250))):
+        for p in points:
+            a, b = legacy(p), index(p)
+            if name == 'collide':
+                a, b = (set(a[0]), set(a[1])), (set(b[0]), set(b[1]))
+            elif name == 'aoe r=250':
+                a, b = set(a), set(b)
+            assert a == b, (name, p)
+        legacy_us = time_per_call(lambda: [legacy(p) for p in points], 5) * 1000 / len(points)
+        index_us = time_per_call(lambda: [index(p) for p in points], 5) * 1000 / len(points)
+        rows.append((name, legacy_us, index_us))
+    return rows
+
+
+def main():
+    rng = random.Random(1)
+    query_rows = []
+    step_rows = []
+    for lookahead in LOOKAHEADS:
+        random.seed(1)
+        session = stress_session(lookahead)
+        points = query_points(rng)
+        for name, legacy_us, index_us in compare_queries(session, points):
+            query_rows.append((lookahead, len(session.all_platforms), len(session.all_enemies), name,
+                               f"{legacy_us:.2f}", f"{index_us:.2f}", f"{legacy_us / index_us:.0f}x"))
+
+        # Tüm oturum: koşan, zıplayan ve dash atan bot
+        inputs = [FrameInput(right=True, jump=f % 40 == 0, dash=f % 90 == 45) for f in range(STEP_FRAMES)]
+        start = time.perf_counter()
+        for f in range(STEP_FRAMES):
+            session.step(inputs[f], 1.0 / 60.0)
+            session.pop_events()
+            if session.game_over:
+                session.reset()
+        elapsed = time.perf_counter() - start
+        step_rows.append((lookahead, f"{elapsed * 1000 / STEP_FRAMES:.3f}"))
+
+    print_table(("lookahead px", "platforms", "enemies", "query", "scan µs", "index µs", "speed-up"), query_rows)
+    print()
+    print_table(("lookahead px", "step ms/frame"), step_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import pygame
-import random
-import math
 from settings import *
+from rng_streams import GAME_RNG
+from platform_cache import PLATFORM_CACHE, PAD as PLATFORM_PAD
+from glitch_frames import GLITCH_FRAMES, GLITCH_CYCLE, GLITCH_STRIDE, PAD as GLITCH_PAD, eye_level
 
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height):
@@ -10,56 +11,32 @@ class Platform(pygame.sprite.Sprite):
         self.height = height
         self.rect = pygame.Rect(x, y, width, height)
 
-    def draw(self, surface, theme=None):
-        # Varsayılan renkler
-        fill_c = (10, 30, 10)
-        border_c = (50, 255, 50)
-        
-        if theme:
-            fill_c = theme["platform_color"]
-            border_c = theme["border_color"]
-
-        pygame.draw.rect(surface, fill_c, self.rect, border_radius=5)
-        pygame.draw.rect(surface, border_c, self.rect, 2, border_radius=5)
-        pygame.draw.line(surface, border_c, (self.rect.left, self.rect.top), (self.rect.right, self.rect.top), 3)
+    def draw(self, surface, theme=None, ox=0):
+        # ox: render interpolasyonu için yatay kaydırma (sabit adımlı döngü)
+        # Şekil ve renk sabit: (boyut, tema) varyantı bir kez çizilir, her kare tek blit
+        surface.blit(PLATFORM_CACHE.get(self.width, self.height, theme), (self.rect.x + ox - PLATFORM_PAD, self.rect.y - PLATFORM_PAD))
         
     def update(self, camera_speed):
         self.rect.x -= camera_speed
         if self.rect.right < 0:
             self.kill()
 
-class Star:
-    def __init__(self):
-        self.x = random.randrange(0, SCREEN_WIDTH)
-        self.y = random.randrange(0, SCREEN_HEIGHT)
-        self.size = random.randint(1, 3)
-        self.speed = random.uniform(0.5, 1.5)
-
-    def update(self, camera_speed):
-        self.x -= self.speed * camera_speed / 3
-        if self.x < 0:
-            self.x = SCREEN_WIDTH
-            self.y = random.randrange(0, SCREEN_HEIGHT)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), 1)
-        pygame.draw.circle(surface, STAR_COLOR, (int(self.x), int(self.y)), self.size, 1)
-
 class CursedEnemy(pygame.sprite.Sprite):
     """Platform üzerinde gezinen, glitch efekti olan lanetli düşman"""
     def __init__(self, platform):
         super().__init__()
         self.platform = platform
-        self.width = 40
-        self.height = 40
+        self.width = ENEMY_SIZE
+        self.height = ENEMY_SIZE
         
         # Platformun üzerinde rastgele bir noktada başlat, ama düşmesin
-        safe_x = random.randint(platform.rect.left, max(platform.rect.left, platform.rect.right - self.width))
+        safe_x = GAME_RNG.randint(platform.rect.left, max(platform.rect.left, platform.rect.right - self.width))
         self.rect = pygame.Rect(safe_x, platform.rect.top - self.height, self.width, self.height)
         
         self.speed = 3
-        self.direction = random.choice([-1, 1])
+        self.direction = GAME_RNG.choice([-1, 1])
         self.timer = 0
+        self.glitch_phase = safe_x % GLITCH_CYCLE  # Yan yana düşmanlar aynı karede titremesin
         
     def update(self, camera_speed):
         # 1. Platformla beraber kayma
@@ -82,28 +59,8 @@ class CursedEnemy(pygame.sprite.Sprite):
             
         self.timer += 1
 
-    def draw(self, surface):
-        # Glitch Efekti: Sürekli titreyen ve boyutu değişen çizim
-        jitter_x = random.randint(-3, 3)
-        jitter_y = random.randint(-3, 3)
-        
-        draw_rect = pygame.Rect(self.rect.x + jitter_x, self.rect.y + jitter_y, self.rect.width, self.rect.height)
-        
-        # Ana Gövde (Lanetli Mor)
-        pygame.draw.rect(surface, CURSED_PURPLE, draw_rect)
-        
-        # İç parazit (Siyah çizgiler)
-        for _ in range(3):
-            lx = random.randint(draw_rect.left, draw_rect.right)
-            pygame.draw.line(surface, GLITCH_BLACK, (lx, draw_rect.top), (lx, draw_rect.bottom), 2)
-            
-        # Gözler (Kırmızı ve korkutucu)
-        eye_offset = math.sin(self.timer * 0.2) * 2
-        pygame.draw.rect(surface, CURSED_RED, (draw_rect.x + 8, draw_rect.y + 10 + eye_offset, 8, 8))
-        pygame.draw.rect(surface, CURSED_RED, (draw_rect.x + 24, draw_rect.y + 10 - eye_offset, 8, 8))
-        
-        # Etrafa yayılan 'Corruption' (Bozulma) partikülleri
-        if random.random() < 0.3:
-            px = draw_rect.x + random.randint(-10, self.width + 10)
-            py = draw_rect.y + random.randint(-10, self.height + 10)
-            pygame.draw.rect(surface, CURSED_PURPLE, (px, py, 4, 4))
\ No newline at end of file
+    def draw(self, surface, ox=0):
+        # Glitch Efekti: önceden çizilmiş karelerden adım sayacıyla seçilen tek blit
+        index = (self.timer * GLITCH_STRIDE + self.glitch_phase) % GLITCH_CYCLE
+        frame = GLITCH_FRAMES.get(self.width, self.height, index, eye_level(self.timer))
+        surface.blit(frame, (self.rect.x + ox - GLITCH_PAD, self.rect.y - GLITCH_PAD))
@@ -0,0 +1,457 @@
+import pygame
+import math
+from settings import *
+from vfx import LightningBolt, Shockwave, ParticleExplosion, ScreenFlash
+from particles import ParticleSystem
+from entities import Platform, CursedEnemy
+from animations import CharacterAnimator, TrailEffect
+from profiler import PROFILER
+from world_index import WorldIndex
+from aoe import AoEResolver
+from rng_streams import GAME_RNG, FX_RNG, new_seed, seed_streams
+from vfx_pool import VfxPools
+from starfield import Starfield
+
+# --- HEADLESS OYUN ÇEKİRDEĞİ ---
+# Tüm oynanış durumu burada yaşar. Ekran, olay kuyruğu veya clock gerektirmez;
+# main.py sadece girdiyi toplar, step() çağırır ve sonucu çizer.
+# Ses ve hitstop gibi yan etkiler doğrudan çalınmaz, 'events' listesine yazılır.
+
+METEOR_CORE = (255, 255, 200)
+METEOR_FIRE = (255, 80, 0)
+DASH_SPARK_COLORS = ((255, 50, 0), (255, 150, 0), (255, 255, 100))
+PLAYER_W, PLAYER_H = 30, 30
+TRAIL_INTERVAL = 3
+METEOR_HIT_RADIUS = 120
+KILL_SCORE = 500
+
+# Kalite kademeleri (pahalıdan ucuza). spawn_rate: hafif partikül oranı, glow_layers: glow sprite katman sayısı,
+# vfx_budget: ağır efektlerin kare başı tahmini update + çizim bütçesi (µs, vfx_pool.EFFECT_BUDGET ile)
+QUALITY_PRESETS = {
+    'HIGH': {'max_vfx': 200, 'max_dash_vfx': 5, 'max_particles': 1024, 'max_kill_fx': 8,
+             'spawn_rate': 1.0, 'glow_layers': 3, 'vfx_budget': 2000},
+    'MEDIUM': {'max_vfx': 120, 'max_dash_vfx': 4, 'max_particles': 640, 'max_kill_fx': 5,
+               'spawn_rate': 0.75, 'glow_layers': 2, 'vfx_budget': 1200},
+    'LOW': {'max_vfx': 50, 'max_dash_vfx': 2, 'max_particles': 256, 'max_kill_fx': 3,
+            'spawn_rate': 0.5, 'glow_layers': 1, 'vfx_budget': 600},
+}
+
+
+class FrameInput:
+    """Bir karelik oyuncu girdisi: basılı tuşlar + bu karede basılan aksiyonlar"""
+    __slots__ = ('left', 'right', 'up', 'down', 'jump', 'slam', 'dash')
+
+    def __init__(self, left=False, right=False, up=False, down=False, jump=False, slam=False, dash=False):
+        self.left, self.right, self.up, self.down = left, right, up, down
+        self.jump, self.slam, self.dash = jump, slam, dash
+
+    @classmethod
+    def from_pygame(cls, keys, events):
+        """pygame.key.get_pressed() ve bu karenin KEYDOWN olaylarından girdi üretir"""
+        pressed = {e.key for e in events if e.type == pygame.KEYDOWN}
+        return cls(left=bool(keys[pygame.K_a]), right=bool(keys[pygame.K_d]),
+                   up=bool(keys[pygame.K_w]), down=bool(keys[pygame.K_s]),
+                   jump=pygame.K_w in pressed, slam=pygame.K_s in pressed, dash=pygame.K_SPACE in pressed)
+
+    def absorb(self, newer):
+        """Basılı tuşları newer'dan alır, aksiyonları biriktirir (adım koşmayan render karelerinde kaybolmasın)"""
+        self.left, self.right, self.up, self.down = newer.left, newer.right, newer.up, newer.down
+        self.jump |= newer.jump
+        self.slam |= newer.slam
+        self.dash |= newer.dash
+
+    def clear_actions(self):
+        """Aksiyonlar tek bir simülasyon adımında tüketilir"""
+        self.jump = self.slam = self.dash = False
+
+
+NO_INPUT = FrameInput()
+
+
+class GameSession:
+    """Oynanış durumunu tutar ve step(inputs, dt) ile ilerletir"""
+    SPAWN_LOOKAHEAD = 100   # En sağ platform ekranın bu kadar sağına gelmeden yenisi eklenir
+    START_LOOKAHEAD = 200   # reset() dünyayı ekranın bu kadar sağına kadar doldurur
+
+    def __init__(self, quality='HIGH'):
+        self.high_score = 0
+        self.events = []
+
+        self.all_platforms = pygame.sprite.Group()
+        self.all_enemies = pygame.sprite.Group()
+        self.world = WorldIndex()  # Platform/düşmanlar için x'e göre sıralı indeks
+        self.aoe = AoEResolver()
+        self.all_vfx = None
+        self.particles = None
+        self.starfield = Starfield()
+        self.character_animator = CharacterAnimator()
+        self.trail_effects = []
+        self.active_damage_waves = []
+
+        self.set_quality(quality)
+        self.reset()
+
+    def set_quality(self, quality):
+        preset = QUALITY_PRESETS[quality]
+        self.quality = quality
+        self.max_vfx_count = preset['max_vfx']
+        self.max_dash_vfx_per_frame = preset['max_dash_vfx']
+        self.max_kill_fx_per_frame = preset['max_kill_fx']  # Toplu öldürmede patlama efekti sınırı
+        # Ağır efektler tip başına önceden ayrılmış havuzlarda; adet sınırı ve maliyet bütçesi ekleme anında uygulanır
+        if self.all_vfx is None:
+            self.all_vfx = VfxPools(self.max_vfx_count, preset['vfx_budget'])
+        else:
+            if self.all_vfx.max_vfx != self.max_vfx_count:
+                self.all_vfx.set_capacity(self.max_vfx_count)
+            self.all_vfx.set_budget(preset['vfx_budget'])
+        if self.particles is None:
+            self.particles = ParticleSystem(preset['max_particles'])
+        else:
+            self.particles.resize(preset['max_particles'])  # Koşu ortasında kademe değişimi: canlılar kalır
+        self.particles.spawn_rate = preset['spawn_rate']
+
+    def reset(self, seed=None):
+        """Yeni bir koşu başlatır (eski init_game). Aynı seed + aynı girdiler = aynı koşu (replay)"""
+        self.seed = new_seed() if seed is None else seed
+        seed_streams(self.seed)
+        self.theme = GAME_RNG.choice(THEMES)
+        self.shape = GAME_RNG.choice(PLAYER_SHAPES)
+        self.score = 0.0
+        self.camera_speed = INITIAL_CAMERA_SPEED
+        self.player_x, self.player_y = 150.0, float(LOGICAL_HEIGHT - 300)
+        # Render interpolasyonu için bir önceki adımın durumu
+        self.prev_player_x, self.prev_player_y = self.player_x, self.player_y
+        self.last_scroll = 0.0
+        self.y_velocity = 0.0
+        self.is_jumping = self.is_dashing = self.is_slamming = False
+        self.slam_stall_timer = 0
+        self.slam_cooldown = 0
+        self.jumps_left = MAX_JUMPS
+        self.dash_timer = 0
+        self.dash_cooldown_timer = 0
+        self.dash_vx = self.dash_vy = 0.0
+        self.screen_shake = 0
+        self.dash_particles_timer = 0
+        self.dash_angle = 0.0
+        self.dash_frame_counter = 0.0
+        self.character_state = 'idle'
+        self.slam_collision_check_frames = 0
+        self.last_trail_time = 0.0
+        self.frame_count = 0
+        self.game_over = False
+
+        self.trail_effects.clear()
+        self.active_damage_waves.clear()
+        self.character_animator.__init__()
+        self.starfield.reset(FX_RNG)  # Yıldızlar da koşunun tohumundan
+        self.all_platforms.empty()
+        self.all_enemies.empty()
+        self.world.clear()
+        self.all_vfx.clear()
+        self.particles.clear()
+        self.events.clear()
+
+        start_plat = Platform(0, LOGICAL_HEIGHT - 50, 400, PLATFORM_THICKNESS)
+        self.all_platforms.add(start_plat)
+        self.world.add_platform(start_plat)
+        while self.world.rightmost_edge < LOGICAL_WIDTH + self.START_LOOKAHEAD:
+            self.add_new_platform()
+
+    def add_new_platform(self, start_x=None):
+        if start_x is None:
+            rightmost = self.world.rightmost_edge
+            if rightmost is not None:
+                gap = GAME_RNG.randint(GAP_MIN, GAP_MAX)
+                start_x = rightmost + gap
+            else:
+                start_x = LOGICAL_WIDTH
+        width = GAME_RNG.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
+        y = GAME_RNG.choice(PLATFORM_HEIGHTS)
+
+        new_plat = Platform(start_x, y, width, PLATFORM_THICKNESS)
+        self.all_platforms.add(new_plat)
+        self.world.add_platform(new_plat)
+
+        if width > 120 and GAME_RNG.random() < 0.4:
+            self.spawn_enemy(new_plat)
+
+    def spawn_enemy(self, platform):
+        """platform üzerine düşman ekler (platform en sağdaki olmalı: indeks sırası)"""
+        enemy = CursedEnemy(platform)
+        self.all_enemies.add(enemy)
+        self.world.add_enemy(enemy)
+        return enemy
+
+    def pop_events(self):
+        """Bu kareden beri biriken yan etkileri (ses, hitstop, game_over) döner ve temizler"""
+        events = self.events
+        self.events = []
+        return events
+
+    def _end_run(self):
+        self.game_over = True
+        self.high_score = max(self.high_score, int(self.score))
+        self.events.append('game_over')
+
+    # --- GİRDİ ---
+    def _handle_actions(self, inputs):
+        theme = self.theme
+        px, py = int(self.player_x + 15), int(self.player_y + 15)
+
+        if inputs.jump and self.jumps_left > 0 and not self.is_dashing:
+            self.jumps_left -= 1
+            self.is_jumping = True; self.is_slamming = False; self.y_velocity = -JUMP_POWER
+            self.character_state = 'jumping'
+            self.events.append('jump')
+            self.all_vfx.spawn(ParticleExplosion, px, py, theme["player_color"], 6)
+            for _ in range(2):
+                self.particles.spawn_energy_orb(px + FX_RNG.randint(-10, 10),
+                                                py + FX_RNG.randint(-10, 10),
+                                                theme["border_color"], 4, 15)
+
+        if inputs.slam and self.is_jumping and not self.is_dashing and not self.is_slamming and self.slam_cooldown <= 0:
+            self.is_slamming = True
+            self.slam_stall_timer = 15
+            self.slam_cooldown = 120
+            self.y_velocity = 0
+            self.character_state = 'slamming'
+            self.slam_collision_check_frames = 0
+            self.events.append('slam')
+            self.all_vfx.spawn(ScreenFlash, PLAYER_SLAM, 80, 8)
+            self.all_vfx.spawn(Shockwave, px, py, PLAYER_SLAM, max_radius=200, rings=3, speed=25)
+
+            for _ in range(3):
+                self.all_vfx.spawn(LightningBolt, px, py,
+                                   px + FX_RNG.randint(-60, 60),
+                                   py + FX_RNG.randint(-60, 60),
+                                   PLAYER_SLAM, 12)
+
+        if inputs.dash and self.dash_cooldown_timer <= 0 and not self.is_dashing:
+            self.is_dashing = True
+            self.dash_timer = DASH_DURATION
+            self.dash_cooldown_timer = DASH_COOLDOWN
+            self.screen_shake = 8
+            self.dash_particles_timer = 0
+            self.dash_frame_counter = 0.0
+            self.character_state = 'dashing'
+            self.events.append('dash')
+            self.all_vfx.spawn(ScreenFlash, METEOR_CORE, 80, 6)
+            self.all_vfx.spawn(Shockwave, px, py, METEOR_FIRE, max_radius=120, rings=2, speed=15)
+
+            dx = inputs.right - inputs.left; dy = inputs.down - inputs.up
+            if dx == 0 and dy == 0: dx = 1
+            mag = math.sqrt(dx*dx + dy*dy)
+            self.dash_vx, self.dash_vy = (dx/mag)*DASH_SPEED, (dy/mag)*DASH_SPEED
+            self.is_jumping = True; self.y_velocity = 0
+            self.dash_angle = math.atan2(self.dash_vy, self.dash_vx)
+
+    # --- SİMÜLASYON ---
+    # --- ALAN ETKİSİ ---
+    def _resolve_aoe(self, waves, meteor_pos):
+        """Dalga halkaları ve meteor dairesi için öldürülenleri (dalga, meteor) listeleri olarak döner"""
+        rings = [(w['x'], w['y'], w['r']) for w in waves]
+        circles = [(meteor_pos[0], meteor_pos[1], METEOR_HIT_RADIUS)] if meteor_pos else []
+        if not rings and not circles:
+            return [], []
+        lo, hi = AoEResolver.reach(rings, circles)
+        kills = self.aoe.resolve(self.world.enemies_in_range(lo, hi), rings, circles)
+        n_rings = len(rings)
+        return [e for src, e in kills if src < n_rings], [e for src, e in kills if src >= n_rings]
+
+    def _apply_wave_kills(self, enemies):
+        if not enemies:
+            return
+        for enemy in enemies:
+            enemy.kill()
+        self.score += KILL_SCORE * len(enemies)
+        for enemy in enemies[:self.max_kill_fx_per_frame]:
+            self.all_vfx.spawn(ParticleExplosion, enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20)
+        # Öldürme başına üst üste binen 30 alpha'lık flash'lar yerine aynı yoğunlukta tek flash
+        intensity = int(255 * (1.0 - (1.0 - 30 / 255.0) ** len(enemies)))
+        self.all_vfx.spawn(ScreenFlash, CURSED_PURPLE, intensity, 2)
+
+    def _apply_meteor_kills(self, enemies):
+        if not enemies:
+            return
+        for enemy in enemies:
+            enemy.kill()
+        self.score += KILL_SCORE * len(enemies)
+        self.screen_shake = 10
+        self.events.append('explosion')
+        for enemy in enemies[:self.max_kill_fx_per_frame]:
+            self.all_vfx.spawn(ParticleExplosion, enemy.rect.centerx, enemy.rect.centery, METEOR_FIRE, 25)
+            self.all_vfx.spawn(Shockwave, enemy.rect.centerx, enemy.rect.centery, (255, 100, 0), max_radius=90, width=4)
+
+    def step(self, inputs, dt):
+        """Bir kareyi ilerletir. dt saniye cinsindendir (60 FPS'de ~0.0167)"""
+        if self.game_over:
+            return
+        self.frame_count += 1
+        frame_mul = max(0.001, dt) * 60.0
+        self.prev_player_x, self.prev_player_y = self.player_x, self.player_y
+
+        self._handle_actions(inputs)
+
+        theme = self.theme
+        self.camera_speed = min(MAX_CAMERA_SPEED, self.camera_speed + SPEED_INCREMENT_RATE * frame_mul)
+        self.score += 0.1 * self.camera_speed * frame_mul
+
+        old_x, old_y = self.player_x, self.player_y
+        horizontal_move = inputs.right - inputs.left
+        if horizontal_move != 0 and not self.is_dashing and not self.is_slamming:
+            self.character_state = 'running'
+        elif not self.is_jumping and not self.is_dashing and not self.is_slamming:
+            self.character_state = 'idle'
+
+        is_grounded = not self.is_jumping and not self.is_slamming and not self.is_dashing
+        self.character_animator.update(dt, self.character_state, is_grounded, self.y_velocity,
+                                       self.is_dashing, self.is_slamming)
+
+        self.last_trail_time += frame_mul
+        if self.last_trail_time >= TRAIL_INTERVAL and (self.is_dashing or self.is_slamming):
+            self.last_trail_time = 0.0
+            trail_color = theme["player_color"]
+            if self.is_dashing:
+                trail_color = METEOR_FIRE
+                trail_size = FX_RNG.randint(8, 14)
+            elif self.is_slamming:
+                trail_color = PLAYER_SLAM
+                trail_size = FX_RNG.randint(8, 12)
+            self.trail_effects.append(TrailEffect(self.player_x + 15, self.player_y + 15, trail_color, trail_size, life=12))
+
+        # Alan etkileri: tüm slam dalgaları + meteor dash tek toplu mesafe testinde
+        px, py = int(self.player_x + 15), int(self.player_y + 15)
+        waves = self.active_damage_waves
+        for wave in waves:
+            wave['r'] += wave['speed'] * frame_mul
+            wave['x'] -= self.camera_speed * frame_mul
+        wave_kills, meteor_kills = self._resolve_aoe(waves, (px, py) if self.is_dashing else None)
+        self._apply_wave_kills(wave_kills)
+        waves[:] = [w for w in waves if w['r'] <= w['max_r']]
+
+        if self.is_dashing:
+            self.dash_frame_counter += frame_mul
+            for _ in range(4):
+                inv_angle = self.dash_angle + math.pi + FX_RNG.uniform(-0.5, 0.5)
+                spark_speed = FX_RNG.uniform(5, 15)
+                color = FX_RNG.choice(DASH_SPARK_COLORS)
+                self.particles.spawn_flame_spark(px, py, inv_angle, spark_speed, color, life=20, size=FX_RNG.randint(4, 8))
+
+            if int(self.dash_frame_counter) % 5 == 0:
+                self.all_vfx.spawn(Shockwave, px, py, (255, 200, 100), max_radius=70, width=2, speed=10)
+
+            self._apply_meteor_kills(meteor_kills)
+
+            if self.dash_particles_timer > 0:
+                self.dash_particles_timer -= frame_mul
+            else:
+                self.dash_particles_timer = 4
+                offset_x = FX_RNG.randint(-5, 5)
+                offset_y = FX_RNG.randint(-5, 5)
+                self.particles.spawn_warp_line(px + offset_x, py + offset_y, self.dash_angle + FX_RNG.uniform(-0.15, 0.15), METEOR_CORE, METEOR_FIRE)
+
+            self.player_x += self.dash_vx * frame_mul
+            self.player_y += self.dash_vy * frame_mul
+            self.player_x -= self.camera_speed * frame_mul
+            self.dash_timer -= frame_mul
+            if self.dash_timer <= 0:
+                self.is_dashing = False
+                self.y_velocity = 0
+                self.character_state = 'idle'
+
+        elif self.is_slamming and self.slam_stall_timer > 0:
+            self.slam_stall_timer -= frame_mul
+            self.slam_collision_check_frames += 1
+            if int(self.slam_stall_timer) % 3 == 0:
+                for _ in range(2):
+                    angle = FX_RNG.uniform(0, math.pi * 2)
+                    dist = FX_RNG.randint(20, 40)
+                    ex = self.player_x + 15 + math.cos(angle) * dist
+                    ey = self.player_y + 15 + math.sin(angle) * dist
+                    self.particles.spawn_flame_spark(ex, ey, angle + math.pi, dist/10, PLAYER_SLAM, life=15)
+
+            vibration = GAME_RNG.randint(-1, 1) if self.slam_stall_timer > 7 else 0
+            self.player_x += vibration
+            if self.slam_stall_timer <= 0:
+                self.y_velocity = 30
+                self.screen_shake = 12
+                self.all_vfx.spawn(ParticleExplosion, self.player_x+15, self.player_y+15, PLAYER_SLAM, 12)
+
+        else:
+            self.player_x -= self.camera_speed * frame_mul
+            if inputs.left: self.player_x -= PLAYER_SPEED * frame_mul
+            if inputs.right: self.player_x += PLAYER_SPEED * frame_mul
+            self.player_y += self.y_velocity * frame_mul
+            if self.is_slamming:
+                self.y_velocity += SLAM_GRAVITY * 1.8 * frame_mul
+            else:
+                self.y_velocity += GRAVITY * frame_mul
+
+        if self.dash_cooldown_timer > 0: self.dash_cooldown_timer -= frame_mul
+        if self.slam_cooldown > 0: self.slam_cooldown -= frame_mul
+        if self.screen_shake > 0: self.screen_shake -= 1
+
+        PROFILER.begin('collision')
+        player_rect = pygame.Rect(int(self.player_x), int(self.player_y), PLAYER_W, PLAYER_H)
+
+        enemy_hits = self.world.enemies_colliding(player_rect)
+        for enemy in enemy_hits:
+            if self.is_dashing or self.is_slamming:
+                enemy.kill()
+                self.score += 500
+                self.screen_shake = 15
+                self.events.append('explosion')
+                self.all_vfx.spawn(ParticleExplosion, enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20)
+                self.all_vfx.spawn(Shockwave, enemy.rect.centerx, enemy.rect.centery, GLITCH_BLACK, max_radius=80, width=5)
+                self.events.append('hitstop')
+            else:
+                self._end_run()
+                self.all_vfx.spawn(ParticleExplosion, self.player_x, self.player_y, CURSED_RED, 30)
+
+        move_rect = pygame.Rect(int(self.player_x), int(min(old_y, self.player_y)), PLAYER_W, int(abs(self.player_y - old_y)) + PLAYER_H)
+        collided_platforms = self.world.platforms_colliding(move_rect)
+
+        for p in collided_platforms:
+            platform_top = p.rect.top
+            if (old_y + PLAYER_H <= platform_top + 15) and (self.player_y + PLAYER_H >= platform_top):
+                self.player_y = platform_top - PLAYER_H
+                if self.is_slamming:
+                    self.y_velocity = -15
+                    self.screen_shake = 30
+                    self.active_damage_waves.append({'x': self.player_x + 15, 'y': platform_top, 'r': 10, 'max_r': 250, 'speed': 25})
+                    for i in range(2):
+                        wave = self.all_vfx.spawn(Shockwave, self.player_x+15, p.rect.top, (255, 180, 80), speed=25)
+                        wave.radius = 30 + i*30; wave.max_radius = 200 + i*60
+                    self.all_vfx.spawn(ParticleExplosion, self.player_x+15, p.rect.top, PLAYER_SLAM, 25)
+                    self.is_slamming = False
+                    self.is_jumping = True
+                    self.jumps_left = MAX_JUMPS - 1
+                    self.character_state = 'jumping'
+                else:
+                    self.y_velocity = 0
+                    self.is_jumping = self.is_slamming = False
+                    self.jumps_left = MAX_JUMPS
+                    self.character_state = 'idle'
+                    self.all_vfx.spawn(ParticleExplosion, self.player_x+15, self.player_y+30, theme["player_color"], 8)
+                break
+        PROFILER.end()
+
+        scroll = self.camera_speed * frame_mul
+        self.last_scroll = scroll
+        self.all_platforms.update(scroll)
+        self.all_enemies.update(scroll)
+        self.starfield.update(scroll)
+        PROFILER.begin('vfx_update')
+        self.all_vfx.update(scroll)
+        self.particles.update(scroll)
+        for trail in self.trail_effects[:]:
+            trail.update(scroll, dt)
+            if trail.life <= 0: self.trail_effects.remove(trail)
+        PROFILER.end()
+
+        self.world.prune()
+        rightmost = self.world.rightmost_edge
+        if rightmost is not None and rightmost < LOGICAL_WIDTH + self.SPAWN_LOOKAHEAD:
+            self.add_new_platform()
+        if not self.game_over and (self.player_x < -50 or self.player_y > LOGICAL_HEIGHT + 100):
+            self._end_run()
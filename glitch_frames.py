@@ -0,0 +1,87 @@
+import math
+import random
+
+import pygame
+
+from settings import CURSED_PURPLE, CURSED_RED, GLITCH_BLACK
+
+# --- DÜŞMAN GLITCH KARELERİ ---
+# CursedEnemy.draw her kare global random'dan titreme, üç siyah parazit çizgisi ve olasılıklı bir
+# bozulma pikseli çekiyor, gövde + iki göz + çizgilerle 6-7 çizim çağrısı yapıyordu.
+# Burada her düşman boyutu için GLITCH_CYCLE adet glitch karesi (titreme, çizgiler, bozulma) ve
+# EYE_LEVELS göz konumu bir kez, sabit tohumla çizilir. Düşman, adım sayacından türeyen ucuz bir
+# dizi ile kare seçer; çizim tek colorkey blit'tir. Görünüm aynı kurallarla üretildiği için aynıdır.
+
+GLITCH_CYCLE = 12     # Farklı glitch karesi sayısı
+GLITCH_STRIDE = 5     # Adım başına dizide atlanan kare (GLITCH_CYCLE ile aralarında asal: tüm kareler gezilir)
+JITTER = 3
+SCANLINES = 3
+CORRUPTION_CHANCE = 0.3
+CORRUPTION_SPREAD = 10
+CORRUPTION_SIZE = 4
+EYE_AMPLITUDE = 2     # Gözler sin(timer * 0.2) * 2 px kayar; tam piksel seviyelerine nicelenir
+EYE_LEVELS = 2 * EYE_AMPLITUDE + 1
+PAD = JITTER + CORRUPTION_SPREAD + CORRUPTION_SIZE   # Karenin düşman kutusu dışına taşabildiği en uzak nokta
+BAKE_SEED = 0xC0DE
+COLORKEY = (255, 0, 255)
+
+
+def eye_level(timer):
+    """Göz salınımının -EYE_AMPLITUDE..EYE_AMPLITUDE tam piksel seviyesi"""
+    return int(round(math.sin(timer * 0.2) * EYE_AMPLITUDE))
+
+
+class GlitchFrameCache:
+    def __init__(self):
+        self.frames = {}   # (genişlik, yükseklik) -> [glitch][göz seviyesi + EYE_AMPLITUDE] yüzeyleri
+
+    def get(self, width, height, index, level):
+        frames = self.frames.get((width, height))
+        if frames is None:
+            frames = self.frames[(width, height)] = self._bake(width, height)
+        return frames[index][level + EYE_AMPLITUDE]
+
+    def _bake(self, width, height):
+        rng = random.Random(BAKE_SEED)
+        size = (width + 2 * PAD, height + 2 * PAD)
+        cycle = []
+        for _ in range(GLITCH_CYCLE):
+            jx = rng.randint(-JITTER, JITTER)
+            jy = rng.randint(-JITTER, JITTER)
+            body = pygame.Rect(PAD + jx, PAD + jy, width, height)
+            lines = [rng.randint(body.left, body.right) for _ in range(SCANLINES)]
+            corruption = None
+            if rng.random() < CORRUPTION_CHANCE:
+                corruption = (body.x + rng.randint(-CORRUPTION_SPREAD, width + CORRUPTION_SPREAD),
+                              body.y + rng.randint(-CORRUPTION_SPREAD, height + CORRUPTION_SPREAD),
+                              CORRUPTION_SIZE, CORRUPTION_SIZE)
+            levels = []
+            for level in range(-EYE_AMPLITUDE, EYE_AMPLITUDE + 1):
+                surf = pygame.Surface(size)
+                surf.fill(COLORKEY)
+                pygame.draw.rect(surf, CURSED_PURPLE, body)
+                for lx in lines:
+                    pygame.draw.line(surf, GLITCH_BLACK, (lx, body.top), (lx, body.bottom), 2)
+                pygame.draw.rect(surf, CURSED_RED, (body.x + 8, body.y + 10 + level, 8, 8))
+                pygame.draw.rect(surf, CURSED_RED, (body.x + 24, body.y + 10 - level, 8, 8))
+                if corruption:
+                    pygame.draw.rect(surf, CURSED_PURPLE, corruption)
+                surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+                levels.append(surf)
+            cycle.append(levels)
+        return cycle
+
+    def prewarm(self, sizes):
+        for width, height in sizes:
+            self.get(width, height, 0, 0)
+
+    def clear(self):
+        self.frames.clear()
+
+    @property
+    def bytes_used(self):
+        return sum(s.get_width() * s.get_height() * s.get_bytesize()
+                   for cycle in self.frames.values() for levels in cycle for s in levels)
+
+
+GLITCH_FRAMES = GlitchFrameCache()
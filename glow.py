@@ -0,0 +1,198 @@
+import math
+import pygame
+from collections import OrderedDict
+
+# --- GLOW SPRITE ATLAS ---
+# FlameSpark ve TrailEffect her kare üst üste 3-4 alpha daire çiziyordu.
+# Burada her varyant (renk, yarıçap, nicelenmiş alpha) bir kez küçük bir SRCALPHA yüzeye çizilir,
+# sonra tek blit olarak basılır. pygame.draw SRCALPHA katmana karıştırmadan yazar (piksel = renk + alpha);
+# sprite da karıştırmadan kopyalanır (blend modu yok) ve şeffaf pikselleri colorkey ile atlanır (RLE).
+# Sprite'lar aynı pygame.draw çağrılarıyla üretildiği için sonuç, üst üste binen efektlerde de eski
+# çizimle aynıdır (fark sadece alpha nicelemesinden).
+# Hologram efektleri (GhostTrail) yarıçap başına bir scanline maskesini (scanline_mask) paylaşır; her
+# renk / alpha varyantı maskeden BLEND_RGBA_MULT ile bir kez boyanır, sqrt ve çizgi çağrıları tek blit'e iner.
+#
+# Not: Normal alpha blit (SRCALPHA -> SRCALPHA) pygame'in yavaş karışım yolunu kullanır ve
+# tek bir draw.circle'dan pahalıdır; RLE colorkey kopyası ise sadece dolu satır parçalarını kopyalar.
+# Kazanç çok katmanlı efektlerin tek kopyaya inmesinden gelir;
+# EnergyOrb (halka + top) ve Shockwave halkaları içi boş büyük sprite'lar olduğu için ölçümde
+# yavaşladı (~0.9x), onlar pygame.draw ile çizilmeye devam ediyor.
+
+ALPHA_STEPS = 32
+DEFAULT_MAX_BYTES = 24 * 1024 * 1024
+SCAN_STEP = 3    # Hologram scanline sıklığı (GhostTrail)
+MAX_LAYERS = 3   # Kalite kademesi glow katmanlarını azaltabilir: 3 tam, 2 dış glow yok, 1 sadece çekirdek
+CLEAR = (0, 0, 0, 0)
+
+
+def quantize_alpha(alpha):
+    """0-255 alpha'yı ALPHA_STEPS basamağa yuvarlar, temsilci alpha'yı döner"""
+    alpha = max(0, min(255, int(alpha)))
+    q = (alpha * (ALPHA_STEPS - 1) + 127) // 255
+    return q * 255 // (ALPHA_STEPS - 1)
+
+
+def _canvas(radius):
+    # Merkez (radius+1, radius+1): draw.circle'ın kenar pikselleri kesilmesin
+    size = 2 * radius + 2
+    return pygame.Surface((size, size), pygame.SRCALPHA), radius + 1
+
+
+class GlowAtlas:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.sprites = OrderedDict()
+        self.masks = {}   # (yarıçap, scanline aralığı) -> beyaz hologram maskesi; renklendirilmiş hali sprites'ta
+        self.layers = MAX_LAYERS
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, key, build, *args):
+        entry = self.sprites.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = build(*args)
+        surf = entry[0]
+        # pygame.draw gibi üzerine yaz: alpha karıştırma yok, çizilmemiş pikseller atlanır
+        surf.set_alpha(None)
+        surf.set_colorkey(CLEAR, pygame.RLEACCEL)
+        self.sprites[key] = entry
+        self.bytes_used += surf.get_width() * surf.get_height() * 4
+        while self.bytes_used > self.max_bytes and len(self.sprites) > 1:
+            _, (old, _) = self.sprites.popitem(last=False)
+            self.bytes_used -= old.get_width() * old.get_height() * 4
+            self.evictions += 1
+        return entry
+
+    # --- SPRITE TÜRLERİ ---
+    # Hepsi (surface, merkez_ofseti) döner; çizim: surface.blit(sprite, (x - ofset, y - ofset))
+
+    def spark(self, color, size, alpha):
+        # Dış glow'un çizilip çizilmeyeceği nicelenmemiş alpha'dan: eşik nicelemeyle kaymasın
+        glow = int(alpha * 0.15) > 5
+        alpha = quantize_alpha(alpha)
+        layers = self.layers
+        return self._get(('spark', color, size, alpha, layers, glow), self._build_spark, color, size, alpha, layers, glow)
+
+    def trail(self, color, size, life_ratio):
+        # TrailEffect boyutu float ve her kare küçülüyor: anahtar, çizilen tamsayı yarıçaplar
+        radii = (int(size * 2.5), int(size * 2.5 * (2 / 3.0)), int(size * 2.5 * (1 / 3.0)), int(max(1, size)))
+        alpha = quantize_alpha(255 * life_ratio)
+        layers = self.layers
+        return self._get(('trail', color, radii, alpha, layers), self._build_trail, color, radii, alpha / 255.0, layers)
+
+    def hologram(self, color, radius, alpha, scan_step=SCAN_STEP):
+        # Scanline disk + çerçeve: yarıçap başına bir maske, renk / alpha başına bir kez boyanır
+        alpha = quantize_alpha(alpha)
+        return self._get(('holo', color, radius, alpha, scan_step), self._build_hologram, color, radius, alpha, scan_step)
+
+    def scanline_mask(self, radius, scan_step=SCAN_STEP):
+        """Hologram efektlerinin ortak maskesi: beyaz, opak yatay çizgilerle dolu daire ve dış çerçevesi"""
+        key = (radius, scan_step)
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = self.masks[key] = self._build_scanline_mask(radius, scan_step)
+        return mask
+
+    def set_layers(self, layers):
+        """Glow katman sayısı (1..MAX_LAYERS); eski sprite'lar LRU ile kendiliğinden düşer"""
+        self.layers = max(1, min(MAX_LAYERS, int(layers)))
+
+    # --- ÜRETİCİLER (orijinal çizim kodunun aynısı) ---
+    def _build_spark(self, color, size, alpha, layers=MAX_LAYERS, glow=True):
+        r, g, b = color
+        glow_size = int(size * 2.5) if layers >= 3 else 0
+        mid_size = int(size * 1.5) if layers >= 2 else 0
+        # Katman azaldıkça sprite da küçülür (blit edilen piksel azalır)
+        surf, c = _canvas(max(glow_size, mid_size, size))
+        center = (c, c)
+        # 1. Glow (Büyük)
+        glow_alpha = int(alpha * 0.15)
+        if glow_size and glow:
+            pygame.draw.circle(surf, (r, g, b, glow_alpha), center, glow_size)
+        # 2. Orta (Sıcak)
+        if mid_size > 0:
+            pygame.draw.circle(surf, (min(255, r + 100), min(255, g + 100), min(255, b + 50), int(alpha * 0.5)), center, mid_size)
+        # 3. Çekirdek
+        if size > 0:
+            pygame.draw.circle(surf, (255, 255, 220, alpha), center, size)
+        return surf, c
+
+    def _build_trail(self, color, radii, life_ratio, layers=MAX_LAYERS):
+        body = radii[3]
+        # layers=3: üç glow halkası, 2: en dıştaki yok, 1: sadece gövde
+        glows = list(zip((3, 2, 1), radii[:3]))[MAX_LAYERS - layers:] if layers > 1 else []
+        surf, c = _canvas(max([body] + [g for _, g in glows]))
+        center = (c, c)
+        # Glow
+        for i, glow_size in glows:
+            glow_alpha = int(80 * life_ratio * (i / 3.0))
+            if glow_size > 0:
+                pygame.draw.circle(surf, (*color, glow_alpha), center, glow_size)
+        # Main body
+        pygame.draw.circle(surf, (*color, int(200 * life_ratio)), center, body)
+        return surf, c
+
+    @staticmethod
+    def _build_scanline_mask(radius, scan_step):
+        surf, c = _canvas(radius)
+        for dy in range(-radius, radius, scan_step):
+            if abs(dy) >= radius:
+                continue
+            # Daire formülü: x^2 + y^2 = r^2  => kiriş yarı uzunluğu
+            dx = int(math.sqrt(radius ** 2 - dy ** 2))
+            pygame.draw.line(surf, (255, 255, 255, 255), (c - dx, c + dy), (c + dx, c + dy), 1)
+        pygame.draw.circle(surf, (255, 255, 255, 255), (c, c), radius, 1)
+        return surf, c
+
+    def _build_hologram(self, color, radius, alpha, scan_step):
+        mask, c = self.scanline_mask(radius, scan_step)
+        surf = mask.copy()
+        surf.fill((*color, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        return surf, c
+
+    # --- YÖNETİM ---
+    def prewarm(self, colors, sizes=range(2, 9)):
+        """Bilinen renk/boyut kombinasyonlarını tüm alpha basamaklarında önceden üretir"""
+        for color in colors:
+            for size in sizes:
+                for q in range(ALPHA_STEPS):
+                    alpha = q * 255 // (ALPHA_STEPS - 1)
+                    self.spark(color, size, alpha)
+
+    def prewarm_trails(self, colors, sizes, life=12, dt=1 / 60.0):
+        """TrailEffect'in ömrü boyunca küçülerek üreteceği tüm sprite'ları önceden üretir"""
+        for color in colors:
+            for size in sizes:
+                remaining = life
+                while remaining > 0:
+                    self.trail(color, size, min(1.0, remaining / life))
+                    # TrailEffect.update ile aynı adım
+                    remaining -= dt * 12.0
+                    size = max(0.1, size * 0.96)
+
+    def clear(self):
+        self.sprites.clear()
+        self.masks.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.sprites),
+            'bytes': self.bytes_used,
+            'max_bytes': self.max_bytes,
+        }
+
+
+GLOW_ATLAS = GlowAtlas()
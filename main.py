@@ -1,139 +1,134 @@
-import pygame
+import time
+STARTUP_T0 = time.perf_counter()  # Açılış ölçümü (--startup-report) ağır importlardan önce başlar
+
 import sys
+# pygame.pkgdata, setuptools kuruluysa pkg_resources'ı import ediyor (~130 ms). Sadece varsayılan fontun
+# yolunu bulmak için kullanılıyor ve ImportError'da dosya yoluna düşüyor; import'u baştan kapatıyoruz.
+sys.modules.setdefault('pkg_resources', None)
+import pygame
+import json
 import random
-import math
-import os
+import argparse
 from settings import *
-from utils import generate_sound_effect, generate_ambient_fallback, load_sound_asset, draw_text, draw_animated_player
-from vfx import LightningBolt, FlameSpark, GhostTrail, SpeedLine, Shockwave, EnergyOrb, ParticleExplosion, ScreenFlash
-from entities import Platform, Star, CursedEnemy
-from ui_system import render_ui
-from animations import CharacterAnimator, TrailEffect
+from utils import generate_ambient_fallback, load_sound_asset, draw_animated_player
+from synth import make_sound
+from game_session import GameSession, FrameInput, QUALITY_PRESETS, METEOR_CORE, METEOR_FIRE, DASH_SPARK_COLORS
+from ui_system import render_ui, render_profiler_overlay, invalidate_static_layers, prewarm_ui_text
+from profiler import PROFILER
+from presenter import Presenter
+from sim_clock import FixedStepClock
+from asset_loader import AssetLoader
+from glow import GLOW_ATLAS
+from platform_cache import PLATFORM_CACHE
+from glitch_frames import GLITCH_FRAMES
+from vfx_layer import VfxLayer
+from quality_governor import QualityGovernor, QUALITY_TIERS
+from replay import Replay, ReplayRecorder, ReplayPlayer
 
 # --- 1. SİSTEM VE EKRAN AYARLARI ---
-pygame.init()
-pygame.mixer.pre_init(44100, -16, 2, 512)
-
-# Global Ekran (Pencere)
+# Oynanış durumu game_session.GameSession içinde yaşar. Bu dosya sadece pygame ön yüzüdür:
+# pencere, olaylar, ses, çizim ve ekrana basma.
+screen = None
+clock = None
+game_canvas = None
+vfx_layer = None
 current_display_w, current_display_h = LOGICAL_WIDTH, LOGICAL_HEIGHT
-screen = pygame.display.set_mode((current_display_w, current_display_h),
-                                pygame.SCALED | pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE, vsync=1)
-pygame.display.set_caption("Infinite Runner - METEOR DASH + RESOLUTION SCALER")
-clock = pygame.time.Clock()
 
-# Sanal Canvas (Oyun Mantığı için 1920x1080 Sabit)
-game_canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+def init_display():
+    global screen, clock, game_canvas, vfx_layer
+    # pygame.init() yerine sadece ilk kare için gerekenler: ses cihazı (ve kullanılmayan joystick vb.)
+    # açılışı geciktirmesin. Mixer, init_deferred() içinde ilk menü karesinden sonra açılır.
+    # pygame.time ilk clock.tick() ile kendiliğinden başlar.
+    pygame.display.init()
+    pygame.font.init()
+    pygame.mixer.pre_init(44100, -16, 2, 512)
 
-# VFX için yardımcı yüzey
-vfx_surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)
+    # Global Ekran (Pencere)
+    screen = pygame.display.set_mode((current_display_w, current_display_h),
+                                    pygame.SCALED | pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE, vsync=1)
+    pygame.display.set_caption("Infinite Runner - METEOR DASH + RESOLUTION SCALER")
+    clock = pygame.time.Clock()
+
+    # Sanal Canvas (Oyun Mantığı için 1920x1080 Sabit)
+    game_canvas = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+
+    # VFX için yardımcı yüzey
+    vfx_layer = VfxLayer((LOGICAL_WIDTH, LOGICAL_HEIGHT))
 
 # --- 2. SES AYARLARI ---
 FX_VOLUME = 0.7
-AMBIENT_CHANNEL = pygame.mixer.Channel(0)
-FX_CHANNEL = pygame.mixer.Channel(1)
-
-JUMP_SOUND = load_sound_asset("assets/sfx/jump.wav", lambda: generate_sound_effect(350, 90), FX_VOLUME * 0.9)
-DASH_SOUND = load_sound_asset("assets/sfx/dash.wav", lambda: generate_sound_effect(700, 60), FX_VOLUME * 1.1)
-SLAM_SOUND = load_sound_asset("assets/sfx/slam.wav", lambda: generate_sound_effect(100, 150, 0.7), FX_VOLUME * 1.5)
-EXPLOSION_SOUND = load_sound_asset("assets/sfx/explosion.wav", lambda: generate_sound_effect(50, 300, 0.5), FX_VOLUME * 1.2)
-GAME_MUSIC = load_sound_asset("assets/music/game_action_music.ogg", generate_ambient_fallback, 1.0)
-
-MAX_VFX_COUNT = 200
-MAX_DASH_VFX_PER_FRAME = 5
-METEOR_CORE = (255, 255, 200)
-METEOR_FIRE = (255, 80, 0)
-
-class WarpLine(pygame.sprite.Sprite):
-    def __init__(self, x, y, angle, color, theme_color=None):
-        super().__init__()
-        self.x, self.y = x, y
-        self.vx, self.vy = math.cos(angle) * 15, math.sin(angle) * 15
-        self.color = color
-        self.theme_color = theme_color
-        self.width = random.randint(2, 4)
-        self.length_multiplier = random.uniform(10.0, 18.0)
-        self.life = 8
-        self.alpha = 255
-
-    def update(self, camera_speed):
-        self.x -= camera_speed
-        self.x += self.vx * 0.8
-        self.y += self.vy * 0.8
-        self.life -= 1
-        self.alpha = int(255 * (self.life / 8))
-        if self.life <= 0:
-            self.kill()
-
-    def draw(self, surface):
-        draw_color = self.theme_color if self.theme_color else self.color
-        if self.alpha > 10:
-            end_x = self.x - (self.vx * self.length_multiplier * 1.5)
-            end_y = self.y - (self.vy * self.length_multiplier * 1.5)
-            pygame.draw.line(surface, (*draw_color, self.alpha // 3),
-                            (int(self.x), int(self.y)), (int(end_x), int(end_y)), self.width + 4)
-            pygame.draw.line(surface, (*draw_color, self.alpha),
-                            (int(self.x), int(self.y)), (int(end_x), int(end_y)), self.width)
+AMBIENT_CHANNEL = None
+FX_CHANNEL = None
+GAME_MUSIC = None
+SESSION_SOUNDS = {}  # GameSession olay adı -> Sound
+
+def init_audio():
+    global AMBIENT_CHANNEL, FX_CHANNEL
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    AMBIENT_CHANNEL = pygame.mixer.Channel(0)
+    FX_CHANNEL = pygame.mixer.Channel(1)
+
+def _set_music(sound):
+    global GAME_MUSIC
+    GAME_MUSIC = sound
+
+def queue_assets(loader):
+    """Sesleri havuzda, font / metin / glow cache ısındırmayı ve yıldız döşemelerini ana döngüde yükletir"""
+    # Ses dosyası çözme ve yedek sentez: iş parçacığı havuzu
+    for name, path, volume in (('jump', "assets/sfx/jump.wav", FX_VOLUME * 0.9),
+                               ('dash', "assets/sfx/dash.wav", FX_VOLUME * 1.1),
+                               ('slam', "assets/sfx/slam.wav", FX_VOLUME * 1.5),
+                               ('explosion', "assets/sfx/explosion.wav", FX_VOLUME * 1.2)):
+        loader.submit(f"Audio: {name}",
+                      lambda name=name, path=path, volume=volume: load_sound_asset(path, lambda: make_sound(name), volume),
+                      lambda sound, name=name: SESSION_SOUNDS.__setitem__(name, sound))
+    loader.submit("Audio: game music", lambda: load_sound_asset("assets/music/game_action_music.ogg", generate_ambient_fallback, 1.0),
+                  _set_music)
+
+    # pygame yüzey işleri: ana iş parçacığında, kare bütçesiyle
+    loader.submit_main("Fonts + HUD text", prewarm_ui_text)
+    loader.submit_main("Starfield tiles", lambda: session.starfield.build(game_canvas))
+    loader.submit_main("Enemy glitch frames", lambda: GLITCH_FRAMES.prewarm(((ENEMY_SIZE, ENEMY_SIZE),)))
+    for color in DASH_SPARK_COLORS + (PLAYER_SLAM,):
+        loader.submit_main(f"Glow sparks {color}", lambda color=color: GLOW_ATLAS.prewarm((color,)))
+    for color, sizes in ((METEOR_FIRE, range(8, 15)), (PLAYER_SLAM, range(8, 13))):
+        for size in sizes:
+            loader.submit_main(f"Glow trail {color} size {size}", lambda color=color, size=size: GLOW_ATLAS.prewarm_trails((color,), (size,)))
 
 # --- 3. DURUM DEĞİŞKENLERİ ---
-GAME_STATE = 'MENU' 
+GAME_STATE = 'MENU'
 
 game_settings = {
     'fullscreen': True,
-    'quality': 'HIGH',
+    'quality': 'AUTO',  # AUTO: QualityGovernor kare süresine göre seçer; diğerleri sabit kademe
     'res_index': 1, # Varsayılan: 1920x1080
     'fps_limit': 60,
     'fps_index': 1
 }
 current_fps = 60
 active_ui_elements = {}
+show_profiler = False
 
 loading_progress = 0.0
 loading_logs = []
-loading_timer = 0
-loading_stage = 0
-fake_log_messages = [
-    "Initializing Core Systems...",
-    "Scanning Hardware Configuration...",
-    "Allocating VRAM for Meteor VFX...",
-    "Pre-caching Particle Assets...",
-    "Compiling Shader Modules...",
-    "Synchronizing Audio Engine...",
-    "Calibrating Physics...",
-    "SYSTEM READY."
-]
-
-# Oyun Değişkenleri
-CURRENT_THEME = THEMES[0]
-CURRENT_SHAPE = 'circle'
-score = 0.0
-high_score = 0
-camera_speed = INITIAL_CAMERA_SPEED
-player_x, player_y = 150.0, float(LOGICAL_HEIGHT - 300)
-y_velocity = 0.0
-is_jumping = is_dashing = is_slamming = False
-slam_stall_timer = 0
-slam_cooldown = 0
-jumps_left = MAX_JUMPS
-dash_timer = 0
-dash_cooldown_timer = 0
-dash_vx = dash_vy = 0.0
-screen_shake = 0
-dash_particles_timer = 0
-dash_angle = 0.0
-dash_frame_counter = 0.0
-character_state = 'idle'
-slam_collision_check_frames = 0
-active_damage_waves = [] 
-
-character_animator = CharacterAnimator()
-trail_effects = []
-last_trail_time = 0.0
-TRAIL_INTERVAL = 3
-
-all_platforms = pygame.sprite.Group()
-all_enemies = pygame.sprite.Group()
-all_vfx = pygame.sprite.Group()
-stars = [Star() for _ in range(120)]
+ASSET_PUMP_MENU_MS = 2.0      # Menüdeyken kare başına ana iş parçacığı yükleme bütçesi
+ASSET_PUMP_LOADING_MS = 12.0  # LOADING ekranındayken
+
+session = None  # init_deferred() oluşturur (ilk menü karesine gerekmiyor)
+presenter = Presenter()
+asset_loader = AssetLoader()
+sim_clock = FixedStepClock()
+queued_input = FrameInput()  # Simülasyon adımı gelene kadar biriken girdi
+governor = QualityGovernor()
+QUALITY_MODES = ('AUTO',) + QUALITY_TIERS
+hitstop_ms = 0.0  # Bu karede hitstop için bilinçli beklenen süre (governor ölçümünden düşülür)
+
+# Replay: --record her koşuyu dosyaya yazar, --replay kaydı klavye yerine oturuma besler
+record_path = None
+recorder = None
+replay_player = None
+replay_speed = 1.0
 
 # --- YARDIMCI FONKSİYONLAR ---
 def apply_display_settings():
@@ -141,476 +136,408 @@ def apply_display_settings():
     Ekran modunu ve çözünürlüğü uygular.
     """
     global screen, current_display_w, current_display_h
-    
+
     target_res = AVAILABLE_RESOLUTIONS[game_settings['res_index']]
-    
+
     if game_settings['fullscreen']:
         current_display_w, current_display_h = LOGICAL_WIDTH, LOGICAL_HEIGHT
         flags = pygame.SCALED | pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE
     else:
         current_display_w, current_display_h = target_res
         flags = pygame.DOUBLEBUF | pygame.HWSURFACE
-    
-    screen = pygame.display.set_mode((current_display_w, current_display_h), flags, vsync=1)
 
-def add_new_platform(start_x=None):
-    if start_x is None:
-        if len(all_platforms) > 0:
-            rightmost = max(all_platforms, key=lambda p: p.rect.right)
-            gap = random.randint(GAP_MIN, GAP_MAX)
-            start_x = rightmost.rect.right + gap
-        else:
-            start_x = LOGICAL_WIDTH
-    width = random.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
-    y = random.choice(PLATFORM_HEIGHTS)
-    
-    new_plat = Platform(start_x, y, width, 50)
-    all_platforms.add(new_plat)
-    
-    if width > 120 and random.random() < 0.4:
-        enemy = CursedEnemy(new_plat)
-        all_enemies.add(enemy)
+    screen = pygame.display.set_mode((current_display_w, current_display_h), flags, vsync=1)
+    invalidate_static_layers()
+    presenter.release()
+
+def active_quality():
+    """Şu an geçerli kalite kademesi (AUTO ise governor'ın seçtiği)"""
+    quality = game_settings['quality']
+    return governor.tier if quality == 'AUTO' else quality
+
+def apply_quality(tier):
+    """Kademeyi oturuma (efekt sınırları, spawn oranı) ve glow atlas'ına uygular"""
+    if session is not None:
+        session.set_quality(tier)
+    GLOW_ATLAS.set_layers(QUALITY_PRESETS[tier]['glow_layers'])
+    if recorder is not None:
+        recorder.set_quality(tier)
 
 def start_loading_sequence():
-    global GAME_STATE, loading_progress, loading_logs, loading_timer, loading_stage
+    global GAME_STATE, loading_progress, loading_logs
     GAME_STATE = 'LOADING'
-    loading_progress = 0.0
-    loading_logs = []
-    loading_timer = 0
-    loading_stage = 0
-    
-    if game_settings['quality'] == 'LOW':
-        global MAX_VFX_COUNT, MAX_DASH_VFX_PER_FRAME
-        MAX_VFX_COUNT = 50
-        MAX_DASH_VFX_PER_FRAME = 2
-
-def init_game():
-    global player_x, player_y, y_velocity, score, camera_speed, jumps_left
-    global is_jumping, is_dashing, is_slamming, dash_timer, dash_cooldown_timer, slam_stall_timer, slam_cooldown
-    global CURRENT_THEME, CURRENT_SHAPE, screen_shake, dash_particles_timer, dash_angle, dash_frame_counter
-    global character_state, trail_effects, last_trail_time, slam_collision_check_frames, active_damage_waves
-
+    loading_progress = asset_loader.progress
+    loading_logs = asset_loader.logs
+
+def init_deferred():
+    """İlk menü karesi ekrana basıldıktan sonra: ses cihazı, oyun oturumu ve asset yükleme kuyruğu"""
+    global session
+    init_audio()
+    if session is None:
+        session = GameSession(active_quality())
+    queue_assets(asset_loader)
+
+def init_game(replay=None):
+    """Yeni koşu başlatır; replay verilirse onun tohumu ve kademesiyle, girdileri kayıttan gelir"""
+    global recorder, replay_player
     if GAME_MUSIC:
         AMBIENT_CHANNEL.play(GAME_MUSIC, loops=-1)
-    camera_speed = INITIAL_CAMERA_SPEED
-    player_x, player_y = 150.0, float(LOGICAL_HEIGHT - 300)
-    y_velocity = score = dash_timer = dash_cooldown_timer = screen_shake = slam_stall_timer = slam_cooldown = 0
-    is_jumping = is_dashing = is_slamming = False
-    jumps_left = MAX_JUMPS
-    dash_particles_timer = 0
-    dash_angle = 0.0
-    dash_frame_counter = 0.0
-    character_state = 'idle'
-    slam_collision_check_frames = 0
-    trail_effects.clear()
-    active_damage_waves.clear()
-    last_trail_time = 0.0
-
-    character_animator.__init__()
-
-    CURRENT_THEME = random.choice(THEMES)
-    CURRENT_SHAPE = random.choice(PLAYER_SHAPES)
-    all_platforms.empty()
-    all_enemies.empty()
-    all_vfx.empty()
-    
-    start_plat = Platform(0, LOGICAL_HEIGHT - 50, 400, 50)
-    all_platforms.add(start_plat)
-    current_right = 400
-    while current_right < LOGICAL_WIDTH + 200:
-        add_new_platform()
-        current_right = max(p.rect.right for p in all_platforms)
-
-# --- 5. ANA DÖNGÜ ---
-running = True
-last_time = pygame.time.get_ticks()
-frame_count = 0
-
-while running:
-    current_time = pygame.time.get_ticks()
-    dt = (current_time - last_time) / 1000.0
-    last_time = current_time
-    time_ms = current_time
-    frame_count += 1
-    frame_mul = max(0.001, dt) * 60.0
-
-    # --- MOUSE DÜZELTMESİ (ÖNEMLİ) ---
-    # Gerçek pencere koordinatlarını al
-    raw_mouse_pos = pygame.mouse.get_pos()
-    
-    # Pencerenin şu anki boyutu ile oyunun mantıksal boyutu arasındaki oranı bul
-    # Örnek: Pencere 640 ise, 1920/640 = 3 kat büyütmemiz lazım mouse koordinatını.
-    scale_x = LOGICAL_WIDTH / screen.get_width()
-    scale_y = LOGICAL_HEIGHT / screen.get_height()
-    
-    # Mouse'u oyunun mantıksal koordinatlarına çevir
-    mouse_pos = (raw_mouse_pos[0] * scale_x, raw_mouse_pos[1] * scale_y)
-
-    if frame_count % 30 == 0:
-        if len(all_vfx) > MAX_VFX_COUNT:
-             sprites = list(all_vfx.sprites())
-             for sprite in sprites[:20]:
-                 sprite.kill()
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-            
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if GAME_STATE == 'MENU':
-                if 'start' in active_ui_elements and active_ui_elements['start'].collidepoint(mouse_pos):
-                    start_loading_sequence()
-                elif 'settings' in active_ui_elements and active_ui_elements['settings'].collidepoint(mouse_pos):
-                    GAME_STATE = 'SETTINGS'
-                elif 'exit' in active_ui_elements and active_ui_elements['exit'].collidepoint(mouse_pos):
-                    running = False
-            
-            elif GAME_STATE == 'SETTINGS':
-                if 'toggle_fullscreen' in active_ui_elements and active_ui_elements['toggle_fullscreen'].collidepoint(mouse_pos):
-                    game_settings['fullscreen'] = not game_settings['fullscreen']
-                elif 'toggle_quality' in active_ui_elements and active_ui_elements['toggle_quality'].collidepoint(mouse_pos):
-                    game_settings['quality'] = 'LOW' if game_settings['quality'] == 'HIGH' else 'HIGH'
-                elif 'change_resolution' in active_ui_elements and active_ui_elements['change_resolution'].collidepoint(mouse_pos):
-                    game_settings['res_index'] = (game_settings['res_index'] + 1) % len(AVAILABLE_RESOLUTIONS)
-                elif 'change_fps' in active_ui_elements and active_ui_elements['change_fps'].collidepoint(mouse_pos):
-                    game_settings['fps_index'] = (game_settings['fps_index'] + 1) % len(FPS_LIMITS)
-                    game_settings['fps_limit'] = FPS_LIMITS[game_settings['fps_index']]
-                    current_fps = game_settings['fps_limit']
-                elif 'apply_changes' in active_ui_elements and active_ui_elements['apply_changes'].collidepoint(mouse_pos):
-                    apply_display_settings()
-                elif 'back' in active_ui_elements and active_ui_elements['back'].collidepoint(mouse_pos):
-                    GAME_STATE = 'MENU'
-
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                if GAME_STATE == 'PLAYING':
-                    GAME_STATE = 'MENU' 
-                    AMBIENT_CHANNEL.stop()
-                elif GAME_STATE in ['MENU', 'SETTINGS']:
-                    running = False
-
-            if event.key == pygame.K_p:
-                if GAME_STATE == 'PLAYING':
-                    GAME_STATE = 'PAUSED'
-                    AMBIENT_CHANNEL.pause()
-                elif GAME_STATE == 'PAUSED':
-                    GAME_STATE = 'PLAYING'
-                    AMBIENT_CHANNEL.unpause()
-
-            if GAME_STATE == 'GAME_OVER' and event.key == pygame.K_r:
-                init_game(); GAME_STATE = 'PLAYING'
-
-            if GAME_STATE == 'PLAYING':
-                px, py = int(player_x + 15), int(player_y + 15)
-                if event.key == pygame.K_w and jumps_left > 0 and not is_dashing:
-                    jumps_left -= 1
-                    is_jumping = True; is_slamming = False; y_velocity = -JUMP_POWER
-                    character_state = 'jumping'
-                    if JUMP_SOUND: FX_CHANNEL.play(JUMP_SOUND)
-                    all_vfx.add(ParticleExplosion(px, py, CURRENT_THEME["player_color"], 6))
-                    for _ in range(2):
-                        all_vfx.add(EnergyOrb(px + random.randint(-10, 10),
-                                                py + random.randint(-10, 10),
-                                                CURRENT_THEME["border_color"], 4, 15))
-
-                if event.key == pygame.K_s and is_jumping and not is_dashing and not is_slamming and slam_cooldown <= 0:
-                    is_slamming = True
-                    slam_stall_timer = 15
-                    slam_cooldown = 120
-                    y_velocity = 0
-                    character_state = 'slamming'
-                    slam_collision_check_frames = 0
-                    if SLAM_SOUND: FX_CHANNEL.play(SLAM_SOUND)
-                    all_vfx.add(ScreenFlash(PLAYER_SLAM, 80, 8))
-                    all_vfx.add(Shockwave(px, py, PLAYER_SLAM, max_radius=200, rings=3, speed=25))
-                    
-                    for _ in range(3):
-                        all_vfx.add(LightningBolt(px, py,
-                                                    px + random.randint(-60, 60),
-                                                    py + random.randint(-60, 60),
-                                                    PLAYER_SLAM, 12))
-
-                if event.key == pygame.K_SPACE and dash_cooldown_timer <= 0 and not is_dashing:
-                    is_dashing = True
-                    dash_timer = DASH_DURATION
-                    dash_cooldown_timer = DASH_COOLDOWN
-                    screen_shake = 8
-                    dash_particles_timer = 0
-                    dash_frame_counter = 0.0
-                    character_state = 'dashing'
-                    if DASH_SOUND: FX_CHANNEL.play(DASH_SOUND)
-                    all_vfx.add(ScreenFlash(METEOR_CORE, 80, 6))
-                    all_vfx.add(Shockwave(px, py, METEOR_FIRE, max_radius=120, rings=2, speed=15))
-                    
-                    keys = pygame.key.get_pressed()
-                    dx = (keys[pygame.K_d] - keys[pygame.K_a]); dy = (keys[pygame.K_s] - keys[pygame.K_w])
-                    if dx == 0 and dy == 0: dx = 1
-                    mag = math.sqrt(dx*dx + dy*dy)
-                    dash_vx, dash_vy = (dx/mag)*DASH_SPEED, (dy/mag)*DASH_SPEED
-                    is_jumping = True; y_velocity = 0
-                    dash_angle = math.atan2(dash_vy, dash_vx)
-
-    # --- OYUN LOJİĞİ ---
-    if GAME_STATE == 'LOADING':
-        loading_timer += 1
-        if loading_timer % random.randint(20, 45) == 0 and loading_stage < len(fake_log_messages):
-            loading_logs.append(fake_log_messages[loading_stage])
-            loading_stage += 1
-            loading_progress = min(0.95, loading_stage / len(fake_log_messages))
-        if loading_stage >= len(fake_log_messages):
-            loading_progress += 0.01 
-            if loading_progress >= 1.0:
-                init_game()
-                GAME_STATE = 'PLAYING'
-
-    elif GAME_STATE == 'PLAYING':
-        camera_speed = min(MAX_CAMERA_SPEED, camera_speed + SPEED_INCREMENT_RATE * frame_mul)
-        score += 0.1 * camera_speed * frame_mul
-
-        old_x, old_y = player_x, player_y
-        keys = pygame.key.get_pressed()
-        horizontal_move = keys[pygame.K_d] - keys[pygame.K_a]
-        if horizontal_move != 0 and not is_dashing and not is_slamming:
-            character_state = 'running'
-        elif not is_jumping and not is_dashing and not is_slamming:
-            character_state = 'idle'
-
-        is_grounded = not is_jumping and not is_slamming and not is_dashing
-        character_animator.update(dt, character_state, is_grounded, y_velocity, is_dashing, is_slamming)
-
-        last_trail_time += frame_mul
-        if last_trail_time >= TRAIL_INTERVAL and (is_dashing or is_slamming):
-            last_trail_time = 0.0
-            trail_color = CURRENT_THEME["player_color"]
-            if is_dashing:
-                trail_color = METEOR_FIRE
-                trail_size = random.randint(8, 14)
-            elif is_slamming:
-                trail_color = PLAYER_SLAM
-                trail_size = random.randint(8, 12)
-            trail_effects.append(TrailEffect(player_x + 15, player_y + 15, trail_color, trail_size, life=12))
-
-        for wave in active_damage_waves[:]:
-            wave['r'] += wave['speed'] * frame_mul
-            wave['x'] -= camera_speed * frame_mul
-            for enemy in all_enemies:
-                dist = math.sqrt((enemy.rect.centerx - wave['x'])**2 + (enemy.rect.centery - wave['y'])**2)
-                if dist < wave['r'] + 20 and dist > wave['r'] - 40:
-                    enemy.kill()
-                    score += 500
-                    all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20))
-                    all_vfx.add(ScreenFlash(CURSED_PURPLE, 30, 2))
-            if wave['r'] > wave['max_r']:
-                active_damage_waves.remove(wave)
-
-        if is_dashing:
-            px, py = int(player_x + 15), int(player_y + 15)
-            dash_frame_counter += frame_mul
-            for _ in range(4):
-                inv_angle = dash_angle + math.pi + random.uniform(-0.5, 0.5)
-                spark_speed = random.uniform(5, 15)
-                color = random.choice([(255, 50, 0), (255, 150, 0), (255, 255, 100)])
-                all_vfx.add(FlameSpark(px, py, inv_angle, spark_speed, color, life=20, size=random.randint(4, 8)))
-
-            if int(dash_frame_counter) % 5 == 0:
-                all_vfx.add(Shockwave(px, py, (255, 200, 100), max_radius=70, width=2, speed=10))
-
-            meteor_hit_radius = 120
-            enemy_hits_aoe = [e for e in all_enemies if math.sqrt((e.rect.centerx - px)**2 + (e.rect.centery - py)**2) < meteor_hit_radius]
-            for enemy in enemy_hits_aoe:
-                enemy.kill()
-                score += 500
-                screen_shake = 10
-                if EXPLOSION_SOUND: FX_CHANNEL.play(EXPLOSION_SOUND)
-                all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, METEOR_FIRE, 25))
-                all_vfx.add(Shockwave(enemy.rect.centerx, enemy.rect.centery, (255, 100, 0), max_radius=90, width=4))
-
-            if dash_particles_timer > 0:
-                dash_particles_timer -= frame_mul
-            else:
-                dash_particles_timer = 4
-                offset_x = random.randint(-5, 5)
-                offset_y = random.randint(-5, 5)
-                all_vfx.add(WarpLine(px + offset_x, py + offset_y, dash_angle + random.uniform(-0.15, 0.15), METEOR_CORE, METEOR_FIRE))
-
-            player_x += dash_vx * frame_mul
-            player_y += dash_vy * frame_mul
-            player_x -= camera_speed * frame_mul
-            dash_timer -= frame_mul
-            if dash_timer <= 0:
-                is_dashing = False
-                y_velocity = 0
-                character_state = 'idle'
-
-        elif is_slamming and slam_stall_timer > 0:
-            slam_stall_timer -= frame_mul
-            slam_collision_check_frames += 1
-            if int(slam_stall_timer) % 3 == 0:
-                for _ in range(2):
-                    angle = random.uniform(0, math.pi * 2)
-                    dist = random.randint(20, 40)
-                    ex = player_x + 15 + math.cos(angle) * dist
-                    ey = player_y + 15 + math.sin(angle) * dist
-                    all_vfx.add(FlameSpark(ex, ey, angle + math.pi, dist/10, PLAYER_SLAM, life=15))
-
-            vibration = random.randint(-1, 1) if slam_stall_timer > 7 else 0
-            player_x += vibration
-            if slam_stall_timer <= 0:
-                y_velocity = 30
-                screen_shake = 12
-                all_vfx.add(ParticleExplosion(player_x+15, player_y+15, PLAYER_SLAM, 12))
-
-        else:
-            player_x -= camera_speed * frame_mul
-            if keys[pygame.K_a]: player_x -= PLAYER_SPEED * frame_mul
-            if keys[pygame.K_d]: player_x += PLAYER_SPEED * frame_mul
-            player_y += y_velocity * frame_mul
-            if is_slamming:
-                y_velocity += SLAM_GRAVITY * 1.8 * frame_mul
-            else:
-                y_velocity += GRAVITY * frame_mul
-
-        if dash_cooldown_timer > 0: dash_cooldown_timer -= frame_mul
-        if slam_cooldown > 0: slam_cooldown -= frame_mul
-        if screen_shake > 0: screen_shake -= 1
-
-        PLAYER_W, PLAYER_H = 30, 30
-        player_rect = pygame.Rect(int(player_x), int(player_y), PLAYER_W, PLAYER_H)
-        
-        dummy_player = type('',(object,),{'rect':player_rect})()
-        enemy_hits = pygame.sprite.spritecollide(dummy_player, all_enemies, False)
-        for enemy in enemy_hits:
-            if is_dashing or is_slamming:
-                enemy.kill()
-                score += 500
-                screen_shake = 15
-                if EXPLOSION_SOUND: FX_CHANNEL.play(EXPLOSION_SOUND)
-                all_vfx.add(ParticleExplosion(enemy.rect.centerx, enemy.rect.centery, CURSED_PURPLE, 20))
-                all_vfx.add(Shockwave(enemy.rect.centerx, enemy.rect.centery, GLITCH_BLACK, max_radius=80, width=5))
-                pygame.time.delay(30) 
-            else:
-                GAME_STATE = 'GAME_OVER'
-                high_score = max(high_score, int(score))
-                AMBIENT_CHANNEL.stop()
-                all_vfx.add(ParticleExplosion(player_x, player_y, CURSED_RED, 30))
-        
-        move_rect = pygame.Rect(int(player_x), int(min(old_y, player_y)), PLAYER_W, int(abs(player_y - old_y)) + PLAYER_H)
-        collided_platforms = pygame.sprite.spritecollide(type('',(object,),{'rect':move_rect})(), all_platforms, False)
-        
-        for p in collided_platforms:
-            platform_top = p.rect.top
-            if (old_y + PLAYER_H <= platform_top + 15) and (player_y + PLAYER_H >= platform_top):
-                player_y = platform_top - PLAYER_H
-                if is_slamming:
-                    y_velocity = -15
-                    screen_shake = 30
-                    active_damage_waves.append({'x': player_x + 15, 'y': platform_top, 'r': 10, 'max_r': 250, 'speed': 25})
-                    for i in range(2):
-                        wave = Shockwave(player_x+15, p.rect.top, (255, 180, 80), speed=25)
-                        wave.radius = 30 + i*30; wave.max_radius = 200 + i*60
-                        all_vfx.add(wave)
-                    all_vfx.add(ParticleExplosion(player_x+15, p.rect.top, PLAYER_SLAM, 25))
-                    is_slamming = False
-                    is_jumping = True
-                    jumps_left = MAX_JUMPS - 1
-                    character_state = 'jumping'
-                else:
-                    y_velocity = 0
-                    is_jumping = is_slamming = False
-                    jumps_left = MAX_JUMPS
-                    character_state = 'idle'
-                    all_vfx.add(ParticleExplosion(player_x+15, player_y+30, CURRENT_THEME["player_color"], 8))
-                break
-
-        all_platforms.update(camera_speed * frame_mul)
-        all_enemies.update(camera_speed * frame_mul)
-        for s in stars: s.update(camera_speed * frame_mul)
-        all_vfx.update(camera_speed * frame_mul)
-        for trail in trail_effects[:]:
-            try: trail.update(camera_speed * frame_mul, dt)
-            except: trail.update(camera_speed * frame_mul)
-            if trail.life <= 0: trail_effects.remove(trail)
-
-        if len(all_platforms) > 0 and max(p.rect.right for p in all_platforms) < LOGICAL_WIDTH + 100:
-            add_new_platform()
-        if player_x < -50 or player_y > LOGICAL_HEIGHT + 100:
+    governor.reset()  # Kademe korunur, ölçüm penceresi yeni koşuyla başlar
+    if replay is not None:
+        # Kayıttaki kademe (ve değişimleri) uygulanır, governor kapalı; kullanıcının ayarı game_settings'te kalır
+        apply_quality(replay.quality)
+        replay_player = ReplayPlayer(replay, session)  # reset(replay.seed)
+    else:
+        replay_player = None
+        apply_quality(active_quality())
+        session.reset()
+        if record_path:
+            recorder = ReplayRecorder(session.seed, active_quality())
+    PLATFORM_CACHE.prewarm(session.theme, (PLATFORM_THICKNESS,))  # Tema belli: tüm genişlikler ilk kareden önce
+    sim_clock.reset()
+    queued_input.clear_actions()
+    invalidate_static_layers()  # Yeni tema
+
+def handle_session_events():
+    """GameSession'ın biriktirdiği yan etkileri (ses, hitstop, game over) uygular"""
+    global GAME_STATE, hitstop_ms
+    for event in session.pop_events():
+        sound = SESSION_SOUNDS.get(event)
+        if sound:
+            FX_CHANNEL.play(sound)
+        elif event == 'hitstop':
+            pygame.time.delay(30)
+            hitstop_ms += 30.0
+        elif event == 'game_over':
             GAME_STATE = 'GAME_OVER'
-            high_score = max(high_score, int(score))
             AMBIENT_CHANNEL.stop()
-
-    # --- ÇİZİM ---
-    # 1. Adım: Tüm oyun öğelerini VE UI'ı "game_canvas"a çiz
-    
-    if GAME_STATE in ['MENU', 'SETTINGS', 'LOADING']:
-        game_canvas.fill(DARK_BLUE)
-        for s in stars:
-            s.draw(game_canvas)
-            s.update(0.5)
-    else:
-        # Oyun İçi Çizim
-        anim_params = character_animator.get_draw_params()
-        anim_offset = anim_params.get('screen_shake_offset', (0,0))
-        global_offset = (random.randint(-screen_shake, screen_shake), random.randint(-screen_shake, screen_shake)) if screen_shake > 0 else (0,0)
-        render_offset = (global_offset[0] + int(anim_offset[0]), global_offset[1] + int(anim_offset[1]))
-
-        game_canvas.fill(CURRENT_THEME["bg_color"])
-        for s in stars: s.draw(game_canvas)
-        vfx_surface.fill((0, 0, 0, 0))
-        
-        for p in all_platforms: p.draw(game_canvas, CURRENT_THEME)
-        for e in all_enemies: e.draw(game_canvas)
-        for v in all_vfx: v.draw(vfx_surface)
-        for trail in trail_effects: trail.draw(vfx_surface)
-
-        if GAME_STATE in ('PLAYING', 'PAUSED', 'GAME_OVER') and GAME_STATE != 'GAME_OVER':
-            p_color = CURRENT_THEME["player_color"]
-            if is_dashing: p_color = METEOR_CORE
-            elif is_slamming: p_color = PLAYER_SLAM
-            modified_color = character_animator.get_modified_color(p_color)
-            
-            draw_animated_player(
-                game_canvas, CURRENT_SHAPE,
-                int(player_x + 15) + render_offset[0], int(player_y + 15) + render_offset[1], 15,
-                modified_color, anim_params
-            )
-            
-        game_canvas.blit(vfx_surface, render_offset)
-
-    # UI ÇİZİMİ (Burada dönüştürülmüş mouse_pos kullanılıyor)
-    ui_data = {
-        'theme': CURRENT_THEME if 'CURRENT_THEME' in locals() else None, 
-        'score': score, 
-        'high_score': high_score,
-        'dash_cd': dash_cooldown_timer, 
-        'slam_cd': slam_cooldown, 
+            finish_recording()
+            if replay_player is not None:
+                finish_replay()  # Kayıt bitmeden ölündüyse replay sapmıştır: özet DESYNC'i gösterir
+
+def stop_replay():
+    """Replay oynatmayı bırakır ve kullanıcının kalite ayarını geri yükler"""
+    global replay_player
+    replay_player = None
+    apply_quality(active_quality())
+
+def finish_replay():
+    """Replay'in sonucunu yazar ve oyunu kapatır (--replay bitince çıkar)"""
+    print(f"[replay] {replay_player.summary()}")
+    stop_replay()
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+def finish_recording():
+    """Kaydedilen koşuyu --record dosyasına yazar (son koşu dosyada kalır)"""
+    global recorder
+    if recorder is None:
+        return
+    replay = recorder.finish(session)
+    recorder = None
+    if len(replay):
+        replay.save(record_path)
+        print(f"[replay] seed {replay.seed}, {len(replay)} steps -> {record_path}")
+
+def make_ui_data(time_ms):
+    """render_ui için bu karenin verisini toplar"""
+    data = {
         'time_ms': time_ms,
         'settings': game_settings, # Menü için
         'progress': loading_progress, # Loading için
         'logs': loading_logs # Loading için
     }
-    
-    # Doğrudan game_canvas üzerine çiziyoruz ve düzeltilmiş mouse_pos gönderiyoruz
-    active_ui_elements = render_ui(game_canvas, GAME_STATE, ui_data, mouse_pos)
-
-    # 2. Adım: "Quality" ayarına ve "Fullscreen" durumuna göre işlem
+    if session is not None:  # İlk menü karesinde oturum henüz yok
+        data.update(theme=session.theme, score=session.score, high_score=session.high_score,
+                    dash_cd=session.dash_cooldown_timer, slam_cd=session.slam_cooldown)
+    return data
+
+def get_render_params(session):
+    """Animasyon parametrelerini ve bu karenin ekran sarsıntısı ofsetini döner"""
+    anim_params = session.character_animator.get_draw_params()
+    anim_offset = anim_params.get('screen_shake_offset', (0,0))
+    screen_shake = session.screen_shake
+    global_offset = (random.randint(-screen_shake, screen_shake), random.randint(-screen_shake, screen_shake)) if screen_shake > 0 else (0,0)
+    render_offset = (global_offset[0] + int(anim_offset[0]), global_offset[1] + int(anim_offset[1]))
+    return anim_params, render_offset
+
+def interpolation_offset(session, alpha):
+    """Son simülasyon adımından bu yana geçen kısım için dünyanın henüz kaymamış payı (px)"""
+    return int((1.0 - alpha) * session.last_scroll)
+
+def draw_world(canvas, session, anim_params, render_offset, draw_player=True, alpha=1.0):
+    """Arka plan, yıldızlar, platformlar, düşmanlar ve oyuncuyu canvas'a çizer.
+    alpha < 1 ise dünya önceki ve şimdiki adım arasında interpolasyonla çizilir."""
+    theme = session.theme
+    canvas.fill(theme["bg_color"])
+    world_dx = interpolation_offset(session, alpha)
+    session.starfield.draw(canvas, world_dx)
+
+    for p in session.all_platforms: p.draw(canvas, theme, world_dx)
+    for e in session.all_enemies: e.draw(canvas, world_dx)
+
+    if draw_player:
+        p_color = theme["player_color"]
+        if session.is_dashing: p_color = METEOR_CORE
+        elif session.is_slamming: p_color = PLAYER_SLAM
+        modified_color = session.character_animator.get_modified_color(p_color)
+
+        px = session.prev_player_x + (session.player_x - session.prev_player_x) * alpha
+        py = session.prev_player_y + (session.player_y - session.prev_player_y) * alpha
+        draw_animated_player(
+            canvas, session.shape,
+            int(px + 15) + render_offset[0], int(py + 15) + render_offset[1], 15,
+            modified_color, anim_params
+        )
+
+def draw_vfx(canvas, vfx_layer, session, render_offset, alpha=1.0):
+    """VFX katmanında önceki karenin kirli bölgelerini temizler, efektleri çizer ve sadece bu kare
+    kirlenen bölgeleri canvas'a birleştirir"""
+    surface = vfx_layer.begin()
+    dirty = vfx_layer.dirty
+    session.all_vfx.draw(surface, dirty)
+    session.particles.draw(surface, dirty)
+    for trail in session.trail_effects: vfx_layer.mark(trail.draw(surface))
+    # Efektler de kamerayla kayıyor: katmanı dünyayla aynı interpolasyon payıyla birleştir
+    # Tüm ekran flash'ları tek renk / alpha olarak en üste, tek geçişte
+    vfx_layer.composite(canvas, (render_offset[0] + interpolation_offset(session, alpha), render_offset[1]),
+                        session.all_vfx.flash())
+
+def render_frame(canvas, vfx_layer, session, draw_player=True, alpha=1.0):
+    """Oyun içi sahnenin tamamını canvas'a çizer"""
+    anim_params, render_offset = get_render_params(session)
+    with PROFILER.span('draw_world'):
+        draw_world(canvas, session, anim_params, render_offset, draw_player, alpha)
+    with PROFILER.span('draw_vfx'):
+        draw_vfx(canvas, vfx_layer, session, render_offset, alpha)
+
+def present_canvas(canvas):
+    """Canvas'ı seçili kalite/çözünürlük ayarına göre ekrana basar (flip hariç)"""
+    # "Quality" ayarına ve "Fullscreen" durumuna göre işlem
     target_res = AVAILABLE_RESOLUTIONS[game_settings['res_index']]
-    
-    if game_settings['fullscreen']:
-        # FULLSCREEN: Görüntü kalitesini düşürerek tüm ekrana yay (Retro/Piksel etkisi)
-        if target_res != (LOGICAL_WIDTH, LOGICAL_HEIGHT):
-            scaled_small = pygame.transform.scale(game_canvas, target_res)
-            final_game_image = pygame.transform.scale(scaled_small, screen.get_size())
-        else:
-            final_game_image = pygame.transform.scale(game_canvas, screen.get_size())
-    else:
-        # WINDOWED: Pencere boyutuna göre ölçekle ama kaliteyi koru
-        final_game_image = pygame.transform.scale(game_canvas, screen.get_size())
 
-    # 3. Adım: Son oyunu ekrana bas
-    screen.blit(final_game_image, (0, 0))
+    # FULLSCREEN: Görüntü kalitesini düşürerek tüm ekrana yay (Retro/Piksel etkisi)
+    # WINDOWED: Pencere boyutuna göre ölçekle ama kaliteyi koru
+    low_res = target_res if game_settings['fullscreen'] else None
+    presenter.present(canvas, screen, low_res)
+
+# --- 5. ANA DÖNGÜ ---
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Infinite Runner")
+    parser.add_argument('--trace', metavar='DOSYA',
+                        help="profilleyiciyi açar, çıkışta ring buffer'ı Chrome trace-event JSON olarak yazar")
+    parser.add_argument('--startup-report', metavar='DOSYA',
+                        help="açılış sürelerini JSON olarak yazar ve asset'ler hazır olunca çıkar (bench.startup)")
+    parser.add_argument('--record', metavar='DOSYA', help="her koşunun tohumunu ve girdilerini replay olarak yazar")
+    parser.add_argument('--replay', metavar='DOSYA', help="replay'i menüyü atlayarak oynatır, bitince çıkar")
+    parser.add_argument('--replay-speed', type=float, default=1.0, metavar='X',
+                        help="oynatma hızı çarpanı (render karesi başına X kat simülasyon adımı)")
+    return parser.parse_known_args(argv)[0]
+
+def write_startup_report(path, marks):
+    """Açılış işaretlerini (STARTUP_T0'dan itibaren ms) JSON olarak yazar"""
+    report = {name: round((t - STARTUP_T0) * 1000.0, 2) for name, t in marks.items() if name != 'first_frame_epoch'}
+    report['first_frame_epoch'] = marks['first_frame_epoch']
+    report['frozen'] = bool(getattr(sys, 'frozen', False))
+    with open(path, 'w') as f:
+        json.dump(report, f)
+
+def main():
+    global GAME_STATE, current_fps, active_ui_elements, show_profiler
+    global loading_progress, loading_logs, hitstop_ms
+    global record_path, replay_player, replay_speed
+
+    args = parse_args()
+    if args.trace:
+        PROFILER.set_enabled(True)
+    record_path = args.record
+    pending_replay = Replay.load(args.replay) if args.replay else None
+    if pending_replay is not None:
+        replay_speed = max(0.1, args.replay_speed)
+        sim_clock.max_steps = max(sim_clock.max_steps, int(sim_clock.max_steps * replay_speed))
+
+    startup = {'main': time.perf_counter()}
+    init_display()
+    startup['display'] = time.perf_counter()
+    first_frame = True
+
+    running = True
+    last_time = pygame.time.get_ticks()
+
+    while running:
+        PROFILER.begin_frame()
+        frame_start = time.perf_counter()
+        hitstop_ms = 0.0
+        current_time = pygame.time.get_ticks()
+        dt = (current_time - last_time) / 1000.0
+        last_time = current_time
+        time_ms = current_time
+
+        # --- MOUSE DÜZELTMESİ (ÖNEMLİ) ---
+        # Gerçek pencere koordinatlarını al
+        raw_mouse_pos = pygame.mouse.get_pos()
+
+        # Pencerenin şu anki boyutu ile oyunun mantıksal boyutu arasındaki oranı bul
+        # Örnek: Pencere 640 ise, 1920/640 = 3 kat büyütmemiz lazım mouse koordinatını.
+        scale_x = LOGICAL_WIDTH / screen.get_width()
+        scale_y = LOGICAL_HEIGHT / screen.get_height()
+
+        # Mouse'u oyunun mantıksal koordinatlarına çevir
+        mouse_pos = (raw_mouse_pos[0] * scale_x, raw_mouse_pos[1] * scale_y)
+
+        PROFILER.begin('event_pump')
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if GAME_STATE == 'MENU':
+                    if 'start' in active_ui_elements and active_ui_elements['start'].collidepoint(mouse_pos):
+                        start_loading_sequence()
+                    elif 'settings' in active_ui_elements and active_ui_elements['settings'].collidepoint(mouse_pos):
+                        GAME_STATE = 'SETTINGS'
+                    elif 'exit' in active_ui_elements and active_ui_elements['exit'].collidepoint(mouse_pos):
+                        running = False
+
+                elif GAME_STATE == 'SETTINGS':
+                    if 'toggle_fullscreen' in active_ui_elements and active_ui_elements['toggle_fullscreen'].collidepoint(mouse_pos):
+                        game_settings['fullscreen'] = not game_settings['fullscreen']
+                    elif 'toggle_quality' in active_ui_elements and active_ui_elements['toggle_quality'].collidepoint(mouse_pos):
+                        mode = QUALITY_MODES.index(game_settings['quality'])
+                        game_settings['quality'] = QUALITY_MODES[(mode + 1) % len(QUALITY_MODES)]
+                        apply_quality(active_quality())
+                    elif 'change_resolution' in active_ui_elements and active_ui_elements['change_resolution'].collidepoint(mouse_pos):
+                        game_settings['res_index'] = (game_settings['res_index'] + 1) % len(AVAILABLE_RESOLUTIONS)
+                    elif 'change_fps' in active_ui_elements and active_ui_elements['change_fps'].collidepoint(mouse_pos):
+                        game_settings['fps_index'] = (game_settings['fps_index'] + 1) % len(FPS_LIMITS)
+                        game_settings['fps_limit'] = FPS_LIMITS[game_settings['fps_index']]
+                        current_fps = game_settings['fps_limit']
+                    elif 'apply_changes' in active_ui_elements and active_ui_elements['apply_changes'].collidepoint(mouse_pos):
+                        apply_display_settings()
+                    elif 'back' in active_ui_elements and active_ui_elements['back'].collidepoint(mouse_pos):
+                        GAME_STATE = 'MENU'
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    show_profiler = not show_profiler
+                    PROFILER.set_enabled(show_profiler or bool(args.trace))
+
+                if event.key == pygame.K_ESCAPE:
+                    if GAME_STATE == 'PLAYING':
+                        GAME_STATE = 'MENU'
+                        AMBIENT_CHANNEL.stop()
+                        finish_recording()
+                        if replay_player is not None:
+                            stop_replay()
+                    elif GAME_STATE in ['MENU', 'SETTINGS']:
+                        running = False
+
+                if event.key == pygame.K_p:
+                    if GAME_STATE == 'PLAYING':
+                        GAME_STATE = 'PAUSED'
+                        AMBIENT_CHANNEL.pause()
+                    elif GAME_STATE == 'PAUSED':
+                        GAME_STATE = 'PLAYING'
+                        AMBIENT_CHANNEL.unpause()
+
+                if GAME_STATE == 'GAME_OVER' and event.key == pygame.K_r:
+                    init_game(); GAME_STATE = 'PLAYING'
+        PROFILER.end()
+
+        # --- OYUN LOJİĞİ ---
+        if GAME_STATE == 'LOADING':
+            loading_progress = asset_loader.progress
+            loading_logs = asset_loader.logs
+            if session is not None and asset_loader.done:
+                init_game(pending_replay)
+                pending_replay = None
+                GAME_STATE = 'PLAYING'
+
+        elif GAME_STATE == 'PLAYING':
+            with PROFILER.span('playing_logic'):
+                # Sabit adımlı simülasyon: render FPS'i ne olursa olsun oyun 60 Hz adımlarla ilerler
+                queued_input.absorb(FrameInput.from_pygame(pygame.key.get_pressed(), events))
+                for _ in range(sim_clock.advance(dt * replay_speed)):
+                    if replay_player is not None:
+                        if not replay_player.step(sim_clock.step_dt):
+                            break
+                    else:
+                        session.step(queued_input, sim_clock.step_dt)
+                        if recorder is not None:
+                            recorder.record(queued_input, session)
+                    queued_input.clear_actions()
+                    handle_session_events()
+                if replay_player is not None and replay_player.done:
+                    finish_replay()
+
+        # --- ÇİZİM ---
+        # 1. Adım: Tüm oyun öğelerini VE UI'ı "game_canvas"a çiz
+
+        if GAME_STATE in ['MENU', 'SETTINGS', 'LOADING']:
+            # Bu ekranların katmanı canvas'ı tamamen örtüyor: yıldızlar sadece güncellenir, çizilmez
+            if session is not None:
+                session.starfield.update(0.5)
+        elif GAME_STATE == 'PLAYING':
+            # Oyun İçi Çizim (PAUSED / GAME_OVER ekranları da opak, altlarına dünya çizmeye gerek yok)
+            render_frame(game_canvas, vfx_layer, session, alpha=sim_clock.alpha)
+
+        # UI ÇİZİMİ (Burada dönüştürülmüş mouse_pos kullanılıyor)
+        ui_data = make_ui_data(time_ms)
+
+        # Doğrudan game_canvas üzerine çiziyoruz ve düzeltilmiş mouse_pos gönderiyoruz
+        with PROFILER.span('render_ui'):
+            active_ui_elements = render_ui(game_canvas, GAME_STATE, ui_data, mouse_pos)
+            if show_profiler:
+                render_profiler_overlay(game_canvas, PROFILER, 1000.0 / current_fps,
+                                        governor if game_settings['quality'] == 'AUTO' else None, active_quality(),
+                                        session.all_vfx.budget_stats() if session is not None else None)
+
+        # 2. Adım: Ölçekle ve ekrana bas
+        with PROFILER.span('transform_scale'):
+            present_canvas(game_canvas)
+
+        with PROFILER.span('display_flip'):
+            pygame.display.flip()
+
+        if first_frame:
+            # Menü ekranda: ertelenen ilklendirme artık kullanıcıyı bekletmiyor
+            first_frame = False
+            startup['first_frame'] = time.perf_counter()
+            startup['first_frame_epoch'] = time.time()
+            init_deferred()
+            startup['deferred'] = time.perf_counter()
+            if pending_replay is not None:
+                start_loading_sequence()  # Menü atlanır: asset'ler hazır olunca replay başlar
+
+        if not asset_loader.done:
+            # Yükleme ilk menü karesinden sonra başlar ve karenin kalan süresini kullanır;
+            # LOADING ekranı sadece kalanını bekler
+            with PROFILER.span('asset_load'):
+                asset_loader.pump(ASSET_PUMP_LOADING_MS if GAME_STATE == 'LOADING' else ASSET_PUMP_MENU_MS)
+
+        if GAME_STATE == 'PLAYING' and game_settings['quality'] == 'AUTO' and replay_player is None:
+            # İş süresi: clock.tick beklemesi ve hitstop hariç
+            work_ms = (time.perf_counter() - frame_start) * 1000.0 - hitstop_ms
+            new_tier = governor.observe(work_ms, 1000.0 / current_fps)
+            if new_tier:
+                apply_quality(new_tier)
+
+        with PROFILER.span('clock_tick'):
+            clock.tick(current_fps)
+        PROFILER.end_frame()
+
+        if args.startup_report and asset_loader.done:
+            startup['assets_ready'] = time.perf_counter()
+            write_startup_report(args.startup_report, startup)
+            running = False
+
+    finish_recording()
+    if args.trace:
+        count = PROFILER.export_chrome_trace(args.trace)
+        print(f"[profiler] {count} span -> {args.trace}")
 
-    pygame.display.flip()
-    clock.tick(current_fps)
+    pygame.quit()
+    sys.exit()
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
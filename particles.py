@@ -0,0 +1,266 @@
+import pygame
+import numpy as np
+from glow import GLOW_ATLAS
+from rng_streams import FX_RNG
+
+# --- STRUCTURE-OF-ARRAYS PARTİKÜL MOTORU ---
+# FlameSpark / EnergyOrb / SpeedLine / WarpLine efektleri artık ayrı Sprite nesneleri değil.
+# Tüm canlı partiküller bitişik NumPy dizilerinde tutulur ve tek bir vektörel adımda güncellenir.
+# Ölen partiküller her update sonunda sıkıştırılır (compaction), böylece [0:count) hep canlıdır.
+
+KIND_FLAME_SPARK = 0
+KIND_ENERGY_ORB = 1
+KIND_SPEED_LINE = 2
+KIND_WARP_LINE = 3
+
+DEFAULT_CAPACITY = 1024
+
+
+class ParticleSystem:
+    """Hafif efektleri NumPy dizileriyle toplu olarak güncelleyip çizer"""
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.count = 0
+        self.dropped = 0  # Kapasite dolduğu için reddedilen spawn sayısı
+        # Kalite kademesine göre spawn oranı (0..1). Seyreltme sayaçla yapılır, RNG tüketmez.
+        self.spawn_rate = 1.0
+        self.throttled = 0
+        self._spawn_credit = 0.0
+        self._allocate(capacity)
+
+        # Renk paleti: partikül başına tuple yerine küçük bir index saklanır
+        self.palette = []
+        self._palette_lookup = {}
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.initial_life = np.ones(capacity, dtype=np.float32)
+        self.initial_size = np.zeros(capacity, dtype=np.float32)
+        self.width = np.zeros(capacity, dtype=np.float32)
+        self.length = np.zeros(capacity, dtype=np.float32)
+        self.color_index = np.zeros(capacity, dtype=np.int16)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.life, self.initial_life,
+                        self.initial_size, self.width, self.length,
+                        self.color_index, self.kind)
+
+    def resize(self, capacity):
+        """Kapasiteyi değiştirir; canlı partiküller (sığdığı kadarı) korunur"""
+        if capacity == self.capacity:
+            return
+        old = self._arrays
+        keep = min(self.count, capacity)
+        self._allocate(capacity)
+        for new, arr in zip(self._arrays, old):
+            new[:keep] = arr[:keep]
+        self.dropped += self.count - keep
+        self.count = keep
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def _color_slot(self, color):
+        color = tuple(color)
+        slot = self._palette_lookup.get(color)
+        if slot is None:
+            slot = len(self.palette)
+            self.palette.append(color)
+            self._palette_lookup[color] = slot
+        return slot
+
+    def _alloc(self, kind, x, y, vx, vy, life, size, color):
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return -1
+        if self.spawn_rate < 1.0:
+            self._spawn_credit += self.spawn_rate
+            if self._spawn_credit < 1.0:
+                self.throttled += 1
+                return -1
+            self._spawn_credit -= 1.0
+        i = self.count
+        self.count += 1
+        self.kind[i] = kind
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.initial_life[i] = life
+        self.initial_size[i] = size
+        self.width[i] = 0
+        self.length[i] = 0
+        self.color_index[i] = self._color_slot(color)
+        return i
+
+    # --- SPAWN API ---
+    def spawn_flame_spark(self, x, y, angle, speed, base_color, life=40, size=8):
+        return self._alloc(KIND_FLAME_SPARK, x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                           life, size, base_color)
+
+    def spawn_energy_orb(self, x, y, color, size=10, life=30):
+        return self._alloc(KIND_ENERGY_ORB, x, y, 0.0, 0.0, life, size, color)
+
+    def spawn_speed_line(self, x, y, angle, speed, color, width=None, tail_length=None):
+        if width is None: width = FX_RNG.randint(2, 5)
+        if tail_length is None: tail_length = FX_RNG.uniform(4.0, 7.0)  # Anime style uzun kuyruk
+        i = self._alloc(KIND_SPEED_LINE, x, y, np.cos(angle) * speed * 2.0, np.sin(angle) * speed * 2.0,
+                        25, 0, color)
+        if i >= 0:
+            self.width[i] = width
+            self.length[i] = tail_length
+        return i
+
+    def spawn_warp_line(self, x, y, angle, color, theme_color=None, width=None, length_multiplier=None):
+        if width is None: width = FX_RNG.randint(2, 4)
+        if length_multiplier is None: length_multiplier = FX_RNG.uniform(10.0, 18.0)
+        i = self._alloc(KIND_WARP_LINE, x, y, np.cos(angle) * 15, np.sin(angle) * 15,
+                        8, 0, theme_color if theme_color else color)
+        if i >= 0:
+            self.width[i] = width
+            self.length[i] = length_multiplier
+        return i
+
+    # --- GÜNCELLEME ---
+    def update(self, camera_speed):
+        n = self.count
+        if n == 0:
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        kind = self.kind[:n]
+
+        flame = kind == KIND_FLAME_SPARK
+        warp = kind == KIND_WARP_LINE
+
+        # Kamera kayması hepsinde ortak
+        x -= camera_speed
+
+        # FlameSpark: önce yerçekimi, sonra hareket ve sürtünme
+        vy[flame] += 0.15
+
+        # WarpLine hızın %80'i ile ilerler, diğerleri tam hızla (orb'un hızı zaten 0)
+        step = np.where(warp, np.float32(0.8), np.float32(1.0))
+        x += vx * step
+        y += vy * step
+
+        vx[flame] *= 0.97
+        vy[flame] *= 0.97
+
+        # SpeedLine giderek incelsin
+        line = kind == KIND_SPEED_LINE
+        if line.any():
+            self.width[:n][line] = np.maximum(1, np.floor(self.width[:n][line] * 0.96))
+
+        life = self.life[:n]
+        life -= 1
+
+        # Ölenleri sıkıştır
+        alive = life > 0
+        if not alive.all():
+            k = int(np.count_nonzero(alive))
+            for arr in self._arrays:
+                arr[:k] = arr[:n][alive]
+            self.count = k
+
+    # --- ÇİZİM ---
+    def draw(self, surface, dirty=None):
+        """dirty listesi verilirse çizilen alanlar (Rect) eklenir (VfxLayer)"""
+        n = self.count
+        if n == 0:
+            return
+
+        kind = self.kind[:n]
+        ratio = np.clip(self.life[:n] / self.initial_life[:n], 0.0, 1.0)
+        palette = self.palette
+
+        flame = np.nonzero(kind == KIND_FLAME_SPARK)[0]
+        if len(flame):
+            self._draw_flame_sparks(surface, flame, ratio, palette, dirty)
+
+        orbs = np.nonzero(kind == KIND_ENERGY_ORB)[0]
+        if len(orbs):
+            self._draw_energy_orbs(surface, orbs, ratio, palette, dirty)
+
+        lines = np.nonzero(kind == KIND_SPEED_LINE)[0]
+        if len(lines):
+            self._draw_speed_lines(surface, lines, ratio, palette, dirty)
+
+        warps = np.nonzero(kind == KIND_WARP_LINE)[0]
+        if len(warps):
+            self._draw_warp_lines(surface, warps, ratio, palette, dirty)
+
+    def _draw_flame_sparks(self, surface, idx, ratio, palette, dirty=None):
+        r = ratio[idx]
+        alpha = (255 * r).astype(np.int32)
+        size = np.maximum(2, (self.initial_size[idx] * r ** 0.7).astype(np.int32))
+        spark = GLOW_ATLAS.spark
+        blits = []
+        # Glow + orta + çekirdek katmanları atlas'ta tek sprite olarak hazır
+        for cx, cy, a, s, c in zip(self.x[idx].astype(np.int32).tolist(), self.y[idx].astype(np.int32).tolist(),
+                                   alpha.tolist(), size.tolist(), self.color_index[idx].tolist()):
+            sprite, off = spark(palette[c], s, a)
+            blits.append((sprite, (cx - off, cy - off)))
+        if dirty is None:
+            surface.blits(blits, False)
+        else:
+            dirty.extend(surface.blits(blits))
+
+    def _draw_energy_orbs(self, surface, idx, ratio, palette, dirty=None):
+        r = ratio[idx]
+        alpha = (255 * r).astype(np.int32)
+        size = np.maximum(3, (self.initial_size[idx] * r).astype(np.int32))
+        for cx, cy, a, s, c in zip(self.x[idx].astype(np.int32).tolist(), self.y[idx].astype(np.int32).tolist(),
+                                   alpha.tolist(), size.tolist(), self.color_index[idx].tolist()):
+            color = palette[c]
+            # Dış Halka (iç topu da kapsar)
+            ring = pygame.draw.circle(surface, (*color, a // 2), (cx, cy), s * 2, 2)
+            if dirty is not None:
+                dirty.append(ring)
+            # İç Top
+            pygame.draw.circle(surface, (*color, a), (cx, cy), s)
+
+    def _draw_speed_lines(self, surface, idx, ratio, palette, dirty=None):
+        alpha = (220 * ratio[idx]).astype(np.int32)
+        x, y = self.x[idx], self.y[idx]
+        tail = self.length[idx]
+        end_x = (x - self.vx[idx] * tail).astype(np.int32)
+        end_y = (y - self.vy[idx] * tail).astype(np.int32)
+        for sx, sy, ex, ey, a, w, c in zip(x.astype(np.int32).tolist(), y.astype(np.int32).tolist(),
+                                           end_x.tolist(), end_y.tolist(), alpha.tolist(),
+                                           self.width[idx].astype(np.int32).tolist(), self.color_index[idx].tolist()):
+            if a <= 0:
+                continue
+            color = palette[c]
+            start_pos, end_pos = (sx, sy), (ex, ey)
+            glow = pygame.draw.line(surface, (*color, a // 3), start_pos, end_pos, w + 4)
+            pygame.draw.line(surface, (*color, a), start_pos, end_pos, w)
+            pygame.draw.line(surface, (255, 255, 255, a), start_pos, end_pos, max(1, w // 2))
+            if dirty is not None:
+                dirty.append(glow)
+
+    def _draw_warp_lines(self, surface, idx, ratio, palette, dirty=None):
+        alpha = (255 * ratio[idx]).astype(np.int32)
+        x, y = self.x[idx], self.y[idx]
+        tail = self.length[idx] * 1.5
+        end_x = (x - self.vx[idx] * tail).astype(np.int32)
+        end_y = (y - self.vy[idx] * tail).astype(np.int32)
+        for sx, sy, ex, ey, a, w, c in zip(x.astype(np.int32).tolist(), y.astype(np.int32).tolist(),
+                                           end_x.tolist(), end_y.tolist(), alpha.tolist(),
+                                           self.width[idx].astype(np.int32).tolist(), self.color_index[idx].tolist()):
+            if a <= 10:
+                continue
+            color = palette[c]
+            glow = pygame.draw.line(surface, (*color, a // 3), (sx, sy), (ex, ey), w + 4)
+            pygame.draw.line(surface, (*color, a), (sx, sy), (ex, ey), w)
+            if dirty is not None:
+                dirty.append(glow)
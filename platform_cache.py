@@ -0,0 +1,104 @@
+import pygame
+from collections import OrderedDict
+
+from settings import PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH
+
+# --- PLATFORM YÜZEY CACHE'İ ---
+# Platform.draw her platform için her kare iki yuvarlatılmış draw.rect ve bir draw.line çağırıyordu;
+# oysa bir platformun şekli ve rengi hiç değişmez. Burada her (genişlik, yükseklik, tema adı) varyantı
+# bir kez çizilir ve tek blit ile basılır. Yuvarlak köşeler colorkey ile şeffaf: draw.rect kenar
+# yumuşatması yapmadığı için opak canvas'a basılan sonuç eski çizimle piksel piksel aynıdır.
+# Yüzey PAD kadar geniştir; blit konumu rect.x - PAD, rect.y - PAD. Bellek sınırı aşılınca en eski varyant
+# atılır (LRU).
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_FILL = (10, 30, 10)
+DEFAULT_BORDER = (50, 255, 50)
+BORDER_RADIUS = 5
+PAD = 2   # 3 px'lik üst çizgi rect'in bir piksel üstüne ve sağına taşar: yüzey her yandan bu kadar geniş
+# Köşe colorkey'i: platformun kendi renkleriyle çakışmayan ilk aday
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 2, 3))
+
+
+def platform_colors(theme):
+    if theme:
+        return theme["platform_color"], theme["border_color"]
+    return DEFAULT_FILL, DEFAULT_BORDER
+
+
+def draw_platform(surface, rect, fill_c, border_c):
+    """Platformun pygame.draw ile çizimi (cache varyantları bununla üretilir)"""
+    pygame.draw.rect(surface, fill_c, rect, border_radius=BORDER_RADIUS)
+    pygame.draw.rect(surface, border_c, rect, 2, border_radius=BORDER_RADIUS)
+    pygame.draw.line(surface, border_c, (rect.left, rect.top), (rect.right, rect.top), 3)
+
+
+class PlatformCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, width, height, theme=None):
+        key = (width, height, theme["name"] if theme else None)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = self._render(width, height, *platform_colors(theme))
+        nbytes = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        if nbytes > self.max_bytes:
+            return surf  # Sınırdan büyük tek yüzeyi saklamaya değmez
+
+        self.surfaces[key] = surf
+        self.bytes_used += nbytes
+        while self.bytes_used > self.max_bytes:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes_used -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.evictions += 1
+        return surf
+
+    @staticmethod
+    def _render(width, height, fill_c, border_c):
+        key = next(c for c in COLORKEY_CANDIDATES if c != tuple(fill_c) and c != tuple(border_c))
+        surf = pygame.Surface((width + 2 * PAD, height + 2 * PAD))
+        surf.fill(key)
+        draw_platform(surf, pygame.Rect(PAD, PAD, width, height), fill_c, border_c)
+        surf.set_colorkey(key, pygame.RLEACCEL)
+        return surf
+
+    def prewarm(self, theme, heights, widths=range(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH + 1)):
+        """Temanın tüm platform boyutlarını önceden çizer (istatistiklere sayılmaz)"""
+        hits, misses = self.hits, self.misses
+        for height in heights:
+            for width in widths:
+                self.get(width, height, theme)
+        self.hits, self.misses = hits, misses
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes_used = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.surfaces),
+            'bytes': self.bytes_used,
+            'max_bytes': self.max_bytes,
+        }
+
+
+PLATFORM_CACHE = PlatformCache()
@@ -0,0 +1,79 @@
+import pygame
+
+# --- EKRANA BASMA (PRESENTER) ---
+# Eskiden her kare pygame.transform.scale yeni bir tam boy Surface döndürüyordu (4K ayarında kare başı ~33 MB),
+# sonra bu yüzey ekrana ayrıca blit ediliyordu.
+# Presenter hedef yüzeyleri mod başına bir kez ayırır ve transform.scale'in dest_surface formunu kullanır:
+# - Canvas ekranla aynı boyuttaysa ölçekleme yok, tek blit.
+# - Son ölçekleme doğrudan ekran yüzeyine yazılır (format uyuşuyorsa), ara kopya ve blit kalkar.
+# - "Kalite" düşürme geçişi, sonuç değişmeyecekse (tam katlı büyütüp geri küçültmek) atlanır.
+# Ayrılan byte'lar sayılır; sabit durumda kare başı ayrım 0 olmalı.
+
+
+def _same_format(a, b):
+    return a.get_bitsize() == b.get_bitsize() and a.get_masks() == b.get_masks()
+
+
+class Presenter:
+    def __init__(self):
+        self._buffers = {}            # slot adı -> Surface ('low': kalite geçişi, 'out': format dönüşümü)
+        self.frames = 0
+        self.bytes_allocated_total = 0
+        self.bytes_allocated_last_frame = 0
+        self.passes_last_frame = 0    # Son karedeki transform.scale sayısı
+        self._frame_bytes = 0
+
+    def _buffer(self, slot, size, like):
+        """slot için size boyutunda, like ile aynı formatta kalıcı yüzey döner; gerekirse yeniden ayırır"""
+        buf = self._buffers.get(slot)
+        if buf is None or buf.get_size() != size or not _same_format(buf, like):
+            buf = pygame.Surface(size, 0, like)
+            self._buffers[slot] = buf  # Eskisi serbest kalır: slot başına tek yüzey
+            nbytes = size[0] * size[1] * buf.get_bytesize()
+            self._frame_bytes += nbytes
+            self.bytes_allocated_total += nbytes
+        return buf
+
+    def present(self, canvas, dest, low_res=None):
+        """canvas'ı dest'e (genelde ekran) basar. low_res verilirse görüntü önce o çözünürlükten geçirilir."""
+        self._frame_bytes = 0
+        passes = 0
+        src = canvas
+        out_size = dest.get_size()
+        cw, ch = canvas.get_size()
+
+        if low_res is not None and low_res != (cw, ch):
+            # Tam katlı büyütme + geri küçültme (nearest) görüntüyü değiştirmez: geçişi atla
+            lossless = (low_res[0] % cw == 0 and low_res[1] % ch == 0 and out_size == (cw, ch))
+            if not lossless:
+                src = self._buffer('low', low_res, canvas)
+                pygame.transform.scale(canvas, low_res, src)
+                passes += 1
+
+        if src.get_size() == out_size:
+            dest.blit(src, (0, 0))
+        elif _same_format(src, dest):
+            pygame.transform.scale(src, out_size, dest)
+            passes += 1
+        else:
+            out = self._buffer('out', out_size, src)
+            pygame.transform.scale(src, out_size, out)
+            dest.blit(out, (0, 0))
+            passes += 1
+
+        self.passes_last_frame = passes
+        self.bytes_allocated_last_frame = self._frame_bytes
+        self.frames += 1
+
+    def release(self):
+        """Ara yüzeyleri bırakır (mod / çözünürlük değişimi)"""
+        self._buffers.clear()
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'passes': self.passes_last_frame,
+            'bytes_last_frame': self.bytes_allocated_last_frame,
+            'bytes_total': self.bytes_allocated_total,
+            'buffer_bytes': sum(b.get_width() * b.get_height() * b.get_bytesize() for b in self._buffers.values()),
+        }
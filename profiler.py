@@ -0,0 +1,180 @@
+import json
+import time
+from array import array
+
+# --- KARE PROFİLLEYİCİ ---
+# Ana döngü fazlarının etrafına isimli zamanlama aralıkları (span) koyar.
+# Tüm kayıtlar önceden ayrılmış bir ring buffer'a yazılır; profil alırken yeni liste/dict oluşmaz.
+# Kapalıyken begin()/end() tek bir bool kontrolünden ibarettir.
+
+SPAN_CAPACITY = 8192
+FRAME_HISTORY = 240
+
+
+class _Span:
+    """Tekrar kullanılan context manager: `with PROFILER.span('ad'):`"""
+    __slots__ = ('profiler', 'name_id')
+
+    def __init__(self, profiler, name_id):
+        self.profiler = profiler
+        self.name_id = name_id
+
+    def __enter__(self):
+        self.profiler.begin_id(self.name_id)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.end()
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, span_capacity=SPAN_CAPACITY, frame_history=FRAME_HISTORY):
+        self.enabled = False
+        self.span_capacity = span_capacity
+        self.frame_history = frame_history
+        self.clock = time.perf_counter
+
+        # Span ring buffer (Structure of Arrays)
+        self.span_start = array('d', bytes(8 * span_capacity))
+        self.span_end = array('d', bytes(8 * span_capacity))
+        self.span_name = array('H', bytes(2 * span_capacity))
+        self.span_depth = array('B', bytes(span_capacity))
+        self.span_frame = array('l', bytes(array('l').itemsize * span_capacity))
+        self.span_head = 0     # Bir sonraki yazılacak slot
+        self.span_total = 0    # Şimdiye kadar yazılan toplam span
+
+        # Açık span yığını (hiyerarşi için) - sabit derinlik
+        self._stack = array('l', bytes(array('l').itemsize * 32))
+        self._depth = 0
+
+        # Kare süreleri ring buffer'ı (ms)
+        self.frame_ms = array('d', bytes(8 * frame_history))
+        self.frame_head = 0
+        self.frame_index = 0
+        self._frame_start = 0.0
+
+        # İsim tablosu: span adları bir kez kaydedilir, buffer'da sadece id tutulur
+        self.names = []
+        self._name_ids = {}
+        self._spans = {}
+
+        self.epoch = self.clock()
+
+    # --- İSİMLER ---
+    def name_id(self, name):
+        nid = self._name_ids.get(name)
+        if nid is None:
+            nid = len(self.names)
+            self.names.append(name)
+            self._name_ids[name] = nid
+        return nid
+
+    def span(self, name):
+        s = self._spans.get(name)
+        if s is None:
+            s = _Span(self, self.name_id(name))
+            self._spans[name] = s
+        return s
+
+    # --- KAYIT ---
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self.clock()
+        self._depth = 0
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frame_ms[self.frame_head] = (self.clock() - self._frame_start) * 1000.0
+        self.frame_head = (self.frame_head + 1) % self.frame_history
+        self.frame_index += 1
+
+    def begin(self, name):
+        if not self.enabled:
+            return
+        self.begin_id(self.name_id(name))
+
+    def begin_id(self, name_id):
+        if not self.enabled:
+            return
+        slot = self.span_head
+        self.span_start[slot] = self.clock()
+        self.span_end[slot] = -1.0
+        self.span_name[slot] = name_id
+        self.span_depth[slot] = self._depth
+        self.span_frame[slot] = self.frame_index
+        self._stack[self._depth] = slot
+        self._depth += 1
+        self.span_head = (slot + 1) % self.span_capacity
+        self.span_total += 1
+
+    def end(self):
+        if not self.enabled or self._depth == 0:
+            return
+        self._depth -= 1
+        self.span_end[self._stack[self._depth]] = self.clock()
+
+    def set_enabled(self, enabled):
+        if enabled and not self.enabled:
+            self._depth = 0
+            self._frame_start = self.clock()
+        self.enabled = enabled
+
+    # --- OKUMA ---
+    def _iter_slots(self):
+        """Ring'deki geçerli slotları eskiden yeniye dolaşır"""
+        count = min(self.span_total, self.span_capacity)
+        start = (self.span_head - count) % self.span_capacity
+        for k in range(count):
+            yield (start + k) % self.span_capacity
+
+    def recent_frame_times(self):
+        """Son kare sürelerini eskiden yeniye döner (ms)"""
+        count = min(self.frame_index, self.frame_history)
+        start = (self.frame_head - count) % self.frame_history
+        return [self.frame_ms[(start + k) % self.frame_history] for k in range(count)]
+
+    def span_breakdown(self, frames=60):
+        """Son `frames` karedeki span başına ortalama süre: [(ad, derinlik, ms), ...] ilk görülme sırasıyla"""
+        first_frame = self.frame_index - frames
+        totals = {}
+        order = []
+        for slot in self._iter_slots():
+            frame = self.span_frame[slot]
+            end = self.span_end[slot]
+            if frame < first_frame or frame >= self.frame_index or end < 0:
+                continue
+            key = (self.span_name[slot], self.span_depth[slot])
+            if key not in totals:
+                totals[key] = 0.0
+                order.append(key)
+            totals[key] += (end - self.span_start[slot]) * 1000.0
+        n = max(1, min(frames, self.frame_index))
+        return [(self.names[nid], depth, totals[(nid, depth)] / n) for nid, depth in order]
+
+    # --- DIŞA AKTARMA ---
+    def export_chrome_trace(self, path):
+        """Ring buffer'ı Chrome trace-event JSON formatında yazar (chrome://tracing, Perfetto)"""
+        events = []
+        for slot in self._iter_slots():
+            end = self.span_end[slot]
+            if end < 0:
+                continue
+            start = self.span_start[slot]
+            events.append({
+                'name': self.names[self.span_name[slot]],
+                'ph': 'X',
+                'ts': (start - self.epoch) * 1e6,
+                'dur': (end - start) * 1e6,
+                'pid': 1,
+                'tid': 1,
+                'args': {'frame': self.span_frame[slot]},
+            })
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(events)
+
+
+PROFILER = FrameProfiler()
@@ -0,0 +1,91 @@
+from array import array
+from collections import deque
+
+# --- UYARLAMALI KALİTE YÖNETİCİSİ ---
+# Kalite eskiden elle seçilen HIGH / LOW'du; zayıf makinelerde LOW seçilince oyun bir daha HIGH'a dönmüyordu.
+# QualityGovernor son karelerin iş süresini (clock.tick beklemesi hariç) kare bütçesiyle (1000 / FPS limiti)
+# karşılaştırır ve QUALITY_TIERS arasında adım adım iner / çıkar:
+#   - İniş: pencerenin p90'ı bütçenin DOWNGRADE_RATIO katını aşarsa hemen (bir kademe).
+#   - Çıkış: p90, UPGRADE_RATIO'nun altında UPGRADE_HOLD_S boyunca kalırsa (bir kademe).
+#   - Histerezis: her değişimden sonra COOLDOWN_S beklenir; bir kademeden düşüldükçe oraya
+#     geri çıkmak için gereken süre ikiye katlanır (en çok MAX_BACKOFF kat), salınım olmaz.
+# Kararlar profiler overlay'inde (F3) gösterilir.
+
+QUALITY_TIERS = ('HIGH', 'MEDIUM', 'LOW')   # Pahalıdan ucuza, QUALITY_PRESETS anahtarları
+WINDOW_FRAMES = 90
+DOWNGRADE_RATIO = 0.95
+UPGRADE_RATIO = 0.65
+UPGRADE_HOLD_S = 4.0
+COOLDOWN_S = 2.0
+MAX_BACKOFF = 8
+DECISION_HISTORY = 6
+
+
+class QualityGovernor:
+    def __init__(self, tiers=QUALITY_TIERS, window=WINDOW_FRAMES):
+        self.tiers = tiers
+        self.window = window
+        self.samples = array('d', bytes(8 * window))   # Ring buffer (ms)
+        self.decisions = deque(maxlen=DECISION_HISTORY)  # Son kararlar (overlay için metin)
+        self.backoff = [1] * len(tiers)                 # Kademeye geri çıkma süresi çarpanı
+        self.tier_index = 0
+        self.reset()
+
+    def reset(self, tier=None):
+        """Ölçüm penceresini boşaltır; tier verilirse o kademeden başlar"""
+        if tier is not None:
+            self.tier_index = self.tiers.index(tier)
+        self.head = 0
+        self.count = 0
+        self.elapsed = 0.0        # observe() ile geçen toplam süre (sn)
+        self.calm_time = 0.0      # p90'ın çıkış eşiğinin altında kaldığı kesintisiz süre
+        self.cooldown = COOLDOWN_S
+        self.last_p90 = 0.0
+
+    @property
+    def tier(self):
+        return self.tiers[self.tier_index]
+
+    def percentile(self, pct=90):
+        if not self.count:
+            return 0.0
+        ordered = sorted(self.samples[:self.count])
+        return ordered[min(self.count - 1, int(pct / 100.0 * self.count))]
+
+    def observe(self, work_ms, budget_ms):
+        """Bir karenin iş süresini ekler; kademe değiştiyse yeni kademeyi, yoksa None döner"""
+        self.samples[self.head] = work_ms
+        self.head = (self.head + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+        # Bütçeye yetişilen karede bir kare süresi bütçe kadardır
+        frame_s = max(work_ms, budget_ms) / 1000.0
+        self.elapsed += frame_s
+        self.cooldown -= frame_s
+        if self.count < self.window:
+            return None
+
+        p90 = self.last_p90 = self.percentile(90)
+        if p90 < budget_ms * UPGRADE_RATIO:
+            self.calm_time += frame_s
+        else:
+            self.calm_time = 0.0
+        if self.cooldown > 0:
+            return None
+
+        if p90 > budget_ms * DOWNGRADE_RATIO and self.tier_index < len(self.tiers) - 1:
+            # Bu kademede tutunamadık: buraya tekrar çıkmak daha uzun sakin süre ister
+            self.backoff[self.tier_index] = min(MAX_BACKOFF, self.backoff[self.tier_index] * 2)
+            return self._switch(self.tier_index + 1, p90, budget_ms)
+        if self.tier_index > 0 and self.calm_time >= UPGRADE_HOLD_S * self.backoff[self.tier_index - 1]:
+            return self._switch(self.tier_index - 1, p90, budget_ms)
+        return None
+
+    def _switch(self, index, p90, budget_ms):
+        old = self.tier
+        self.tier_index = index
+        self.decisions.append(f"{self.elapsed:6.1f}s {old} > {self.tier}  p90 {p90:.1f} / {budget_ms:.1f} ms")
+        # Yeni kademenin maliyeti ölçülene kadar karar yok
+        self.head = self.count = 0
+        self.calm_time = 0.0
+        self.cooldown = COOLDOWN_S
+        return self.tier
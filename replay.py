@@ -0,0 +1,158 @@
+import struct
+import zlib
+
+from game_session import FrameInput, QUALITY_PRESETS
+from sim_clock import SIM_HZ
+
+# --- GİRDİ REPLAY'İ ---
+# Bir koşu = tohum + simülasyon adımı başına girdi. GameSession'daki tüm rastgelelik rng_streams'in
+# tohumlanmış akışlarından geldiği ve adım hep sabit dt ile koştuğu için, aynı tohumla reset edilip
+# aynı girdiler verilen oturum aynı koşuyu bit bit tekrar üretir (render hızından ve kaliteden bağımsız).
+#
+# Dosya: başlık + zlib ile sıkıştırılmış gövde
+#   girdiler:   adım başına 1 bayt (INPUT_BITS bit maskesi: basılı yönler + bu adımdaki aksiyonlar)
+#   checkpoint: CHECKPOINT_INTERVAL adımda bir ve son adımda (adım, state_digest) - sapma tespiti için
+#   kalite:     (adım, kademe) - governor kaydederken kademe değiştirdiyse oynatmada aynı anda uygulanır
+
+MAGIC = b'DRRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBIHBIII')   # magic, sürüm, tohum, adım hızı, kalite, adım, checkpoint, kalite değişimi
+CHECKPOINT = struct.Struct('<II')      # adım, crc32
+QUALITY_CHANGE = struct.Struct('<IB')  # adım, kademe
+DIGEST = struct.Struct('<ddddIII')
+CHECKPOINT_INTERVAL = 60
+INPUT_BITS = FrameInput.__slots__      # left, right, up, down, jump, slam, dash
+QUALITY_NAMES = tuple(QUALITY_PRESETS)
+
+
+def encode_input(inputs):
+    mask = 0
+    for bit, name in enumerate(INPUT_BITS):
+        if getattr(inputs, name):
+            mask |= 1 << bit
+    return mask
+
+
+# Maske -> FrameInput tablosu: oynatma sırasında adım başına nesne açılmaz (step girdiyi değiştirmez)
+DECODED = tuple(FrameInput(**{name: bool(mask >> bit & 1) for bit, name in enumerate(INPUT_BITS)})
+                for mask in range(1 << len(INPUT_BITS)))
+
+
+def state_digest(session):
+    """Oynanış durumunun crc32'si (float'lar bit bit)"""
+    return zlib.crc32(DIGEST.pack(session.score, session.player_x, session.player_y, session.y_velocity,
+                                  session.frame_count, len(session.all_enemies), len(session.all_platforms)))
+
+
+class Replay:
+    def __init__(self, seed, quality, hz=SIM_HZ, inputs=b'', checkpoints=None, quality_changes=()):
+        self.seed = seed
+        self.quality = quality
+        self.hz = hz
+        self.inputs = bytes(inputs)
+        self.checkpoints = dict(checkpoints or {})
+        self.quality_changes = list(quality_changes)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def to_bytes(self):
+        body = bytearray(self.inputs)
+        for step, crc in sorted(self.checkpoints.items()):
+            body += CHECKPOINT.pack(step, crc)
+        for step, tier in self.quality_changes:
+            body += QUALITY_CHANGE.pack(step, QUALITY_NAMES.index(tier))
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.hz, QUALITY_NAMES.index(self.quality),
+                             len(self.inputs), len(self.checkpoints), len(self.quality_changes))
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, hz, quality, steps, n_checks, n_changes = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"replay değil veya desteklenmeyen sürüm: {magic!r} v{version}")
+        body = zlib.decompress(data[HEADER.size:])
+        offset = steps
+        checkpoints = {}
+        for _ in range(n_checks):
+            step, crc = CHECKPOINT.unpack_from(body, offset)
+            checkpoints[step] = crc
+            offset += CHECKPOINT.size
+        changes = []
+        for _ in range(n_changes):
+            step, tier = QUALITY_CHANGE.unpack_from(body, offset)
+            changes.append((step, QUALITY_NAMES[tier]))
+            offset += QUALITY_CHANGE.size
+        return cls(seed, QUALITY_NAMES[quality], hz, body[:steps], checkpoints, changes)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """session.step'e verilen her girdiyi kaydeder; reset(seed) sonrası oluşturulmalı"""
+    def __init__(self, seed, quality, hz=SIM_HZ):
+        self.replay = Replay(seed, quality, hz)
+        self.inputs = bytearray()
+
+    def record(self, inputs, session):
+        """Adım koştuktan sonra çağrılır"""
+        self.inputs.append(encode_input(inputs))
+        steps = len(self.inputs)
+        if steps % CHECKPOINT_INTERVAL == 0 or session.game_over:
+            self.replay.checkpoints[steps] = state_digest(session)
+
+    def set_quality(self, tier):
+        """Kademe bir sonraki adımdan itibaren geçerli"""
+        self.replay.quality_changes.append((len(self.inputs), tier))
+
+    def finish(self, session):
+        replay = self.replay
+        replay.inputs = bytes(self.inputs)
+        if self.inputs:
+            replay.checkpoints[len(self.inputs)] = state_digest(session)
+        return replay
+
+
+class ReplayPlayer:
+    """Replay'i bir GameSession'a adım adım besler ve checkpoint'leri doğrular"""
+    def __init__(self, replay, session):
+        self.replay = replay
+        self.session = session
+        self.step_index = 0
+        self.mismatch = None   # İlk sapan checkpoint adımı
+        self.checked = 0
+        self._changes = dict(replay.quality_changes)
+        session.set_quality(replay.quality)
+        session.reset(replay.seed)
+
+    @property
+    def done(self):
+        return self.step_index >= len(self.replay)
+
+    def step(self, dt):
+        """Bir adım oynatır; replay bittiyse False döner"""
+        if self.done:
+            return False
+        tier = self._changes.get(self.step_index)
+        if tier:
+            self.session.set_quality(tier)
+        self.session.step(DECODED[self.replay.inputs[self.step_index]], dt)
+        self.step_index += 1
+        crc = self.replay.checkpoints.get(self.step_index)
+        if crc is not None:
+            self.checked += 1
+            if self.mismatch is None and crc != state_digest(self.session):
+                self.mismatch = self.step_index
+        return True
+
+    def summary(self):
+        if self.mismatch is not None:
+            return f"DESYNC at step {self.mismatch}"
+        return f"OK ({self.step_index} steps, {self.checked} checkpoints match)"
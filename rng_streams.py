@@ -0,0 +1,25 @@
+import random
+
+# --- TOHUMLANMIŞ RASTGELELİK AKIŞLARI ---
+# Oynanış eskiden global random modülünü çizim koduyla (düşman glitch titremesi, ekran sarsıntısı ofseti)
+# paylaşıyordu; saniyede kaç kare çizildiği bir sonraki platformun yerini değiştiriyordu.
+# Simülasyon adımında tüketilen tüm rastgelelik artık iki tohumlanmış akıştan gelir:
+#   GAME_RNG: oynanışı etkileyen her şey (tema, platform üretimi, düşman yeri / yönü, slam titreşimi)
+#   FX_RNG:   adım içindeki kozmetik şeyler (efekt açıları, parçacıklar, animasyon, yıldızlar)
+# Kalite kademesi efekt sayısını değiştirse de GAME_RNG etkilenmez. Çizim kodu global random'u kullanmaya
+# devam eder; render hızı simülasyona sızmaz. GameSession.reset(seed) iki akışı da aynı tohumdan kurar.
+
+GAME_RNG = random.Random()
+FX_RNG = random.Random()
+SEED_BITS = 32
+
+
+def new_seed():
+    """Yeni bir koşu tohumu (global random'dan; random.seed() ile bench'ler tekrarlanabilir kalır)"""
+    return random.getrandbits(SEED_BITS)
+
+
+def seed_streams(seed):
+    GAME_RNG.seed(seed)
+    # Ayrı ama tohumdan türetilmiş akış: str tohumu Python sürümleri arasında kararlı (sha512)
+    FX_RNG.seed(f"fx:{seed}")
@@ -12,11 +12,12 @@ echo.
 echo [+] Eski build dosyalari temizleniyor...
 rd /s /q "build" 2>nul
 rd /s /q "dist" 2>nul
-del /q *.spec 2>nul
+:: Sadece bu betigin urettigi spec silinir (DayiRunner*.spec profilleri repoda kalir)
+del /q DayiRunner_Final.spec 2>nul
 
 :: 2. KUTUPHANE GUNCELLEME
 echo [+] Gereksinimler kontrol ediliyor...
-python -m pip install --upgrade pygame pyinstaller --quiet
+python -m pip install --upgrade pygame numpy pyinstaller --quiet
 
 :: 3. PAKETLEME (EN STABIL AYARLARLA)
 echo.
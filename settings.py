@@ -50,6 +50,7 @@ LOADING_BAR_FILL = (0, 255, 128)
 CURSED_PURPLE = (120, 0, 120)
 CURSED_RED = (200, 0, 0)
 GLITCH_BLACK = (20, 0, 20)
+ENEMY_SIZE = 40
 
 # --- OYUN FİZİĞİ ---
 GRAVITY = 1
@@ -69,6 +70,7 @@ MAX_CAMERA_SPEED = 15
 SPEED_INCREMENT_RATE = 0.001
 PLATFORM_MIN_WIDTH = 100
 PLATFORM_MAX_WIDTH = 300
+PLATFORM_THICKNESS = 50
 GAP_MIN = 120
 GAP_MAX = 250
 VERTICAL_GAP = 180
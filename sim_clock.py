@@ -0,0 +1,40 @@
+# --- SABİT ADIMLI SİMÜLASYON SAATİ ---
+# Oynanış eskiden her render karesinde get_ticks() farkından türetilen değişken dt ile ilerliyordu.
+# Oysa efektlerin ömrü, düşman devriyesi, ekran sarsıntısı gibi pek çok şey "kare başına 1" sayıyor,
+# bu yüzden 30 / 144 / 240 FPS ayarları hem oyun hissini hem simülasyon yükünü değiştiriyordu.
+# FixedStepClock gerçek geçen süreyi biriktirir (accumulator) ve simülasyonu hep aynı dt ile adımlatır.
+# Render, son iki simülasyon durumu arasında alpha oranıyla interpolasyon yapar.
+#
+# Adım hızı 60 Hz: oyundaki kare başı sabitler (efekt ömürleri, DASH_DURATION, devriye hızı) bu hıza göre ayarlı.
+
+SIM_HZ = 60
+MAX_CATCHUP_STEPS = 5   # Bir render karesinde en fazla bu kadar adım; fazlası (takılma, pencere sürükleme) atılır
+
+
+class FixedStepClock:
+    def __init__(self, hz=SIM_HZ, max_steps=MAX_CATCHUP_STEPS):
+        self.step_dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.total_steps = 0
+        self.dropped_time = 0.0   # Yakalama sınırı yüzünden atılan toplam süre (sn)
+
+    def advance(self, frame_dt):
+        """Geçen gerçek süreyi ekler, bu karede koşulacak simülasyon adımı sayısını döner"""
+        self.accumulator += max(0.0, frame_dt)
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.step_dt
+            steps = self.max_steps
+            self.accumulator = self.step_dt * steps
+        self.accumulator -= steps * self.step_dt
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Son adımdan bu yana geçen kısım (0..1): render interpolasyonu için"""
+        return min(1.0, self.accumulator / self.step_dt)
+
+    def reset(self):
+        self.accumulator = 0.0
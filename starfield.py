@@ -0,0 +1,83 @@
+import random
+
+import pygame
+
+from settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, WHITE, STAR_COLOR
+
+# --- PARALLAX YILDIZ ALANI ---
+# Arka plan eskiden 120 ayrı Star nesnesiydi: her biri adım başına kendi float hesabını yapıyor,
+# her kare iki pygame.draw.circle ile çiziliyordu (~240 çizim çağrısı).
+# Burada yıldızlar derinlik bantlarına ayrılır; her bandın yıldızları ekran boyunda bir döşemeye (tile)
+# bir kez çizilir. Simülasyon bant başına tek bir kaydırma ofseti tutar, çizim bant başına iki sarmalı blit'tir.
+# Döşemeler colorkey + RLEACCEL: boş satırlar atlandığı için tam ekran blit'in maliyeti yıldız sayısıyla ölçeklenir,
+# yıldız sayısını 10 katına çıkarmak eski 120 yıldızdan hâlâ ucuzdur.
+
+STAR_COUNT = 120
+# (parallax hızı, halka yarıçapı): uzak bant yavaş ve küçük, yakın bant hızlı ve büyük
+STAR_BANDS = ((0.6, 1), (1.0, 2), (1.4, 3))
+LAYOUT_SEED = 0x57A25   # Döşeme düzeni sabit; koşudan koşuya değişen bantların başlangıç ofseti
+COLORKEY = (0, 0, 0)
+
+# (yıldız sayısı, bantlar, boyut, piksel formatı) -> döşemeler: oturumlar arasında paylaşılır, bir kez üretilir
+TILE_CACHE = {}
+
+
+class Starfield:
+    def __init__(self, count=STAR_COUNT, bands=STAR_BANDS, width=LOGICAL_WIDTH, height=LOGICAL_HEIGHT):
+        self.count = count
+        self.bands = bands
+        self.width = width
+        self.height = height
+        self.offsets = [0.0] * len(bands)
+        self.tiles = None   # İlk draw'da hedef yüzeyin formatında alınır (headless simülasyon ödemez)
+
+    def reset(self, rng):
+        """Bant ofsetlerini verilen akıştan dağıtır (GameSession.reset -> FX_RNG)"""
+        self.offsets = [rng.uniform(0, self.width) for _ in self.bands]
+
+    def update(self, camera_speed):
+        width = self.width
+        offsets = self.offsets
+        for i, (speed, _) in enumerate(self.bands):
+            offsets[i] = (offsets[i] + speed * camera_speed / 3) % width
+
+    def build(self, surface):
+        """Bant döşemelerini surface'ın piksel formatında hazırlar (cache'te yoksa çizer)"""
+        key = (self.count, self.bands, self.width, self.height, surface.get_bitsize(), surface.get_masks())
+        tiles = TILE_CACHE.get(key)
+        if tiles is None:
+            tiles = TILE_CACHE[key] = self._render_tiles(surface)
+        self.tiles = tiles
+
+    def _render_tiles(self, surface):
+        layout = random.Random(LAYOUT_SEED)
+        per_band = self.count // len(self.bands)
+        tiles = []
+        for _, size in self.bands:
+            tile = pygame.Surface((self.width, self.height), 0, surface)
+            tile.fill(COLORKEY)
+            for _ in range(per_band):
+                x = layout.randrange(self.width)
+                y = layout.randrange(self.height)
+                # Kenardaki yıldız döşemenin öbür ucunda da çizilir: sarmalı blit'te dikiş görünmez
+                for wx in (x - self.width, x, x + self.width):
+                    if -size <= wx < self.width + size:
+                        pygame.draw.circle(tile, WHITE, (wx, y), 1)
+                        pygame.draw.circle(tile, STAR_COLOR, (wx, y), size, 1)
+            tile.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            tiles.append(tile)
+        return tiles
+
+    @property
+    def bytes_used(self):
+        return sum(t.get_bytesize() * t.get_width() * t.get_height() for t in self.tiles or ())
+
+    def draw(self, surface, ox=0):
+        # ox: kamera kaydırmasının interpolasyon payı; her bant kendi parallax hızıyla uygular
+        if self.tiles is None:
+            self.build(surface)
+        width = self.width
+        for tile, offset, (speed, _) in zip(self.tiles, self.offsets, self.bands):
+            x = int(ox * speed / 3 - offset) % width
+            surface.blit(tile, (x, 0))
+            surface.blit(tile, (x - width, 0))
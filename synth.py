@@ -0,0 +1,135 @@
+import numpy as np
+import pygame
+
+# --- SES SENTEZİ ---
+# Eksik ses dosyalarının yerine çalınan efektler eskiden örnek örnek bir Python döngüsünde
+# struct.pack ile üretiliyordu (efekt başına on binlerce iterasyon, hepsi açılışta).
+# Burada osilatör ve zarf (envelope) tüm efekt için tek seferde NumPy dizisi olarak hesaplanır.
+# Sonuç int16 mono örnekler; to_sound() bunu mixer'ın kanal sayısına çoğaltıp Sound'a çevirir.
+
+SAMPLE_RATE = 44100
+MAX_AMP = 32767
+
+
+# --- OSİLATÖRLER ---
+# phase: döngü cinsinden faz (1.0 = bir tam periyot)
+def _sine(phase, rng):
+    return np.sin(2 * np.pi * phase)
+
+
+def _square(phase, rng):
+    return np.where((phase % 1.0) < 0.5, 1.0, -1.0)
+
+
+def _saw(phase, rng):
+    return 2.0 * (phase % 1.0) - 1.0
+
+
+def _triangle(phase, rng):
+    return 1.0 - 4.0 * np.abs((phase % 1.0) - 0.5)
+
+
+def _noise(phase, rng):
+    return rng.uniform(-1.0, 1.0, phase.shape)
+
+
+WAVEFORMS = {
+    'sine': _sine,
+    'square': _square,
+    'saw': _saw,
+    'triangle': _triangle,
+    'noise': _noise,
+}
+
+
+# --- ZARFLAR ---
+# t: 0..1 arası normalize zaman (i / örnek_sayısı)
+def _linear(t, n, attack, release):
+    return 1.0 - t
+
+
+def _exponential(t, n, attack, release):
+    # Vuruş sesleri için hızlı sönümleme (sonunda ~%1)
+    return np.exp(-4.6 * t)
+
+
+ADSR_SUSTAIN = 0.6      # Sustain seviyesi
+ADSR_DECAY_SHARE = 0.15  # Decay evresinin toplam süredeki payı
+
+
+def _adsr(t, n, attack, release, sustain=ADSR_SUSTAIN):
+    """Attack / decay / sustain / release; attack ve release ms cinsinden"""
+    env = np.full(n, sustain)
+    a = min(n, int(SAMPLE_RATE * attack / 1000))
+    r = min(n - a, int(SAMPLE_RATE * release / 1000))
+    d = min(n - a - r, int(n * ADSR_DECAY_SHARE))
+    if a:
+        env[:a] = np.linspace(0.0, 1.0, a, endpoint=False)
+    if d:
+        env[a:a + d] = np.linspace(1.0, sustain, d, endpoint=False)
+    if r:
+        env[n - r:] = np.linspace(sustain, 0.0, r)
+    return env
+
+
+def _flat(t, n, attack, release):
+    return np.ones(n)
+
+
+ENVELOPES = {
+    'linear': _linear,
+    'exp': _exponential,
+    'adsr': _adsr,
+    'flat': _flat,
+}
+
+
+def tone(freq, duration_ms, decay=1.0, wave='sine', envelope='linear', freq_end=None,
+         attack=5, release=40, seed=0):
+    """int16 mono örnek dizisi üretir.
+
+    decay: genel genlik çarpanı (eski generate_sound_effect ile aynı anlam)
+    freq_end: verilirse frekans süre boyunca freq'ten freq_end'e kayar (pitch sweep)
+    attack / release: sadece 'adsr' zarfı için, ms
+    """
+    n = int(SAMPLE_RATE * duration_ms / 1000)
+    i = np.arange(n, dtype=np.float64)
+    t = i / n if n else i
+    if freq_end is None:
+        phase = freq * i / SAMPLE_RATE
+    else:
+        # Anlık frekansın integrali: doğrusal kayma için kapalı form
+        phase = (freq * i + (freq_end - freq) * i * t / 2) / SAMPLE_RATE
+    osc = WAVEFORMS[wave](phase, np.random.default_rng(seed))
+    env = ENVELOPES[envelope](t, n, attack, release)
+    # int() gibi sıfıra doğru kırp (eski döngüyle bire bir aynı örnekler)
+    return np.trunc(MAX_AMP * decay * env * osc).astype(np.int16)
+
+
+def to_sound(samples):
+    """Mono int16 örnekleri mixer'ın kanal sayısına çoğaltıp Sound'a çevirir"""
+    mixer = pygame.mixer.get_init()
+    channels = mixer[2] if mixer else 2
+    frames = np.repeat(samples[:, None], channels, axis=1) if channels > 1 else samples
+    return pygame.mixer.Sound(buffer=np.ascontiguousarray(frames, dtype='<i2').tobytes())
+
+
+# --- YEDEK SES BANKASI ---
+# Asset dosyası yoksa çalınan efektler. Değerler eski main.py çağrılarıyla aynı,
+# yani varsayılan ses karakteri değişmedi; yeni dalga/zarf seçenekleri buraya eklenebilir.
+FALLBACK_PRESETS = {
+    'jump': dict(freq=350, duration_ms=90),
+    'dash': dict(freq=700, duration_ms=60),
+    'slam': dict(freq=100, duration_ms=150, decay=0.7),
+    'explosion': dict(freq=50, duration_ms=300, decay=0.5),
+    'ambient': dict(freq=100, duration_ms=1000),
+}
+
+
+def preset_samples(name):
+    return tone(**FALLBACK_PRESETS[name])
+
+
+def make_sound(name):
+    """Adı verilen yedek efekti Sound olarak üretir"""
+    return to_sound(preset_samples(name))
@@ -0,0 +1,81 @@
+import pygame
+from collections import OrderedDict
+
+# --- METİN ÇİZİM SERVİSİ ---
+# pygame.font.Font oluşturmak ve metni render etmek pahalı. HUD, menüler ve glitch başlıkları
+# her kare aynı metinleri çiziyor; burada fontlar boyuta göre, render edilmiş yüzeyler ise
+# (metin, boyut, renk) anahtarıyla LRU olarak saklanır. Bellek sınırı aşılınca en eski atılır.
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class TextCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_font(self, size):
+        """draw_text'in boyut kuralıyla (size * 1.5) cache'li font döner"""
+        px = int(size * 1.5)
+        font = self.fonts.get(px)
+        if font is None:
+            font = pygame.font.Font(None, px)
+            self.fonts[px] = font
+        return font
+
+    def render(self, text, size, color):
+        key = (text, size, tuple(color))
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = self.get_font(size).render(text, True, color)
+        nbytes = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        if nbytes > self.max_bytes:
+            return surf  # Sınırdan büyük tek yüzeyi saklamaya değmez
+
+        self.surfaces[key] = surf
+        self.bytes_used += nbytes
+        while self.bytes_used > self.max_bytes:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes_used -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.evictions += 1
+        return surf
+
+    def prewarm(self, sizes=(), items=()):
+        """Fontları (draw_text boyutlarıyla) ve (metin, boyut, renk) yüzeylerini önceden hazırlar"""
+        for size in sizes:
+            self.get_font(size)
+        for text, size, color in items:
+            self.render(text, size, color)
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes_used = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.surfaces),
+            'fonts': len(self.fonts),
+            'bytes': self.bytes_used,
+            'max_bytes': self.max_bytes,
+        }
+
+
+TEXT_CACHE = TextCache()
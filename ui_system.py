@@ -3,6 +3,51 @@ import random
 import math
 from settings import *
 from utils import draw_text
+from text_cache import TEXT_CACHE
+
+# --- STATİK KATMAN CACHE'İ ---
+# Menü / ayarlar / yükleme / pause / game over ekranlarının neredeyse tamamı kareden kareye değişmiyor.
+# Her ekranın sabit kısmı (arka plan, ızgara, paneller, normal haldeki butonlar, başlıklar)
+# bir kez opak bir yüzeye çizilir ve her kare tek blit ile basılır. Üstüne sadece
+# hover olan buton, glitch titremesi ve gerçekten değişen değerler (bar, loglar, yanıp sönen yazı) çizilir.
+# Katmanın anahtarı ekran boyutunu ve içeriği belirleyen değerleri (ayarlar, skor) içerir;
+# anahtar değişince katman yeniden üretilir. Tema/çözünürlük değişiminde invalidate_static_layers() çağrılır.
+
+_static_layers = {}  # ekran adı -> (anahtar, yüzey)
+
+def invalidate_static_layers():
+    """Tüm cache'lenmiş ekran katmanlarını düşürür (ayar / tema / çözünürlük değişimi)"""
+    _static_layers.clear()
+
+# Ekranlarda kullanılan font boyutları ve oyun içi HUD'un sabit metinleri:
+# asset yükleyici bunları ilk oyun karesinden önce TEXT_CACHE'e hazırlar
+UI_FONT_SIZES = (16, 20, 25, 30, 35, 45, 55, 60, 80, 90, 100, 140)
+HUD_TEXTS = (("DASH", 20, PLAYER_DASH), ("SLAM", 20, PLAYER_SLAM),
+             ("STATUS", 25, (0, 0, 0)), ("DATA_STREAM", 25, (0, 0, 0)))
+
+def prewarm_ui_text():
+    """Fontları açar ve HUD etiketlerini önceden render eder"""
+    TEXT_CACHE.prewarm(UI_FONT_SIZES, HUD_TEXTS)
+
+def _blit_static_layer(surface, name, key, builder):
+    """Ekranın statik katmanını (gerekirse üretip) surface'a basar"""
+    key = (surface.get_size(), key)
+    entry = _static_layers.get(name)
+    if entry is None or entry[0] != key:
+        layer = pygame.Surface(surface.get_size(), 0, surface)
+        builder(layer)
+        entry = (key, layer)
+        _static_layers[name] = entry
+    surface.blit(entry[1], (0, 0))
+
+def draw_glitch_jitter(surface, text, size, x, y, color, intensity=2):
+    """draw_glitch_text'in sadece değişen kısmı: metin statik katmanda zaten var"""
+    if random.random() < 0.1:
+        off_x = random.randint(-intensity, intensity)
+        off_y = random.randint(-intensity, intensity)
+        draw_text(surface, text, size, x + off_x, y + off_y, (255, 0, 100)) # Kirmizi golge
+        draw_text(surface, text, size, x - off_x, y - off_y, (0, 255, 255)) # Turkuaz golge
+        draw_text(surface, text, size, x, y, color)
 
 def draw_glitch_text(surface, text, size, x, y, color, intensity=2):
     """Metne anlik kayma (glitch) efekti verir"""
@@ -52,8 +97,24 @@ def draw_button(surface, rect, text, is_hovered, color_theme=BUTTON_COLOR):
     text_col = WHITE if is_hovered else BUTTON_TEXT_COLOR
     draw_text(surface, text, 30, draw_rect.centerx, draw_rect.centery, text_col)
 
-def render_main_menu(surface, mouse_pos, buttons):
-    """Ana Menüyü Çizer"""
+def _main_menu_buttons(w):
+    """(anahtar, rect, yazı, renk) - ana menü buton yerleşimi"""
+    return [
+        ('start', pygame.Rect(w//2 - 150, 350, 300, 60), "INITIALIZE SYSTEM", BUTTON_COLOR),
+        ('settings', pygame.Rect(w//2 - 150, 430, 300, 60), "CONFIGURATION", BUTTON_COLOR),
+        ('exit', pygame.Rect(w//2 - 150, 510, 300, 60), "TERMINATE", (60, 0, 0)),
+    ]
+
+def _draw_hover_buttons(surface, mouse_pos, buttons):
+    """Statik katmandaki normal butonların üstüne sadece hover olanı çizer"""
+    active_buttons = {}
+    for key, rect, text, color in buttons:
+        if rect.collidepoint(mouse_pos):
+            draw_button(surface, rect, text, True, color)
+        active_buttons[key] = rect
+    return active_buttons
+
+def _build_main_menu(surface):
     w, h = surface.get_width(), surface.get_height()
     surface.fill(UI_BG_COLOR)
     
@@ -63,46 +124,26 @@ def render_main_menu(surface, mouse_pos, buttons):
     for i in range(0, h, 50):
         pygame.draw.line(surface, (255, 255, 255, 10), (0, i), (w, i))
 
-    draw_glitch_text(surface, "NEON RUNNER", 140, w//2, 150, UI_BORDER_COLOR, 5)
+    draw_text(surface, "NEON RUNNER", 140, w//2, 150, UI_BORDER_COLOR)
     draw_text(surface, "SYSTEM OVERRIDE: v3.1", 30, w//2, 230, (100, 200, 200))
     
     # Menü Kutusu
     menu_rect = pygame.Rect(w//2 - 200, 300, 400, 400)
     draw_cyber_panel(surface, menu_rect, UI_BORDER_COLOR, "MAIN_ACCESS")
     
-    active_buttons = {}
-    
-    # Butonları çiz
-    btn_start_rect = pygame.Rect(w//2 - 150, 350, 300, 60)
-    is_hover = btn_start_rect.collidepoint(mouse_pos)
-    draw_button(surface, btn_start_rect, "INITIALIZE SYSTEM", is_hover)
-    active_buttons['start'] = btn_start_rect
-    
-    btn_settings_rect = pygame.Rect(w//2 - 150, 430, 300, 60)
-    is_hover = btn_settings_rect.collidepoint(mouse_pos)
-    draw_button(surface, btn_settings_rect, "CONFIGURATION", is_hover)
-    active_buttons['settings'] = btn_settings_rect
-    
-    btn_exit_rect = pygame.Rect(w//2 - 150, 510, 300, 60)
-    is_hover = btn_exit_rect.collidepoint(mouse_pos)
-    draw_button(surface, btn_exit_rect, "TERMINATE", is_hover, (60, 0, 0))
-    active_buttons['exit'] = btn_exit_rect
-    
-    return active_buttons
+    for key, rect, text, color in _main_menu_buttons(w):
+        draw_button(surface, rect, text, False, color)
 
-def render_settings_menu(surface, mouse_pos, settings_data):
-    """Gelişmiş Ayarlar Menüsü"""
-    w, h = surface.get_width(), surface.get_height()
-    surface.fill(UI_BG_COLOR)
-    
-    draw_glitch_text(surface, "SYSTEM CONFIG", 80, w//2, 80, UI_BORDER_COLOR)
-    
-    # Panel boyutunu arttırdık ki daha çok ayar sığsın
-    panel_rect = pygame.Rect(w//2 - 350, 150, 700, 550)
-    draw_cyber_panel(surface, panel_rect, UI_BORDER_COLOR, "USER_PREFERENCES")
-    
-    active_buttons = {}
-    
+def render_main_menu(surface, mouse_pos, buttons):
+    """Ana Menüyü Çizer"""
+    w = surface.get_width()
+    _blit_static_layer(surface, 'MENU', None, _build_main_menu)
+    draw_glitch_jitter(surface, "NEON RUNNER", 140, w//2, 150, UI_BORDER_COLOR, 5)
+    return _draw_hover_buttons(surface, mouse_pos, _main_menu_buttons(w))
+
+def _settings_buttons(w, settings_data):
+    """(anahtar, rect, yazı, renk) - ayar menüsü buton yerleşimi, yazılar güncel ayarlardan"""
+    buttons = []
     current_y = 200
     spacing = 75
     btn_w = 600
@@ -111,9 +152,7 @@ def render_settings_menu(surface, mouse_pos, settings_data):
     # 1. DISPLAY MODE (Fullscreen/Windowed)
     mode_text = "MODE: [FULLSCREEN]" if settings_data['fullscreen'] else "MODE: [WINDOWED]"
     mode_color = (0, 100, 0) if settings_data['fullscreen'] else (50, 50, 50)
-    btn_mode = pygame.Rect(btn_x, current_y, btn_w, 60)
-    draw_button(surface, btn_mode, mode_text, btn_mode.collidepoint(mouse_pos), mode_color)
-    active_buttons['toggle_fullscreen'] = btn_mode
+    buttons.append(('toggle_fullscreen', pygame.Rect(btn_x, current_y, btn_w, 60), mode_text, mode_color))
     current_y += spacing
 
     # 2. RESOLUTION
@@ -121,55 +160,67 @@ def render_settings_menu(surface, mouse_pos, settings_data):
     res_idx = settings_data.get('res_index', 1) # Default 1 (1920x1080)
     res_tuple = AVAILABLE_RESOLUTIONS[res_idx]
     res_text = f"RESOLUTION: < {res_tuple[0]} x {res_tuple[1]} >"
-    btn_res = pygame.Rect(btn_x, current_y, btn_w, 60)
-    draw_button(surface, btn_res, res_text, btn_res.collidepoint(mouse_pos), (0, 50, 100))
-    active_buttons['change_resolution'] = btn_res
+    buttons.append(('change_resolution', pygame.Rect(btn_x, current_y, btn_w, 60), res_text, (0, 50, 100)))
     current_y += spacing
 
     # 3. FPS LIMIT
     fps_val = settings_data.get('fps_limit', 60)
     fps_text = f"MAX FPS: < {fps_val} >"
-    btn_fps = pygame.Rect(btn_x, current_y, btn_w, 60)
-    draw_button(surface, btn_fps, fps_text, btn_fps.collidepoint(mouse_pos), (100, 50, 0))
-    active_buttons['change_fps'] = btn_fps
+    buttons.append(('change_fps', pygame.Rect(btn_x, current_y, btn_w, 60), fps_text, (100, 50, 0)))
     current_y += spacing
     
     # 4. VFX QUALITY
     q_text = f"VFX QUALITY: [{settings_data['quality']}]"
-    q_color = (0, 0, 100) if settings_data['quality'] == 'HIGH' else (50, 50, 0)
-    btn_q = pygame.Rect(btn_x, current_y, btn_w, 60)
-    draw_button(surface, btn_q, q_text, btn_q.collidepoint(mouse_pos), q_color)
-    active_buttons['toggle_quality'] = btn_q
+    q_color = {'AUTO': (0, 80, 60), 'HIGH': (0, 0, 100)}.get(settings_data['quality'], (50, 50, 0))
+    buttons.append(('toggle_quality', pygame.Rect(btn_x, current_y, btn_w, 60), q_text, q_color))
     current_y += spacing
 
     # 5. APPLY BUTTON (Özellikle çözünürlük değişimi için)
-    btn_apply = pygame.Rect(btn_x + 100, current_y, btn_w - 200, 60)
-    draw_button(surface, btn_apply, ">> APPLY SETTINGS <<", btn_apply.collidepoint(mouse_pos), (0, 150, 0))
-    active_buttons['apply_changes'] = btn_apply
+    buttons.append(('apply_changes', pygame.Rect(btn_x + 100, current_y, btn_w - 200, 60), ">> APPLY SETTINGS <<", (0, 150, 0)))
     current_y += spacing + 20
 
     # Back Button
-    btn_back = pygame.Rect(w//2 - 150, current_y, 300, 60)
-    draw_button(surface, btn_back, "< RETURN", btn_back.collidepoint(mouse_pos))
-    active_buttons['back'] = btn_back
-    
-    return active_buttons
+    buttons.append(('back', pygame.Rect(w//2 - 150, current_y, 300, 60), "< RETURN", BUTTON_COLOR))
+    return buttons
+
+def render_settings_menu(surface, mouse_pos, settings_data):
+    """Gelişmiş Ayarlar Menüsü"""
+    w = surface.get_width()
+    buttons = _settings_buttons(w, settings_data)
+
+    def build(layer):
+        layer.fill(UI_BG_COLOR)
+        draw_text(layer, "SYSTEM CONFIG", 80, w//2, 80, UI_BORDER_COLOR)
+        # Panel boyutunu arttırdık ki daha çok ayar sığsın
+        panel_rect = pygame.Rect(w//2 - 350, 150, 700, 550)
+        draw_cyber_panel(layer, panel_rect, UI_BORDER_COLOR, "USER_PREFERENCES")
+        for key, rect, text, color in buttons:
+            draw_button(layer, rect, text, False, color)
+
+    # Buton yazıları ayarlara bağlı: ayar değişince katman yeniden üretilir
+    layer_key = tuple((text, color) for _, _, text, color in buttons)
+    _blit_static_layer(surface, 'SETTINGS', layer_key, build)
+    draw_glitch_jitter(surface, "SYSTEM CONFIG", 80, w//2, 80, UI_BORDER_COLOR)
+    return _draw_hover_buttons(surface, mouse_pos, buttons)
 
 def render_loading_screen(surface, progress, logs):
-    """Sahte yükleme ekranı"""
+    """Yükleme ekranı: AssetLoader ilerlemesi ve logları"""
     w, h = surface.get_width(), surface.get_height()
-    surface.fill((0, 0, 0))
-    
-    # Merkez Logo
-    draw_glitch_text(surface, "SYSTEM LOADING", 60, w//2, h//2 - 100, WHITE, 2)
     
     # Bar Arkaplan
     bar_width = min(800, w - 100)
     bar_height = 20
     bar_x = w//2 - bar_width//2
     bar_y = h//2
-    
-    pygame.draw.rect(surface, LOADING_BAR_BG, (bar_x, bar_y, bar_width, bar_height))
+
+    def build(layer):
+        layer.fill((0, 0, 0))
+        # Merkez Logo
+        draw_text(layer, "SYSTEM LOADING", 60, w//2, h//2 - 100, WHITE)
+        pygame.draw.rect(layer, LOADING_BAR_BG, (bar_x, bar_y, bar_width, bar_height))
+
+    _blit_static_layer(surface, 'LOADING', None, build)
+    draw_glitch_jitter(surface, "SYSTEM LOADING", 60, w//2, h//2 - 100, WHITE, 2)
     
     # Bar Dolumu
     fill_width = int(bar_width * progress)
@@ -182,12 +233,20 @@ def render_loading_screen(surface, progress, logs):
     # Yüzde
     draw_text(surface, f"{int(progress * 100)}%", 30, bar_x + bar_width + 40, bar_y + 10, WHITE)
     
-    # Sahte Loglar
+    # Yükleme logları
     log_y = bar_y + 50
     for i, log in enumerate(logs[-5:]): # Son 5 logu göster
         col = (0, 255, 0) if "DONE" in log or "OK" in log else (150, 200, 255)
         draw_text(surface, f"> {log}", 20, bar_x, log_y + i*25, col, center=False)
 
+def _build_paused(surface):
+    w, h = surface.get_width(), surface.get_height()
+    surface.fill(PAUSE_OVERLAY_COLOR)
+    panel_rect = pygame.Rect(w//2 - 300, h//2 - 150, 600, 300)
+    draw_cyber_panel(surface, panel_rect, (0, 180, 255), "SYSTEM SUSPENDED")
+    draw_text(surface, "PAUSED", 100, w//2, h//2 - 30, WHITE)
+    draw_text(surface, "PRESS 'P' TO RESUME", 35, w//2, h//2 + 60, (150, 150, 150))
+
 def render_ui(surface, state, data, mouse_pos=(0,0)):
     """Ana render yöneticisi"""
     time_ms = data.get('time_ms', pygame.time.get_ticks())
@@ -205,21 +264,23 @@ def render_ui(surface, state, data, mouse_pos=(0,0)):
         render_loading_screen(surface, data['progress'], data['logs'])
         
     elif state == 'PAUSED':
-        surface.fill(PAUSE_OVERLAY_COLOR)
-        panel_rect = pygame.Rect(w//2 - 300, h//2 - 150, 600, 300)
-        draw_cyber_panel(surface, panel_rect, (0, 180, 255), "SYSTEM SUSPENDED")
-        draw_glitch_text(surface, "PAUSED", 100, w//2, h//2 - 30, WHITE)
-        draw_text(surface, "PRESS 'P' TO RESUME", 35, w//2, h//2 + 60, (150, 150, 150))
+        _blit_static_layer(surface, 'PAUSED', None, _build_paused)
+        draw_glitch_jitter(surface, "PAUSED", 100, w//2, h//2 - 30, WHITE)
 
     elif state == 'GAME_OVER':
-        surface.fill((30, 0, 0, 240))
-        draw_glitch_text(surface, "CRITICAL FAILURE", 90, w//2, h//2 - 140, (255, 50, 50), 6)
-        
-        panel_rect = pygame.Rect(w//2 - 250, h//2 - 40, 500, 160)
-        draw_cyber_panel(surface, panel_rect, (255, 50, 50), "DIAGNOSTICS")
-        
-        draw_text(surface, f"SCORE: {int(data['score'])}", 55, w//2, h//2 + 10, WHITE)
-        draw_text(surface, f"HIGH SCORE: {data['high_score']}", 35, w//2, h//2 + 70, (0, 255, 255))
+        score, high_score = int(data['score']), data['high_score']
+
+        def build(layer):
+            layer.fill((30, 0, 0, 240))
+            draw_text(layer, "CRITICAL FAILURE", 90, w//2, h//2 - 140, (255, 50, 50))
+            panel_rect = pygame.Rect(w//2 - 250, h//2 - 40, 500, 160)
+            draw_cyber_panel(layer, panel_rect, (255, 50, 50), "DIAGNOSTICS")
+            draw_text(layer, f"SCORE: {score}", 55, w//2, h//2 + 10, WHITE)
+            draw_text(layer, f"HIGH SCORE: {high_score}", 35, w//2, h//2 + 70, (0, 255, 255))
+
+        # Skor game over boyunca sabit: katman her yeni sonuçta bir kez üretilir
+        _blit_static_layer(surface, 'GAME_OVER', (score, high_score), build)
+        draw_glitch_jitter(surface, "CRITICAL FAILURE", 90, w//2, h//2 - 140, (255, 50, 50), 6)
         
         if time_ms % 1000 < 500:
             draw_text(surface, "PRESS 'R' TO REBOOT", 45, w//2, h//2 + 180, WHITE)
@@ -245,4 +306,66 @@ def render_ui(surface, state, data, mouse_pos=(0,0)):
         draw_cyber_panel(surface, score_rect, WHITE, "DATA_STREAM")
         draw_text(surface, f"{int(data['score']):08d}", 45, w - 150, 70, WHITE)
     
-    return interactive_elements
\ No newline at end of file
+    return interactive_elements
+
+
+def render_profiler_overlay(surface, profiler, budget_ms, governor=None, tier=None, vfx=None):
+    """Canlı kare süresi grafiği, span dökümü, kalite kademesi / governor kararları ve VFX bütçesi (F3)"""
+    h = surface.get_height()
+    frame_times = profiler.recent_frame_times()
+    breakdown = profiler.span_breakdown()
+    decisions = list(governor.decisions) if governor is not None else []
+    extra = 22 * (1 + len(decisions)) if tier else 0
+    if vfx is not None:
+        extra += 22
+
+    graph_w, graph_h = 480, 110
+    panel_rect = pygame.Rect(40, h - 200 - graph_h - 22 * len(breakdown) - extra, graph_w + 40,
+                             graph_h + 60 + 22 * len(breakdown) + extra)
+    draw_cyber_panel(surface, panel_rect, (0, 255, 128), "PROFILER")
+
+    # Grafik: 0 .. 2x bütçe aralığı, bütçeyi aşan kareler kırmızı
+    gx, gy = panel_rect.x + 20, panel_rect.y + 20
+    scale_ms = budget_ms * 2.0
+    pygame.draw.rect(surface, (20, 20, 20), (gx, gy, graph_w, graph_h))
+    bar_w = graph_w / profiler.frame_history
+    for i, ms in enumerate(frame_times):
+        bar_h = min(graph_h, int(graph_h * ms / scale_ms))
+        col = (0, 255, 128) if ms <= budget_ms else (255, 60, 60)
+        x = gx + int(i * bar_w)
+        pygame.draw.line(surface, col, (x, gy + graph_h), (x, gy + graph_h - bar_h))
+    budget_y = gy + graph_h - int(graph_h * budget_ms / scale_ms)
+    pygame.draw.line(surface, (255, 200, 0), (gx, budget_y), (gx + graph_w, budget_y))
+
+    last_ms = frame_times[-1] if frame_times else 0.0
+    worst_ms = max(frame_times) if frame_times else 0.0
+    draw_text(surface, f"FRAME {last_ms:5.1f} ms  WORST {worst_ms:5.1f} ms  BUDGET {budget_ms:4.1f} ms",
+              16, gx, gy + graph_h + 8, WHITE, center=False)
+
+    # Span dökümü (son 60 kare ortalaması)
+    y = gy + graph_h + 32
+    for name, depth, ms in breakdown:
+        col = (255, 60, 60) if ms > budget_ms * 0.5 else (150, 200, 255)
+        draw_text(surface, f"{'  ' * depth}{name}", 16, gx, y, col, center=False)
+        draw_text(surface, f"{ms:6.2f} ms", 16, gx + graph_w - 80, y, col, center=False)
+        y += 22
+
+    # Kalite kademesi ve governor'ın son kararları
+    if tier:
+        if governor is not None:
+            label = f"QUALITY AUTO: {tier}  p90 {governor.last_p90:5.1f} ms"
+        else:
+            label = f"QUALITY FIXED: {tier}"
+        draw_text(surface, label, 16, gx, y, (255, 200, 0), center=False)
+        y += 22
+        for line in decisions:
+            draw_text(surface, line, 16, gx, y, (200, 200, 200), center=False)
+            y += 22
+
+    # VFX bütçesi: tahmini efekt maliyeti ve bütçe için yapılan kesintiler (toplam)
+    if vfx is not None:
+        limit = f"{vfx['budget'] / 1000.0:4.1f}" if vfx['budget'] is not None else "  -"
+        col = (255, 60, 60) if vfx['budget'] is not None and vfx['cost'] > vfx['budget'] * 0.9 else (150, 200, 255)
+        draw_text(surface, f"VFX {vfx['cost'] / 1000.0:4.1f} / {limit} ms  SHORTENED {vfx['degraded']}  "
+                  f"DROPPED {vfx['culled']}", 16, gx, y, col, center=False)
+        y += 22
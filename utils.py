@@ -1,11 +1,10 @@
 import pygame
 import math
-import struct
 import random
 import os
 import sys
-
-SAMPLE_RATE = 44100
+from text_cache import TEXT_CACHE
+from synth import SAMPLE_RATE, tone, to_sound, make_sound
 
 def resource_path(relative_path):
     try:
@@ -14,18 +13,12 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-def generate_sound_effect(freq, duration_ms, decay=1.0):
-    num_samples = int(SAMPLE_RATE * duration_ms / 1000)
-    max_amp = 32767
-    buffer = bytearray()
-    for i in range(num_samples):
-        t = i / num_samples
-        sample = int(max_amp * (1 - t) * decay * math.sin(2 * math.pi * freq * i / SAMPLE_RATE))
-        buffer += struct.pack('<hh', sample, sample)
-    return pygame.mixer.Sound(buffer=buffer)
+def generate_sound_effect(freq, duration_ms, decay=1.0, **kwargs):
+    """Sönümlenen sinüs efekti (synth.tone: wave / envelope / freq_end ile başka sesler de üretilebilir)"""
+    return to_sound(tone(freq, duration_ms, decay, **kwargs))
 
 def generate_ambient_fallback():
-    return generate_sound_effect(100, 1000)
+    return make_sound('ambient')
 
 def load_sound_asset(filepath, fallback_func, volume):
     try:
@@ -36,8 +29,7 @@ def load_sound_asset(filepath, fallback_func, volume):
     return s
 
 def draw_text(surface, text, size, x, y, color=(255, 255, 255), center=True):
-    font = pygame.font.Font(None, int(size * 1.5))
-    s = font.render(text, True, color)
+    s = TEXT_CACHE.render(text, size, color)
     r = s.get_rect()
     if center: r.center = (x, y)
     else: r.topleft = (x, y)
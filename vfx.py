@@ -2,11 +2,49 @@ import pygame
 import random
 import math
 from settings import *
+from glow import GLOW_ATLAS
+from rng_streams import FX_RNG
 
 # --- OPTIMIZASYON NOTU ---
 # Eski sistemde her efekt kendi Surface'ini oluşturuyordu. 
 # Bu versiyonda tüm efektler doğrudan verilen hedef yüzeye (target_surface) çizilir.
 # Bu, bellek tahsisini (allocation) ve çöp toplama (garbage collection) yükünü %90 azaltır.
+#
+# draw() çizdiği alanı (Rect, hiçbir şey çizmediyse None) döner: VfxLayer sadece kirlenen bölgeleri
+# temizler ve birleştirir.
+#
+# Efektler vfx_pool.EffectPool ile havuzlanır: __init__ sadece reset()'i çağırır, havuz ölü bir
+# örneği aynı reset() ile yeniden kurar. Ömrü biten efekt finish() ile 'dead' olarak işaretlenir.
+# VfxPools'un maliyet bütçesi için her efekt çizim yükünü birim olarak söyler (budget_units: parçacık,
+# halka, şimşek noktası) ve gerekirse kendini inceltebilir (degrade).
+
+class PooledEffect(pygame.sprite.Sprite):
+    """Havuzlanabilir efekt tabanı: reset(*args) ile (yeniden) kurulur, finish() ile ölür"""
+    dead = False
+
+    @classmethod
+    def blank(cls):
+        """Havuz için kurulmamış (ölü) örnek; ilk reset() alanları doldurur"""
+        effect = cls.__new__(cls)
+        pygame.sprite.Sprite.__init__(effect)
+        effect.alloc()
+        effect.dead = True
+        return effect
+
+    def alloc(self):
+        """reset()'in yeniden kullandığı kapsayıcıları açar"""
+
+    def budget_units(self):
+        """Çizim maliyetinin birimi (tip başına birim maliyet vfx_pool'da)"""
+        return 1
+
+    def degrade(self):
+        """Efekti görünür bırakıp çizim yükünü azaltır; inceltilemiyorsa False"""
+        return False
+
+    def finish(self):
+        self.dead = True
+        self.kill()
 
 def draw_cyber_grid(surface, time_ms):
     """Menüdeki hareketli ızgarayı çizer."""
@@ -23,9 +61,13 @@ def draw_cyber_grid(surface, time_ms):
         if draw_y < SCREEN_HEIGHT:
             pygame.draw.line(surface, grid_color, (0, draw_y), (SCREEN_WIDTH, draw_y), 1)
 
-class LightningBolt(pygame.sprite.Sprite):
+class LightningBolt(PooledEffect):
     def __init__(self, start_x, start_y, end_x, end_y, color, life=15, displace=15):
         super().__init__()
+        self.reset(start_x, start_y, end_x, end_y, color, life, displace)
+
+    def reset(self, start_x, start_y, end_x, end_y, color, life=15, displace=15):
+        self.dead = False
         self.color = color
         self.life = life
         self.initial_life = life
@@ -54,13 +96,16 @@ class LightningBolt(pygame.sprite.Sprite):
             t = i / num_points
             mid_x, mid_y = x1 + t * dx, y1 + t * dy
             offset_factor = 1 - abs(t - 0.5) * 2
-            offset = random.uniform(-displace, displace) * offset_factor
+            offset = FX_RNG.uniform(-displace, displace) * offset_factor
             jagged_x = mid_x + offset * perp_x
             jagged_y = mid_y + offset * perp_y
             self.segments.append((jagged_x, jagged_y))
 
         self.segments.append((x2, y2))
 
+    def budget_units(self):
+        return len(self.segments)
+
     def update(self, camera_speed):
         # List comprehension yerine in-place update daha hızlıdır ama kod okunabilirliği için bırakıldı
         self.segments = [(x - camera_speed + self.vx, y + self.vy) for x, y in self.segments]
@@ -70,7 +115,7 @@ class LightningBolt(pygame.sprite.Sprite):
         life_ratio = max(0, self.life / self.initial_life)
         self.alpha = int(255 * life_ratio)
         
-        if self.life <= 0: self.kill()
+        if self.life <= 0: self.finish()
 
     def draw(self, surface):
         if self.life > 0 and len(self.segments) >= 2:
@@ -81,15 +126,17 @@ class LightningBolt(pygame.sprite.Sprite):
             glow_color = (r, g, b, glow_alpha)
             
             # Glow (Dış Işıma)
+            glow = None
             if glow_alpha > 0:
-                pygame.draw.lines(surface, glow_color, False, self.segments, 6)
+                glow = pygame.draw.lines(surface, glow_color, False, self.segments, 6)
             
             # Orta Katman (Renk)
-            pygame.draw.lines(surface, (min(255, r+50), min(255, g+50), min(255, b+50), int(self.alpha*0.8)), False, self.segments, 3)
+            dirty = pygame.draw.lines(surface, (min(255, r+50), min(255, g+50), min(255, b+50), int(self.alpha*0.8)), False, self.segments, 3)
 
             # Çekirdek (Beyaz/Parlak)
             core_color = (255, 255, 255, self.alpha)
             pygame.draw.lines(surface, core_color, False, self.segments, 1)
+            return dirty.union(glow) if glow else dirty
 
 class FlameSpark(pygame.sprite.Sprite):
     def __init__(self, x, y, angle, speed, base_color, life=40, size=8):
@@ -142,23 +189,43 @@ class FlameSpark(pygame.sprite.Sprite):
             if core_size > 0:
                 pygame.draw.circle(surface, core_color, center, core_size)
 
-class Shockwave(pygame.sprite.Sprite):
+class Shockwave(PooledEffect):
     def __init__(self, x, y, color, max_radius=150, width=8, speed=10, rings=3):
         super().__init__()
+        self.alloc()
+        self.reset(x, y, color, max_radius, width, speed, rings)
+
+    def alloc(self):
+        self.ring_data = []
+
+    def reset(self, x, y, color, max_radius=150, width=8, speed=10, rings=3):
+        self.dead = False
         self.x, self.y = x, y
         self.color = color
         self.max_radius = max_radius
         self.width = width
         self.speed = speed * 1.5 # Daha hızlı ve agresif
-        self.ring_data = []
         # ABARTILMIŞ ŞOK DALGASI: İç içe daha fazla ve kompleks halka
-        for i in range(rings):
-            self.ring_data.append({
-                'radius': 5 + i * 15,
-                'alpha': 255,
-                'width': max(2, width - i * 1.5),
-                'speed_mult': 1.0 - (i * 0.1) # İç halkalar biraz daha yavaş kalsın, derinlik katar
-            })
+        # Halka sözlükleri yeniden kullanılır (havuzdan dönen örnekte yeni dict açılmaz)
+        ring_data = self.ring_data
+        del ring_data[rings:]
+        while len(ring_data) < rings:
+            ring_data.append({})
+        for i, ring in enumerate(ring_data):
+            ring['radius'] = 5 + i * 15
+            ring['alpha'] = 255
+            ring['width'] = max(2, width - i * 1.5)
+            ring['speed_mult'] = 1.0 - (i * 0.1) # İç halkalar biraz daha yavaş kalsın, derinlik katar
+
+    def budget_units(self):
+        return len(self.ring_data)
+
+    def degrade(self):
+        # Sadece en dıştaki (en hızlı) halka kalır
+        if len(self.ring_data) <= 1:
+            return False
+        del self.ring_data[1:]
+        return True
 
     def update(self, camera_speed):
         self.x -= camera_speed
@@ -175,22 +242,25 @@ class Shockwave(pygame.sprite.Sprite):
                 ring['alpha'] = 0
         
         if all_done:
-            self.kill()
+            self.finish()
 
     def draw(self, surface):
+        dirty = None
         for ring in self.ring_data:
             if ring['alpha'] > 0:
                 center = (int(self.x), int(self.y))
                 radius = int(ring['radius'])
                 width = int(ring['width'])
                 
-                # Ana enerji halkası
+                # Ana enerji halkası (beyaz çizgi bunun içinde kalır)
                 if radius > 1:
-                    pygame.draw.circle(surface, (*self.color, ring['alpha']), center, radius, width)
+                    rect = pygame.draw.circle(surface, (*self.color, ring['alpha']), center, radius, width)
+                    dirty = rect if dirty is None else dirty.union(rect)
                 
                 # İnce beyaz şok çizgisi (daha keskin bir his verir)
                 if radius > 5:
                     pygame.draw.circle(surface, (255, 255, 255, ring['alpha']//2), center, radius - 2, 1)
+        return dirty
 
 class SpeedLine(pygame.sprite.Sprite):
     def __init__(self, x, y, angle, speed, color):
@@ -234,10 +304,14 @@ class SpeedLine(pygame.sprite.Sprite):
             # 3. Parlak Beyaz Çekirdek (Lazer hissi verir)
             pygame.draw.line(surface, (255, 255, 255, self.alpha), start_pos, end_pos, max(1, self.width // 2))
 
-class GhostTrail(pygame.sprite.Sprite):
+class GhostTrail(PooledEffect):
     """Abartılmış 'Cyber' Afterimage Efekti"""
     def __init__(self, x, y, color, life=20, size=15):
         super().__init__()
+        self.reset(x, y, color, life, size)
+
+    def reset(self, x, y, color, life=20, size=15):
+        self.dead = False
         self.x, self.y = x, y
         self.color = color
         self.life = life
@@ -257,11 +331,11 @@ class GhostTrail(pygame.sprite.Sprite):
         self.size = max(5, int(self.size * 0.92))
         
         # Glitch etkisi: Rastgele titreme
-        if random.random() < 0.3:
-            self.jitter_x = random.randint(-3, 3)
-            self.jitter_y = random.randint(-3, 3)
+        if FX_RNG.random() < 0.3:
+            self.jitter_x = FX_RNG.randint(-3, 3)
+            self.jitter_y = FX_RNG.randint(-3, 3)
         
-        if self.life <= 0: self.kill()
+        if self.life <= 0: self.finish()
 
     def draw(self, surface):
         if self.life > 0:
@@ -270,31 +344,17 @@ class GhostTrail(pygame.sprite.Sprite):
             
             if radius < 2: return
 
-            # HOLOGRAFİK SCANLINE EFEKTİ
-            # Dairenin içini yatay çizgilerle dolduruyoruz
-            scan_step = 3 # Çizgi sıklığı
-            for i in range(-radius, radius, scan_step):
-                # Daire formülü: x^2 + y^2 = r^2  => x = sqrt(r^2 - y^2)
-                # Kiriş uzunluğunu hesapla
-                dy = i
-                if abs(dy) >= radius: continue
-                dx = int(math.sqrt(radius**2 - dy**2))
-                
-                start_line = (center[0] - dx, center[1] + dy)
-                end_line = (center[0] + dx, center[1] + dy)
-                
-                # Çizgileri çiz
-                pygame.draw.line(surface, (*self.color, self.alpha), start_line, end_line, 1)
-
-            # Dış Çerçeve (Outline)
-            pygame.draw.circle(surface, (*self.color, self.alpha), center, radius, 1)
+            # HOLOGRAFİK SCANLINE EFEKTİ: yatay çizgilerle dolu daire + çerçeve, atlas'tan tek blit
+            sprite, off = GLOW_ATLAS.hologram(self.color, radius, self.alpha)
+            dirty = surface.blit(sprite, (center[0] - off, center[1] - off))
             
             # Rastgele "bozuk piksel" efekti
             if random.random() < 0.2:
                 glitch_rect = pygame.Rect(center[0] + random.randint(-radius, radius), 
                                         center[1] + random.randint(-radius, radius), 
                                         4, 2)
-                pygame.draw.rect(surface, (255, 255, 255, self.alpha), glitch_rect)
+                dirty = dirty.union(pygame.draw.rect(surface, (255, 255, 255, self.alpha), glitch_rect))
+            return dirty
 
 class EnergyOrb(pygame.sprite.Sprite):
     def __init__(self, x, y, color, size=10, life=30):
@@ -327,32 +387,54 @@ class EnergyOrb(pygame.sprite.Sprite):
             # İç Top
             pygame.draw.circle(surface, (*self.color, self.alpha), center, radius)
 
-class ParticleExplosion(pygame.sprite.Sprite):
+MIN_DEGRADED_PARTICLES = 4   # Bütçe inceltmesinde bir patlamada kalan en az parçacık
+
+class ParticleExplosion(PooledEffect):
     """ABARTILMIŞ: Daire yerine Dijital Kareler (Pixels) Saçılır"""
     def __init__(self, x, y, color, count=20, size_range=(3, 8), life_range=(20, 40)):
         super().__init__()
+        self.alloc()
+        self.reset(x, y, color, count, size_range, life_range)
+
+    def alloc(self):
         self.particles = []
-        for _ in range(count):
-            angle = random.uniform(0, math.pi*2)
-            speed = random.uniform(4, 12) # Hız arttı
-            size = random.uniform(size_range[0], size_range[1] + 4) # Boyut arttı
-            life = random.randint(life_range[0], life_range[1])
-            self.particles.append({
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'initial_size': size,
-                'life': life,
-                'initial_life': life,
-                'color': color,
-                'rotation': random.uniform(0, 360), # Dönme efekti
-                'rot_speed': random.uniform(-5, 5)
-            })
-        self.alive = True
+
+    def reset(self, x, y, color, count=20, size_range=(3, 8), life_range=(20, 40)):
+        self.dead = False
+        # Parçacık sözlükleri yeniden kullanılır (havuzdan dönen örnekte yeni dict açılmaz)
+        particles = self.particles
+        del particles[count:]
+        while len(particles) < count:
+            particles.append({})
+        for p in particles:
+            angle = FX_RNG.uniform(0, math.pi*2)
+            speed = FX_RNG.uniform(4, 12) # Hız arttı
+            size = FX_RNG.uniform(size_range[0], size_range[1] + 4) # Boyut arttı
+            life = FX_RNG.randint(life_range[0], life_range[1])
+            p['x'] = x; p['y'] = y
+            p['vx'] = math.cos(angle) * speed
+            p['vy'] = math.sin(angle) * speed
+            p['size'] = size
+            p['initial_size'] = size
+            p['life'] = life
+            p['initial_life'] = life
+            p['color'] = color
+            p['rotation'] = FX_RNG.uniform(0, 360) # Dönme efekti
+            p['rot_speed'] = FX_RNG.uniform(-5, 5)
+
+    def budget_units(self):
+        return len(self.particles)
+
+    def degrade(self):
+        # Parçacıklar rastgele yönlü: yarısını atmak patlamanın şeklini korur
+        count = len(self.particles)
+        if count <= MIN_DEGRADED_PARTICLES:
+            return False
+        del self.particles[max(MIN_DEGRADED_PARTICLES, count // 2):]
+        return True
 
     def update(self, camera_speed):
-        if not self.alive: return
+        if self.dead: return
             
         alive_particles = 0
         for p in self.particles:
@@ -369,10 +451,10 @@ class ParticleExplosion(pygame.sprite.Sprite):
                 alive_particles += 1
         
         if alive_particles == 0:
-            self.kill()
-            self.alive = False
+            self.finish()
 
     def draw(self, surface):
+        dirty = None
         for p in self.particles:
             if p['life'] > 0:
                 life_ratio = p['life'] / p['initial_life']
@@ -389,14 +471,22 @@ class ParticleExplosion(pygame.sprite.Sprite):
                     
                     # 1. Renkli İç
                     pygame.draw.rect(surface, (*p['color'], alpha), rect)
+                    dirty = rect if dirty is None else dirty.union(rect)
                     
                     # 2. Beyaz Kenar (Highlight)
                     if size > 3:
                         pygame.draw.rect(surface, (255, 255, 255, alpha), rect, 1)
+        return dirty
 
-class ScreenFlash(pygame.sprite.Sprite):
+class ScreenFlash(PooledEffect):
+    """Tam ekran renk flash'ı. Kendi yüzeyi yoktur ve VFX katmanına çizilmez: o karenin tüm flash'ları
+    blend_flashes() ile tek (renk, alpha) değerine indirgenir, VfxLayer birleştirmede bir kez uygular."""
     def __init__(self, color, intensity=100, duration=10):
         super().__init__()
+        self.reset(color, intensity, duration)
+
+    def reset(self, color, intensity=100, duration=10):
+        self.dead = False
         self.color = color
         self.intensity = intensity
         self.duration = duration
@@ -407,24 +497,29 @@ class ScreenFlash(pygame.sprite.Sprite):
         self.life -= 1
         self.alpha = int(self.intensity * (self.life / self.duration))
         if self.life <= 0:
-            self.kill()
+            self.finish()
 
     def draw(self, surface):
-        if self.alpha > 0:
-            # Tüm ekranı kaplayan flash için özel bir durum, burada yeni surface oluşturmak zorundayız
-            # AMA fill kullanıp blit flagleri ile yapabiliriz.
-            # Yine de performans için surface reuse en iyisi, ama bu nadir bir efekt.
-            # Şimdilik basitçe fill ile yapalım, surface oluşturmak yerine.
-            
-            # Fill tüm yüzeyi boyar, o yüzden hedef surface'in boyutlarını alalım.
-            # Ancak bu "screen" üzerine en son çizilmeli. 
-            # Sprite grubu içinde olduğu için, geçici bir surface oluşturup alpha ile basmak zorundayız.
-            # Optimasyon: Bu surface'i __init__'te bir kez oluşturup saklayalım.
-            if not hasattr(self, 'flash_surf'):
-                self.flash_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-                self.flash_surf.fill((*self.color, self.alpha))
-            else:
-                # Alpha güncelle
-                self.flash_surf.fill((*self.color, self.alpha)) # Maliyetli ama nadir
-            
-            surface.blit(self.flash_surf, (0, 0))
\ No newline at end of file
+        return None
+
+
+def blend_flashes(flashes):
+    """Sırayla üst üste basılan flash'ları tek (renk, alpha) değerine indirger; flash yoksa None.
+    Eski yolla aynı sonuç: her flash kendi SRCALPHA yüzeyiyle boş VFX katmanına blit ediliyordu, burada
+    pygame'in SRCALPHA -> SRCALPHA karışımı (renk kaynak alpha'sıyla lineer, alpha birleşimi) tamsayıyla tekrarlanır."""
+    color = None
+    a = 0
+    for flash in flashes:
+        fa = max(0, min(255, int(flash.alpha)))
+        if fa == 0:
+            continue
+        if a == 0:
+            # Şeffaf hedef: kaynak aynen yazılır
+            color = tuple(flash.color)
+            a = fa
+            continue
+        color = tuple((((s - d) * fa + s) >> 8) + d for s, d in zip(flash.color, color))
+        a = fa + a - (fa * a) // 255
+    if a == 0:
+        return None
+    return color, a
\ No newline at end of file
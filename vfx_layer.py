@@ -0,0 +1,141 @@
+import numpy as np
+import pygame
+
+# --- KİRLİ BÖLGELİ VFX KATMANI ---
+# Efektler tam ekran (1920x1080) bir SRCALPHA katmana çizilip canvas'a alpha blit ile birleştiriliyordu;
+# katman her kare tamamen temizleniyor ve tamamen basılıyordu (~4 ms), ekranda üç kıvılcım olsa bile.
+# VfxLayer katmanı TILE px'lik karolara böler. Efektlerin draw()'ları çizdikleri alanı (Rect) döner;
+# bu kare kirlenen karolar birleştirilir, yalnızca onlar canvas'a basılır. Bir sonraki kare başında
+# sadece bu karolar temizlenir (önceki karede çizilmemiş bölge zaten şeffaftır).
+# Kirli alan ekranın FULL_COVERAGE oranını aşarsa tek tam ekran fill / blit daha ucuz: ona düşülür.
+# Efekt yoksa katmanın maliyeti sıfıra yakındır.
+#
+# Ekran flash'ları katmana çizilmez (her biri kendi tam ekran yüzeyini dolduruyordu): birleştirmede
+# tek (renk, alpha) olarak, FLASH_ROWS satırlık ortak bir şeridin yüzey alpha'sıyla canvas'a döşenmesiyle
+# uygulanır. Canlı flash sayısından bağımsız tek geçiş, ~120 KB. Flash eskiden katmanın parçası olduğu için
+# katmanla birlikte (ekran sarsıntısı ofsetiyle) kayar: sadece katmanın canvas'a düştüğü alan boyanır.
+
+TILE = 64
+FULL_COVERAGE = 0.6
+CLEAR = (0, 0, 0, 0)
+FLASH_ROWS = 16
+
+
+class VfxLayer:
+    def __init__(self, size, tile=TILE):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.width, self.height = size
+        self.tile = tile
+        self.cols = -(-self.width // tile)
+        self.rows = -(-self.height // tile)
+        self.dirty = []          # Bu kare efektlerin döndüğü Rect'ler
+        self.drawn = []          # Son birleştirmede basılan bölgeler (bir sonraki kare temizlenir)
+        self.drawn_full = True   # Yeni katman: ilk karede tamamı temizlenir
+        self.frames = 0
+        self.full_frames = 0
+        self.blits = 0
+        self.coverage = 0.0      # Son karenin kirli alan oranı
+        self.flash_strip = None
+        self.flash_color = None
+
+    def begin(self):
+        """Önceki karede basılan bölgeleri temizler; çizime hazır yüzeyi döner"""
+        surface = self.surface
+        if self.drawn_full:
+            surface.fill(CLEAR)
+        else:
+            for rect in self.drawn:
+                surface.fill(CLEAR, rect)
+        self.dirty.clear()
+        return surface
+
+    def mark(self, rect):
+        if rect:
+            self.dirty.append(rect)
+
+    def _regions(self):
+        """Kirli karoları ayrık dikdörtgenlere birleştirir; kapsama oranını da döner"""
+        if not self.dirty:
+            return [], 0.0
+        t = self.tile
+        r = np.array(self.dirty, dtype=np.int32).reshape(-1, 4)
+        c0 = np.clip(r[:, 0] // t, 0, self.cols)
+        r0 = np.clip(r[:, 1] // t, 0, self.rows)
+        c1 = np.clip(-(-(r[:, 0] + r[:, 2]) // t), 0, self.cols)
+        r1 = np.clip(-(-(r[:, 1] + r[:, 3]) // t), 0, self.rows)
+        # 2B fark dizisi + iki cumsum: Rect başına Python döngüsü olmadan karo örtüsü
+        diff = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int32)
+        np.add.at(diff, (r0, c0), 1)
+        np.add.at(diff, (r0, c1), -1)
+        np.add.at(diff, (r1, c0), -1)
+        np.add.at(diff, (r1, c1), 1)
+        grid = diff.cumsum(0).cumsum(1)[:-1, :-1] > 0
+        coverage = float(grid.sum()) / grid.size
+        if coverage > FULL_COVERAGE:
+            return None, coverage
+
+        # Satır içindeki kesintisiz karo dizileri; alt alta aynı dizi tek dikdörtgene uzar
+        edges = np.diff(np.pad(grid, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+        regions = []
+        open_runs = {}
+        for row in range(self.rows):
+            starts = np.nonzero(edges[row] == 1)[0].tolist()
+            ends = np.nonzero(edges[row] == -1)[0].tolist()
+            runs = {}
+            for run in zip(starts, ends):
+                runs[run] = open_runs.pop(run, row)
+            for (a, b), top in open_runs.items():
+                regions.append(pygame.Rect(a * t, top * t, (b - a) * t, (row - top) * t))
+            open_runs = runs
+        for (a, b), top in open_runs.items():
+            regions.append(pygame.Rect(a * t, top * t, (b - a) * t, (self.rows - top) * t))
+        clip = self.surface.get_rect()
+        return [rect.clip(clip) for rect in regions], coverage
+
+    def composite(self, canvas, offset, flash=None):
+        """Bu kare kirlenen bölgeleri canvas'a offset ile basar; flash ((r, g, b), alpha) en üste uygulanır"""
+        regions, self.coverage = self._regions()
+        self.frames += 1
+        if regions is None:
+            canvas.blit(self.surface, offset)
+            self.full_frames += 1
+            self.blits += 1
+            self.drawn_full = True
+        else:
+            ox, oy = offset
+            canvas.blits([(self.surface, (ox + rect.x, oy + rect.y), rect) for rect in regions], False)
+            self.blits += len(regions)
+            self.drawn = regions
+            self.drawn_full = False
+        if flash:
+            area = self.surface.get_rect(topleft=offset).clip(canvas.get_rect())
+            self.apply_flash(canvas, *flash, area)
+
+    def apply_flash(self, canvas, color, alpha, area=None):
+        """canvas'ın area bölgesini (varsayılan: tamamı) tek renk flash'a doğru karıştırır
+        (opak şerit + yüzey alpha'sı, bölgeyi kaplayan blit'ler)"""
+        if area is None:
+            area = canvas.get_rect()
+        strip = self.flash_strip
+        width = canvas.get_width()
+        if strip is None or strip.get_width() != width:
+            strip = self.flash_strip = pygame.Surface((width, FLASH_ROWS), 0, canvas)
+            self.flash_color = None
+        if color != self.flash_color:
+            strip.fill(color)
+            self.flash_color = color
+        strip.set_alpha(alpha)
+        x, w, bottom = area.x, area.width, area.bottom
+        canvas.blits([(strip, (x, y), (0, 0, w, min(FLASH_ROWS, bottom - y)))
+                      for y in range(area.y, bottom, FLASH_ROWS)], False)
+
+    def reset_stats(self):
+        self.frames = self.full_frames = self.blits = 0
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'full_frames': self.full_frames,
+            'blits_per_frame': self.blits / self.frames if self.frames else 0.0,
+            'coverage': self.coverage,
+        }
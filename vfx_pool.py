@@ -0,0 +1,277 @@
+# --- TİPLİ EFEKT HAVUZLARI ---
+# Ağır efektler (patlama, şok dalgası, şimşek, flash) eskiden her spawn'da yeni bir Sprite nesnesi
+# (ve içinde onlarca dict) olarak açılıyor, bir pygame.sprite.Group'a ekleniyordu. Kalabalık anlarda
+# 30 karede bir "ilk 20'yi öldür" temizliği yapılıyordu; yani sınır aşılıyor, sonra toplu kesiliyordu.
+#
+# Burada her efekt tipinin sabit kapasiteli kendi havuzu var:
+#   - Örnekler önceden açılır ve bir free list'te bekler; spawn() ölü bir örneği reset() ile yeniden kurar.
+#   - Canlı örnekler yoğun bir listede tutulur; ölen efekt swap-remove ile (son eleman yerine) çıkarılır.
+#   - Kapasite doluysa ekleme anında en eski canlı efekt feda edilir (yerinde yeniden kurulur).
+# Efekt sınıfları vfx.PooledEffect'ten türer (reset / finish / dead).
+#
+# Adet sınırı çizim maliyetini sınırlamıyordu: 96 patlama ile 96 küçük halka aynı sayılıyordu.
+# VfxPools ayrıca bir maliyet bütçesi tutar: her tipin önceliği ve birim başına tahmini update + çizim
+# süresi (EFFECT_BUDGET) var, canlı efektlerin toplam tahmini maliyeti kare başı bütçeyi (µs) aşamaz.
+# Bütçe her spawn'da uygulanır: önce en düşük öncelikli, en eski efektler inceltilir (degrade),
+# yetmezse bitirilir; yeni efektten daha yüksek öncelikli tiplere dokunulmaz. Yapılan kesintiler
+# tip başına sayılır (stats / budget_stats, F3 overlay).
+
+from vfx import LightningBolt, Shockwave, ParticleExplosion, ScreenFlash, blend_flashes
+
+# Toplam max_vfx bütçesinin tiplere dağılımı (HIGH'da 200 -> 96 / 64 / 32 / 8)
+POOL_SHARES = {
+    ParticleExplosion: 0.48,
+    Shockwave: 0.32,
+    LightningBolt: 0.16,
+    ScreenFlash: 0.04,
+}
+DEFAULT_SHARE = 0.1   # Tabloda olmayan tipler ilk spawn'da bu payla açılır
+MIN_POOL_SIZE = 2
+
+# Tip -> (öncelik, birim başına kare başı tahmini update + çizim maliyeti µs, efekt ömrü boyunca ortalama).
+# Birim: efektin budget_units()'i (parçacık / halka / şimşek noktası). Yüksek öncelik en son kesilir.
+EFFECT_BUDGET = {
+    ScreenFlash: (3, 0.0),        # Ortak flash geçişi canlı flash sayısından bağımsız: bütçeye yük değil
+    Shockwave: (2, 20.0),         # Slam / meteor dalgası: oynanışı okutan geri bildirim
+    LightningBolt: (1, 1.8),
+    ParticleExplosion: (0, 3.5),  # En kalabalık ve en dekoratif: ilk kesilen
+}
+DEFAULT_BUDGET = (1, 5.0)
+
+# Flash'lar VFX katmanına çizilmez: flash() ile tek değere indirgenip birleştirmede bir kez uygulanır
+OVERLAYS = (ScreenFlash,)
+
+
+class EffectPool:
+    """Tek bir efekt tipi için önceden ayrılmış örnekler, free list ve swap-remove"""
+    def __init__(self, cls, capacity):
+        self.cls = cls
+        self.capacity = 0
+        self.live = []        # Canlı efektler (sırasız; swap-remove)
+        self.free = []        # Yeniden kullanılmayı bekleyen ölü örnekler
+        self.serial = 0       # Spawn sırası; taşmada en eski canlı efekti bulmak için
+        self.created = 0      # Havuzun açtığı toplam örnek (tahsis sayısı)
+        self.spawned = 0
+        self.reused = 0
+        self.evicted = 0      # Kapasite dolu olduğu için erken bitirilen efekt
+        self.priority, self.unit_cost = EFFECT_BUDGET.get(cls, DEFAULT_BUDGET)
+        self.cost = 0.0       # Canlı efektlerin toplam tahmini kare maliyeti (µs)
+        self.culled = 0       # Bütçe için bitirilen efekt
+        self.degraded = 0     # Bütçe için inceltilen efekt
+        self.set_capacity(capacity)
+
+    def _blank(self):
+        effect = self.cls.blank()
+        effect.pool_serial = 0
+        effect.budget_cost = 0.0
+        self.created += 1
+        return effect
+
+    def set_capacity(self, capacity):
+        capacity = max(MIN_POOL_SIZE, int(capacity))
+        while len(self.live) > capacity:
+            self._evict()
+        if len(self.free) + len(self.live) > capacity:
+            del self.free[capacity - len(self.live):]
+        while len(self.free) + len(self.live) < capacity:
+            self.free.append(self._blank())
+        self.capacity = capacity
+
+    def _evict(self):
+        """En eski canlı efekti bitirip listeden çıkarır, örneği döner"""
+        live = self.live
+        oldest = min(range(len(live)), key=lambda i: live[i].pool_serial)
+        effect = live[oldest]
+        live[oldest] = live[-1]
+        live.pop()
+        effect.dead = True
+        self.cost -= effect.budget_cost
+        self.evicted += 1
+        return effect
+
+    def spawn(self, *args, **kwargs):
+        """Ölü bir örneği args ile yeniden kurar; havuz doluysa en eski canlı efekti feda eder"""
+        if self.free:
+            effect = self.free.pop()
+            if effect.pool_serial:
+                self.reused += 1
+        else:
+            effect = self._evict()
+            self.reused += 1
+        effect.reset(*args, **kwargs)
+        self.serial += 1
+        effect.pool_serial = self.serial
+        effect.budget_cost = effect.budget_units() * self.unit_cost
+        self.cost += effect.budget_cost
+        self.live.append(effect)
+        self.spawned += 1
+        return effect
+
+    def shrink(self, effect):
+        """Efekti bütçe için inceltir; kazanılan maliyeti döner"""
+        if not effect.degrade():
+            return 0.0
+        cost = effect.budget_units() * self.unit_cost
+        freed = effect.budget_cost - cost
+        effect.budget_cost = cost
+        self.cost -= freed
+        self.degraded += 1
+        return freed
+
+    def cull(self, effect):
+        """Canlı efekti bütçe için bitirip free list'e alır; kazanılan maliyeti döner"""
+        live = self.live
+        i = live.index(effect)
+        live[i] = live[-1]
+        live.pop()
+        effect.dead = True
+        self.free.append(effect)
+        self.cost -= effect.budget_cost
+        self.culled += 1
+        return effect.budget_cost
+
+    def update(self, camera_speed):
+        live = self.live
+        cost = 0.0
+        i = 0
+        while i < len(live):
+            effect = live[i]
+            effect.update(camera_speed)
+            if effect.dead:
+                # swap-remove: sıra korunmaz ama çıkarma O(1)
+                live[i] = live[-1]
+                live.pop()
+                self.free.append(effect)
+            else:
+                cost += effect.budget_cost
+                i += 1
+        self.cost = cost   # Her kare baştan toplanır: artımlı toplamda kayan nokta birikmez
+
+    def draw(self, surface, dirty=None):
+        """Efektleri çizer; dirty listesi verilirse çizilen alanlar eklenir"""
+        if dirty is None:
+            for effect in self.live:
+                effect.draw(surface)
+            return
+        for effect in self.live:
+            rect = effect.draw(surface)
+            if rect:
+                dirty.append(rect)
+
+    def clear(self):
+        for effect in self.live:
+            effect.dead = True
+        self.free.extend(self.live)
+        self.live.clear()
+        self.cost = 0.0
+
+    def __len__(self):
+        return len(self.live)
+
+
+class VfxPools:
+    """Tip başına EffectPool; GameSession'ın eski all_vfx Group'unun yerini alır.
+    budget verilirse (µs) canlı efektlerin tahmini çizim maliyeti her spawn'da bu sınırda tutulur."""
+    def __init__(self, max_vfx, budget=None):
+        self.max_vfx = max_vfx
+        self.budget = budget
+        self.peak_cost = 0.0
+        self.pools = {}
+        self.by_priority = []   # Kesme sırası: düşük öncelikli havuz önce
+        for cls in POOL_SHARES:
+            self._pool(cls)
+
+    def _pool(self, cls):
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.pools[cls] = EffectPool(cls, self.max_vfx * POOL_SHARES.get(cls, DEFAULT_SHARE))
+            self.by_priority.append(pool)
+            self.by_priority.sort(key=lambda p: p.priority)
+        return pool
+
+    @property
+    def cost(self):
+        return sum(pool.cost for pool in self.by_priority)
+
+    def spawn(self, cls, *args, **kwargs):
+        """cls(*args, **kwargs) ile aynı efekti havuzdan kurar ve döner. Bütçe aşılırsa kesinti yapılır;
+        dönen efekt kesilmiş (dead) olabilir ama alanları yine de geçerlidir."""
+        pool = self._pool(cls)
+        effect = pool.spawn(*args, **kwargs)
+        if self.budget is not None and pool.unit_cost:
+            self._enforce(pool.priority)
+        return effect
+
+    def _enforce(self, ceiling):
+        """ceiling önceliğine kadarki tiplerde, düşük öncelik ve en eski önce: inceltir, yetmezse bitirir"""
+        over = self.cost - self.budget
+        if over <= 0:
+            return
+        for pool in self.by_priority:
+            if pool.priority > ceiling:
+                break
+            if not pool.unit_cost or not pool.live:
+                continue
+            victims = sorted(pool.live, key=lambda e: e.pool_serial)
+            for effect in victims:
+                over -= pool.shrink(effect)
+                if over <= 0:
+                    return
+            for effect in victims:
+                over -= pool.cull(effect)
+                if over <= 0:
+                    return
+
+    def set_capacity(self, max_vfx):
+        self.max_vfx = max_vfx
+        for cls, pool in self.pools.items():
+            pool.set_capacity(max_vfx * POOL_SHARES.get(cls, DEFAULT_SHARE))
+
+    def set_budget(self, budget):
+        """Bütçeyi değiştirir; düşürüldüyse fazlası hemen kesilir"""
+        self.budget = budget
+        if budget is not None and self.by_priority:
+            self._enforce(self.by_priority[-1].priority)
+
+    def update(self, camera_speed):
+        for pool in self.pools.values():
+            pool.update(camera_speed)
+        self.peak_cost = max(self.peak_cost, self.cost)
+
+    def draw(self, surface, dirty=None):
+        for cls, pool in self.pools.items():
+            if cls not in OVERLAYS:
+                pool.draw(surface, dirty)
+
+    def flash(self):
+        """Bu karenin canlı flash'larının spawn sırasıyla birleşimi: ((r, g, b), alpha) veya None"""
+        pool = self.pools.get(ScreenFlash)
+        if pool is None or not pool.live:
+            return None
+        return blend_flashes(sorted(pool.live, key=lambda f: f.pool_serial))
+
+    def clear(self):
+        for pool in self.pools.values():
+            pool.clear()
+
+    def __len__(self):
+        return sum(len(pool) for pool in self.pools.values())
+
+    def __iter__(self):
+        for pool in self.pools.values():
+            yield from pool.live
+
+    def stats(self):
+        """Tip adı -> (canlı, kapasite, açılan, spawn, yeniden kullanılan, feda edilen, bütçe için
+        bitirilen, bütçe için inceltilen)"""
+        return {cls.__name__: (len(p), p.capacity, p.created, p.spawned, p.reused, p.evicted, p.culled, p.degraded)
+                for cls, p in self.pools.items()}
+
+    def budget_stats(self):
+        return {
+            'budget': self.budget,
+            'cost': self.cost,
+            'peak_cost': self.peak_cost,
+            'culled': sum(p.culled for p in self.by_priority),
+            'degraded': sum(p.degraded for p in self.by_priority),
+        }
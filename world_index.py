@@ -0,0 +1,129 @@
+from bisect import bisect_left
+
+# --- DÜNYA İNDEKSİ ---
+# Platformlar hep sağdaki spawn sınırına eklenir, hep birlikte sola kayar ve soldan ekrandan çıkar.
+# Bu yüzden ekleme sırası = x sırası ve bu sıra hiç bozulmaz: sıralı tutmak için ekstra iş gerekmez.
+# Düşmanlar da platformlarıyla birlikte eklenir ve kendi platformlarının x aralığından çıkmaz
+# (CursedEnemy.update sınırlara kenetler), dolayısıyla platform sırasıyla sıralı kabul edilebilir.
+#
+# Kayıtlar bir liste + baş indeksi (soldan düşen ölüler için halka benzeri kuyruk) içinde tutulur;
+# aralık sorguları bisect ile O(log n + k). En sağ kenar son platformdan O(1) okunur.
+# Sprite Group'ları sahiplikte kalır (update/draw/kill); burası sadece ikincil bir indekstir.
+# Öldürülen (kill) düşmanlar sorgularda atlanır ve sol uca geldiklerinde temizlenir.
+
+COMPACT_MIN = 64  # Baştaki ölü slot sayısı bunu ve canlıların sayısını geçince liste sıkıştırılır
+
+
+class _SortedRun:
+    """Sadece sona eklenen, sadece baştan silinen, x'e göre sıralı kayıt dizisi"""
+    __slots__ = ('items', 'head')
+
+    def __init__(self):
+        self.items = []
+        self.head = 0
+
+    def __len__(self):
+        return len(self.items) - self.head
+
+    def clear(self):
+        self.items.clear()
+        self.head = 0
+
+    def append(self, item):
+        self.items.append(item)
+
+    def prune(self):
+        """Soldaki ölü kayıtları düşürür"""
+        items, head = self.items, self.head
+        n = len(items)
+        while head < n and not items[head].alive():
+            head += 1
+        if head > COMPACT_MIN and head > n - head:
+            del items[:head]
+            head = 0
+        self.head = head
+
+    def first_reaching(self, x, key):
+        """key(item) >= x olan ilk slot"""
+        return bisect_left(self.items, x, lo=self.head, key=key)
+
+
+def _platform_right(p):
+    return p.rect.right
+
+
+def _enemy_platform_right(e):
+    return e.platform.rect.right
+
+
+class WorldIndex:
+    def __init__(self):
+        self.platforms = _SortedRun()
+        self.enemies = _SortedRun()
+
+    def clear(self):
+        self.platforms.clear()
+        self.enemies.clear()
+
+    def add_platform(self, platform):
+        # Yeni platform her zaman mevcutların sağında başlar
+        self.platforms.append(platform)
+
+    def add_enemy(self, enemy):
+        self.enemies.append(enemy)
+
+    def prune(self):
+        self.platforms.prune()
+        self.enemies.prune()
+
+    # --- SPAWN SINIRI ---
+    @property
+    def last_platform(self):
+        run = self.platforms
+        return run.items[-1] if len(run) else None
+
+    @property
+    def rightmost_edge(self):
+        """En sağdaki platformun sağ kenarı (platform yoksa None)"""
+        last = self.last_platform
+        return last.rect.right if last is not None else None
+
+    # --- ARALIK SORGULARI ---
+    def platforms_in_range(self, x0, x1):
+        """x aralığı [x0, x1] ile kesişen canlı platformlar, soldan sağa"""
+        run = self.platforms
+        items = run.items
+        out = []
+        for i in range(run.first_reaching(x0, _platform_right), len(items)):
+            p = items[i]
+            if p.rect.left > x1:
+                break
+            if p.alive():
+                out.append(p)
+        return out
+
+    def enemies_in_range(self, x0, x1):
+        """Rect'i x aralığı [x0, x1] ile kesişen canlı düşmanlar, ekleme sırasıyla"""
+        run = self.enemies
+        items = run.items
+        out = []
+        for i in range(run.first_reaching(x0, _enemy_platform_right), len(items)):
+            e = items[i]
+            if e.platform.rect.left > x1:
+                break
+            r = e.rect
+            if r.right >= x0 and r.left <= x1 and e.alive():
+                out.append(e)
+        return out
+
+    def platforms_colliding(self, rect):
+        """rect ile çarpışan platformlar (spritecollide ile aynı sonuç)"""
+        return [p for p in self.platforms_in_range(rect.left, rect.right) if rect.colliderect(p.rect)]
+
+    def enemies_colliding(self, rect):
+        """rect ile çarpışan düşmanlar (spritecollide ile aynı sonuç)"""
+        return [e for e in self.enemies_in_range(rect.left, rect.right) if rect.colliderect(e.rect)]
+
+    def enemies_near(self, x, radius):
+        """Merkezi x'e yatayda radius'tan yakın olabilecek düşman adayları (dairesel testi çağıran yapar)"""
+        return self.enemies_in_range(x - radius - 1, x + radius + 1)